@@ -0,0 +1,123 @@
+# Framework benchmarks — run on their own and without xdist, so timings are not skewed:
+# pytest Selenium_Ecommerce/benchmarks --headless --bench-iterations 10
+# pytest Selenium_Ecommerce/benchmarks --headless --bench-save-baseline      (record a new baseline)
+
+import os
+import time
+
+import pytest
+
+from Selenium_Ecommerce.utils.benchmark import BenchmarkRecorder, git_revision
+from Selenium_Ecommerce.utils.config import Config
+from Selenium_Ecommerce.utils.mock_server import MockNopCommerce
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+RESULTS_DIR = os.path.join(os.getcwd(), "Selenium_Ecommerce", "Output", "benchmarks")
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmarks")
+    group.addoption("--bench-iterations", action="store", type=int, default=5,
+                    help="Timed iterations per benchmark")
+    group.addoption("--bench-warmup", action="store", type=int, default=1,
+                    help="Untimed iterations before measuring")
+    group.addoption("--bench-threshold", action="store", type=float, default=0.2,
+                    help="Fail when a benchmark's p50 is this fraction slower than the baseline")
+    group.addoption("--bench-baseline", action="store", default=DEFAULT_BASELINE,
+                    help="Baseline JSON to compare against")
+    group.addoption("--bench-save-baseline", action="store_true",
+                    help="Write this run's results as the new baseline instead of comparing")
+
+
+def pytest_configure(config):
+    # Spare browsers launching in the background would skew the timings
+    config.option.spare_browsers = 0
+    config.bench = BenchmarkRecorder(iterations=config.getoption("--bench-iterations"),
+                                     warmup=config.getoption("--bench-warmup"),
+                                     threshold=config.getoption("--bench-threshold"))
+    config.bench_report = None
+
+
+# ------------------------------------------------------------------
+#  Results, Baseline & Regression Check
+# ------------------------------------------------------------------
+def pytest_sessionfinish(session):
+    config = session.config
+    bench = config.bench
+    if not bench.results:
+        return
+
+    stamp = time.strftime("%Y%m%d_%H%M%S")
+    bench.save(os.path.join(RESULTS_DIR, f"bench-{stamp}-{git_revision()}.json"))
+    bench.save(os.path.join(RESULTS_DIR, "latest.json"))
+
+    baseline_path = config.getoption("--bench-baseline")
+    if config.getoption("--bench-save-baseline"):
+        bench.save(baseline_path)
+        config.bench_report = bench.format_report() + f"\nBaseline saved to {baseline_path}"
+        return
+
+    if not os.path.exists(baseline_path):
+        config.bench_report = bench.format_report() + f"\nNo baseline at {baseline_path} — nothing to compare."
+        return
+
+    baseline = BenchmarkRecorder.load(baseline_path)
+    comparison = bench.compare(baseline)
+    report = bench.format_report(comparison, baseline["meta"])
+    if baseline["meta"].get("target") != bench.target:
+        report += f"\nWarning: baseline was recorded against {baseline['meta'].get('target')}."
+    config.bench_report = report
+
+    if any(row["regressed"] for row in comparison):
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if config.bench_report:
+        terminalreporter.section("Framework benchmarks")
+        terminalreporter.write_line(config.bench_report)
+
+
+# ------------------------------------------------------------------
+#  Fixtures
+# ------------------------------------------------------------------
+@pytest.fixture(scope="session")
+def bench_target(request):
+    """
+    Benchmarks run against a local target: the --mock-server / --site-url
+    instance if one was given, otherwise a mock server started here.
+    """
+    config = request.config
+    server = None
+    if getattr(config, "mock_server", None) is not None:
+        config.bench.target = "mock"
+    elif Config.BASE_URL != Config.DEMO_URL:
+        config.bench.target = Config.BASE_URL
+    else:
+        server = MockNopCommerce().start()
+        Config.set_base_url(server.url)
+        config.bench.target = "mock"
+    yield Config.BASE_URL
+    if server is not None:
+        server.stop()
+
+
+@pytest.fixture(scope="session")
+def bench(request, bench_target):
+    return request.config.bench
+
+
+@pytest.fixture(scope="session")
+def bench_driver(request, driver_pool, bench_target):
+    """One pooled Chrome browser shared by all page-object benchmarks."""
+    driver = driver_pool.acquire("chrome", headless=request.config.getoption("--headless"),
+                                 grid=request.config.getoption("--grid"))
+    yield driver
+    driver_pool.release(driver)
+
+
+@pytest.fixture
+def admin(bench_driver, auth_session):
+    """bench_driver logged in as admin and sitting on the Dashboard."""
+    assert auth_session.login(bench_driver), "Admin login failed!"
+    return bench_driver
@@ -0,0 +1,156 @@
+import itertools
+import time
+
+import pytest
+
+from Selenium_Ecommerce.modules.BaseModule import BaseModule
+from Selenium_Ecommerce.modules.OrdersModule import OrdersModule
+from Selenium_Ecommerce.modules.ProductsModule import ProductsModule
+from Selenium_Ecommerce.pages.AddCustomerPage import AddCustomerPage
+from Selenium_Ecommerce.pages.DashboardPage import DashboardPage
+from Selenium_Ecommerce.pages.LoginPage import LoginPage
+from Selenium_Ecommerce.pages.SearchCustomerPage import SearchCustomerPage
+from Selenium_Ecommerce.utils.config import Config
+from Selenium_Ecommerce.utils.driver_factory import create_driver
+
+
+def check(result, message):
+    """Fail the benchmark if the measured operation did not actually work."""
+    if not result:
+        raise AssertionError(message)
+
+
+# ------------------------------------------------------------------------
+# Driver startup
+# ------------------------------------------------------------------------
+class TestDriverBenchmarks:
+
+    def test_driver_startup(self, bench, request):
+        headless = request.config.getoption("--headless")
+        launched = []
+        bench.measure("driver.startup[chrome]",
+                      lambda: launched.append(create_driver("chrome", headless=headless)),
+                      teardown=lambda: launched.pop().quit())
+
+
+# ------------------------------------------------------------------------
+# LoginPage
+# ------------------------------------------------------------------------
+class TestLoginBenchmarks:
+
+    def test_login_form(self, bench, bench_driver):
+        page = LoginPage(bench_driver)
+
+        def fresh_login_page():
+            bench_driver.get(Config.LOGIN_URL)
+            bench_driver.delete_all_cookies()
+
+        bench.measure("LoginPage.login",
+                      lambda: check(page.login(Config.ADMIN_USERNAME, Config.ADMIN_PASSWORD) == "success",
+                                    "login failed"),
+                      setup=fresh_login_page)
+
+    def test_login_cookie_replay(self, bench, bench_driver, auth_session):
+        def logged_out():
+            bench_driver.get(Config.BASE_URL + "favicon.ico")
+            bench_driver.delete_all_cookies()
+
+        bench.measure("AuthSessionCache.login",
+                      lambda: check(auth_session.login(bench_driver), "session replay failed"),
+                      setup=logged_out)
+
+
+# ------------------------------------------------------------------------
+# Navigation
+# ------------------------------------------------------------------------
+class TestNavigationBenchmarks:
+
+    @pytest.mark.parametrize("via_menu", [False, True], ids=["direct", "menu"])
+    def test_dashboard_go_to_customers(self, bench, admin, via_menu):
+        page = DashboardPage(admin)
+        bench.measure(f"DashboardPage.go_to_customers[{'menu' if via_menu else 'direct'}]",
+                      lambda: page.go_to_customers(via_menu=via_menu),
+                      setup=lambda: page.open_admin_page("dashboard"))
+
+    @pytest.mark.parametrize("via_menu", [False, True], ids=["direct", "menu"])
+    def test_orders_go_to_orders(self, bench, admin, via_menu):
+        page = OrdersModule(admin)
+        bench.measure(f"OrdersModule.go_to_orders[{'menu' if via_menu else 'direct'}]",
+                      lambda: page.go_to_orders(via_menu=via_menu),
+                      setup=lambda: page.open_admin_page("dashboard"))
+
+    @pytest.mark.parametrize("via_menu", [False, True], ids=["direct", "menu"])
+    def test_products_go_to_products(self, bench, admin, via_menu):
+        page = ProductsModule(admin)
+        bench.measure(f"ProductsModule.go_to_products[{'menu' if via_menu else 'direct'}]",
+                      lambda: page.go_to_products(via_menu=via_menu),
+                      setup=lambda: page.open_admin_page("dashboard"))
+
+
+# ------------------------------------------------------------------------
+# Grid searches (each iteration starts from a freshly loaded list page)
+# ------------------------------------------------------------------------
+class TestSearchBenchmarks:
+
+    def test_orders_search_by_email(self, bench, admin):
+        page = OrdersModule(admin)
+        bench.measure("OrdersModule.search_by_email",
+                      lambda: check(page.search_by_email("steve_gates@nopCommerce.com"), "order not found"),
+                      setup=page.go_to_orders)
+
+    def test_orders_verify_order_status(self, bench, admin):
+        page = OrdersModule(admin)
+        bench.measure("OrdersModule.verify_order_status",
+                      lambda: check(page.verify_order_status("1"), "order status not shown"),
+                      setup=page.go_to_orders)
+
+    def test_products_search_by_name(self, bench, admin):
+        page = ProductsModule(admin)
+        bench.measure("ProductsModule.search_product_by_name",
+                      lambda: check(page.search_product_by_name("Build your own computer"), "product not found"),
+                      setup=page.go_to_products)
+
+    def test_customers_search_by_email(self, bench, admin):
+        page = SearchCustomerPage(admin)
+        dashboard = DashboardPage(admin)
+        bench.measure("SearchCustomerPage.search_by_email",
+                      lambda: check(page.search_by_email(Config.ADMIN_USERNAME), "customer not found"),
+                      setup=dashboard.go_to_customers)
+
+    def test_customers_search_by_role(self, bench, admin):
+        page = SearchCustomerPage(admin)
+        dashboard = DashboardPage(admin)
+        bench.measure("SearchCustomerPage.search_by_role",
+                      lambda: check(page.search_by_role("Administrators"), "no administrators found"),
+                      setup=dashboard.go_to_customers)
+
+    def test_add_customer(self, bench, admin):
+        page = AddCustomerPage(admin)
+        dashboard = DashboardPage(admin)
+        counter = itertools.count()
+        run = int(time.time())
+
+        def add():
+            email = f"bench.{run}.{next(counter)}@example.com"
+            check(page.add_customer("Bench", "Mark", email, "Pwd@1234"), "add customer form failed")
+            check(page.get_alert_message() == "success", f"customer {email} was not added")
+
+        bench.measure("AddCustomerPage.add_customer", add, setup=dashboard.go_to_customers)
+
+
+# ------------------------------------------------------------------------
+# BaseModule helpers
+# ------------------------------------------------------------------------
+class TestBaseModuleBenchmarks:
+
+    def test_read_grid(self, bench, admin):
+        page = OrdersModule(admin)
+        page.go_to_orders()
+        page.wait_for_grid("orders-grid")
+        bench.measure("BaseModule.read_grid", lambda: check(page.read_grid("orders-grid"), "orders grid is empty"))
+
+    def test_take_screenshot(self, bench, admin):
+        page = BaseModule(admin)
+        counter = itertools.count()
+        bench.measure("BaseModule.take_screenshot",
+                      lambda: page.take_screenshot("benchmarks", f"bench_{next(counter)}"))
@@ -133,85 +133,459 @@
 #     yield driver, dashboard
 
 
+
+import glob
+import json
+import os
+
+import allure
 import pytest
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.firefox.service import Service as FirefoxService
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
 
 from Selenium_Ecommerce.pages.DashboardPage import DashboardPage
-from Selenium_Ecommerce.pages.LoginPage import LoginPage
+from Selenium_Ecommerce.utils.auth_session import AuthSessionCache
+from Selenium_Ecommerce.utils import data_loader
+from Selenium_Ecommerce.utils.allure_store import AllureStore
+from Selenium_Ecommerce.utils.config import Config
+from Selenium_Ecommerce.utils.data_seeder import DataSeeder
+from Selenium_Ecommerce.utils.driver_pool import DriverPool
+from Selenium_Ecommerce.utils.driver_services import driver_services
+from Selenium_Ecommerce.utils.duration_scheduler import DurationSchedulerPlugin
+from Selenium_Ecommerce.utils.flaky_tracker import FlakyRerunPlugin
+from Selenium_Ecommerce.utils.impact_analysis import ImpactAnalysisPlugin
+from Selenium_Ecommerce.utils.local_grid import LocalGrid, parse_slots
+from Selenium_Ecommerce.utils.mock_server import MockNopCommerce
+from Selenium_Ecommerce.utils.network_monitor import network_usage
+from Selenium_Ecommerce.utils.profiler import profiler
+from Selenium_Ecommerce.utils.resource_monitor import resources
+from Selenium_Ecommerce.utils.run_journal import RunJournalPlugin
+from Selenium_Ecommerce.utils.screenshot_service import ScreenshotService, screenshots
+
+OUTPUT_DIR = os.path.join(os.getcwd(), "Selenium_Ecommerce", "Output")
+# Customers the search tests look for (created by --seed-customers)
+SEED_CUSTOMER_FILES = ["Selenium_Ecommerce/utils/data/customer_data.csv",
+                       "Selenium_Ecommerce/utils/data/customer_data.xlsx",
+                       "Selenium_Ecommerce/utils/data/customer_data.xml"]
 
 
 def pytest_addoption(parser):
     parser.addoption(
-        "--browser", action="store", default="chrome,firefox,edge", help="Browser to use: chrome, edge, firefox"
+        "--browser", action="store", default="chrome",
+        help="Comma-separated browsers every test class runs on: chrome, firefox, edge "
+             "(see utils/browser_matrix.py to run each browser in its own worker group)"
     )
     parser.addoption(
         "--grid", action="store_true", help="Run tests on Selenium Grid"
     )
+    parser.addoption(
+        "--local-grid", action="store_true",
+        help="Start an in-process grid hub with local browser slots and run the tests on it (implies --grid)"
+    )
+    parser.addoption(
+        "--grid-slots", action="store", default=None, metavar="BROWSER=N,...",
+        help="With --local-grid: browsers run at once per browser, e.g. chrome=6,firefox=2 "
+             "(default: Config.LOCAL_GRID_SLOTS)"
+    )
     parser.addoption(
         "--headless", action="store_true", help="Run tests in headless mode"
     )
+    parser.addoption(
+        "--driver-path", action="append", default=[], metavar="BROWSER=PATH",
+        help="Use this driver binary instead of webdriver-manager, e.g. --driver-path chrome=/opt/chromedriver"
+    )
+    parser.addoption(
+        "--offline-drivers", action="store_true",
+        help="Never call webdriver-manager: use pinned, previously resolved or PATH driver binaries"
+    )
+    parser.addoption(
+        "--auth-cookie-file", action="store", default=None,
+        help="Share the admin login cookies between the pytest processes (xdist workers) using this file"
+    )
+    parser.addoption(
+        "--recycle-after", action="store", type=int, default=Config.DRIVER_MAX_USES,
+        help="Relaunch a pooled browser after it has served this many test classes"
+    )
+    parser.addoption(
+        "--spare-browsers", action="store", type=int, default=Config.DRIVER_SPARES,
+        help="Idle browsers each worker keeps pre-launched to replace recycled or crashed ones (0 = off)"
+    )
+    parser.addoption(
+        "--resource-aware", action="store_true",
+        help="Sample browser RSS/CPU, use lean browser profiles, recycle browsers over the memory budget "
+             "and size -n auto / browser launches by free memory (needs psutil)"
+    )
+    parser.addoption(
+        "--browser-memory-budget", action="store", type=int, default=Config.BROWSER_MEMORY_BUDGET_MB,
+        help="With --resource-aware: recycle a browser whose process tree uses more MB than this"
+    )
+    parser.addoption(
+        "--no-profile", action="store_true", help="Disable Selenium interaction timing"
+    )
+    parser.addoption(
+        "--output-dir", action="store", default=None,
+        help="Folder for this run's driver-pool stats, resource timelines, screenshots, profiles and journal "
+             "(default: Selenium_Ecommerce/Output); pytest runs going at the same time need different folders"
+    )
+    parser.addoption(
+        "--profile-dir", action="store", default=None,
+        help="Folder for per-worker profile-<worker>.jsonl files (default: Selenium_Ecommerce/Output/profiling)"
+    )
+    parser.addoption(
+        "--screenshots", action="store", default="all", choices=ScreenshotService.MODES,
+        help="Screenshot mode: all, failures (keep only screenshots of failed tests) or off"
+    )
+    parser.addoption(
+        "--allure-compact", action="store_true",
+        help="After the run, bundle --alluredir results into Output/reports/allure-store "
+             "(deduplicated attachments, old runs pruned)"
+    )
+    parser.addoption(
+        "--site-url", action="store", default=None,
+        help=f"nopCommerce instance to test (default: NOP_BASE_URL or {Config.DEMO_URL})"
+    )
+    parser.addoption(
+        "--mock-server", action="store_true",
+        help="Run against a local mock of the nopCommerce admin started in each pytest process"
+    )
+    parser.addoption(
+        "--mock-latency", action="store", type=float, default=0.0,
+        help="Seconds the mock server adds to every response"
+    )
+    parser.addoption(
+        "--seed-customers", action="store_true",
+        help="Create the customers the search tests expect over HTTP before they run, instead of relying on "
+             "test_custadd having added them through the form"
+    )
+    parser.addoption(
+        "--duration-schedule", action="store_true",
+        help="With -n: keep each test class on one worker and start the longest classes first, "
+             "using durations recorded by earlier runs"
+    )
+    parser.addoption(
+        "--flaky-reruns", action="store", type=int, default=2,
+        help="Rerun a failed test up to this many times, in the same browser, if its history shows it is flaky"
+    )
+    parser.addoption(
+        "--lane", action="store", default="all", choices=FlakyRerunPlugin.LANES,
+        help="main: skip quarantined (known-flaky) tests, quarantine: run only those, all: run everything"
+    )
+    parser.addoption(
+        "--changed-since", action="store", default=None, metavar="GIT_REF",
+        help="Only run tests whose recorded page objects, locators or data files changed since this git ref "
+             "(tests without a recorded dependency map always run)"
+    )
+    parser.addoption(
+        "--journal", action="store", default=None,
+        help="Run journal (JSON lines, one per finished test) for --resume; a run that did not finish is "
+             "never overwritten (default: Selenium_Ecommerce/Output/journal/run-journal.jsonl, one per --lane)"
+    )
+    parser.addoption(
+        "--resume", action="store_true",
+        help="Continue an interrupted run from its journal: skip tests that passed (their Allure results are "
+             "kept), rerun failed and not-yet-run ones. Use the same options as the interrupted run"
+    )
+    parser.addoption(
+        "--cdp-network", action="store_true",
+        help="Local Chrome: track XHR/fetch over CDP so page and grid waits end as soon as requests finish"
+    )
+    parser.addoption(
+        "--block-assets", action="store_true",
+        help="Local Chrome: block analytics, web fonts and images (implies --cdp-network)"
+    )
+    parser.addoption(
+        "--navigation", action="store", default=Config.NAVIGATION, choices=("direct", "menu"),
+        help="Open admin pages by URL (direct) or by clicking through the sidebar (menu)"
+    )
+    parser.addoption(
+        "--data-shard", action="store", default=None,
+        help="Only parametrize rows i of every n from the data files, e.g. --data-shard 2/4"
+    )
+
+
+# ------------------------------------------------------------------
+#  Run Configuration, Profiling & Screenshots
+# ------------------------------------------------------------------
+def pytest_configure(config):
+    # Must happen before test modules are imported: they load data at import time
+    if config.getoption("--data-shard"):
+        data_loader.configure_shard(config.getoption("--data-shard"))
+    if config.getoption("--mock-server"):
+        # One server per process on a free port, so xdist workers never share state
+        config.mock_server = MockNopCommerce(latency=config.getoption("--mock-latency")).start()
+        Config.set_base_url(config.mock_server.url)
+    elif config.getoption("--site-url"):
+        Config.set_base_url(config.getoption("--site-url"))
+    output_dir = config.getoption("--output-dir") or OUTPUT_DIR
+    config.pool_stats_dir = os.path.join(output_dir, "driver-pool")
+    screenshots.configure(mode=config.getoption("--screenshots"), root_dir=os.path.join(output_dir, "screenshots"))
+    Config.LEAN_BROWSERS = config.getoption("--resource-aware")
+    try:
+        resources.configure(enabled=Config.LEAN_BROWSERS, budget_mb=config.getoption("--browser-memory-budget"),
+                            output_dir=os.path.join(output_dir, "resources"))
+    except RuntimeError as e:
+        raise pytest.UsageError(str(e))
+    driver_services.resolver.configure(
+        pinned=dict(value.split("=", 1) for value in config.getoption("--driver-path")),
+        offline=config.getoption("--offline-drivers") or None)
+    if hasattr(config, "cache"):
+        config.pluginmanager.register(DurationSchedulerPlugin(config), "duration-scheduler")
+        config.pluginmanager.register(FlakyRerunPlugin(config), "flaky-rerun")
+        config.pluginmanager.register(ImpactAnalysisPlugin(config), "impact-analysis")
+    config.pluginmanager.register(RunJournalPlugin(config), "run-journal")
+    if config.getoption("--local-grid"):
+        # One hub on the controller; workers get its URL through workerinput
+        if hasattr(config, "workerinput"):
+            Config.GRID_URL = config.workerinput["grid_url"]
+        else:
+            slots = config.getoption("--grid-slots")
+            config.local_grid = LocalGrid(slots=parse_slots(slots) if slots else None).start()
+            Config.GRID_URL = config.local_grid.url
+        config.option.grid = True
+    Config.NAVIGATION = config.getoption("--navigation")
+    Config.BLOCK_ASSETS = config.getoption("--block-assets")
+    Config.NETWORK_TRACKING = config.getoption("--cdp-network") or Config.BLOCK_ASSETS
+    network_usage.configure(blockable_patterns=Config.BLOCKED_URL_PATTERNS)
+    profiler.configure(output_dir=config.getoption("--profile-dir") or os.path.join(output_dir, "profiling"),
+                       enabled=not config.getoption("--no-profile"))
+    # Only the controller (or a non-xdist run) clears the previous run's files
+    if profiler.enabled and not hasattr(config, "workerinput"):
+        profiler.clean()
+    if not hasattr(config, "workerinput"):
+        for path in glob.glob(os.path.join(config.pool_stats_dir, "pool-*.json")):
+            os.remove(path)
+        if resources.enabled:
+            resources.clean()
+
+
+def selected_browsers(config):
+    return [b.strip().lower() for b in config.getoption("--browser").split(",") if b.strip()]
+
+
+def pytest_generate_tests(metafunc):
+    # One browser per test class instance: the class-scoped `setup` browser is shared by its tests
+    if "setup" in metafunc.fixturenames:
+        metafunc.parametrize("setup", selected_browsers(metafunc.config), indirect=True, scope="class")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_sessionstart(session):
+    # tryfirst: before xdist starts the workers, so they get the summary through workerinput
+    config = session.config
+    if not config.getoption("--seed-customers") or hasattr(config, "workerinput"):
+        return
+    if config.getoption("--mock-server") and config.pluginmanager.hasplugin("dsession"):
+        return  # every worker has its own mock server and seeds it itself
+    # Once for the whole run: workers creating the same emails at once race the server's duplicate check
+    config.seed_summary = seed_customers()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    if getattr(node.config, "local_grid", None) is not None:
+        node.workerinput["grid_url"] = node.config.local_grid.url
+    if getattr(node.config, "seed_summary", None) is not None:
+        node.workerinput["seed_summary"] = node.config.seed_summary
+
+
+@pytest.hookimpl(hookwrapper=True, optionalhook=True)
+def pytest_xdist_auto_num_workers(config):
+    outcome = yield
+    if config.getoption("--resource-aware"):
+        outcome.force_result(resources.auto_workers(outcome.get_result(),
+                                                    spares=config.getoption("--spare-browsers")))
+
+
+def pytest_runtest_logstart(nodeid, location):
+    # Set before fixtures run so setup time (login, navigation) is booked on the test
+    profiler.start_test(nodeid)
+    screenshots.start_test()
+    network_usage.start_test()
+    resources.start_test(nodeid)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    report = outcome.get_result()
+
+    if report.failed:
+        item.selenium_failed = True
+        driver = getattr(item.instance, "driver", None)
+        if report.when == "call" and driver is not None and screenshots.mode != "off":
+            folder = item.module.__name__.split(".")[-1]
+            try:
+                screenshots.capture(driver, folder, f"failure_{item.name}", attach_name=f"Failure_{item.name}")
+            except Exception as e:
+                print(f" Could not capture failure screenshot: {e}")
+
+    if report.when == "teardown":
+        screenshots.end_test(failed=getattr(item, "selenium_failed", False))
+
+
+def pytest_runtest_logreport(report):
+    if report.when == "teardown":
+        network_usage.collect(report)
+
 
-@pytest.fixture(params=["chrome"], scope="class")
-def setup(request):
+@pytest.hookimpl(trylast=True)
+def pytest_sessionfinish(session):
+    # trylast: session fixtures are torn down (and their allure containers written) first
+    profiler.close()
+    resources.close()
+    network_usage.save_sizes()
+    screenshots.shutdown()
+    if getattr(session.config, "mock_server", None) is not None:
+        session.config.mock_server.stop()
+    if getattr(session.config, "local_grid", None) is not None:
+        session.config.local_grid_stats = session.config.local_grid.stats()
+        session.config.local_grid.stop()
+    # Controller only: every worker has written its results into the shared folder by now
+    results_dir = getattr(session.config.option, "allure_report_dir", None)
+    if session.config.getoption("--allure-compact") and results_dir and not hasattr(session.config, "workerinput"):
+        store = AllureStore()
+        store.compact(results_dir)
+        store.prune()
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if hasattr(config, "workerinput"):
+        return
+    summary = profiler.summary_for_all_workers() if profiler.enabled else {"events": 0}
+    if summary["events"]:
+        terminalreporter.section("Selenium profile")
+        terminalreporter.write_line(profiler.format_summary(summary))
+    if network_usage.results:
+        terminalreporter.section("Network usage")
+        terminalreporter.write_line(network_usage.format_summary())
+    pool = DriverPool.summary_for_all_workers(config.pool_stats_dir)
+    if pool and (pool["spares"] or pool["memory_recycles"]):
+        rate = "n/a" if pool["spare_hit_rate"] is None else f"{pool['spare_hit_rate']:.0%}"
+        terminalreporter.section("Driver pool")
+        terminalreporter.write_line(
+            f"{pool['workers']} worker(s), {pool['spares']} spare(s) each: {pool['launches']} launches, "
+            f"{pool['reuses']} reuses, {pool['memory_recycles']} over-budget recycles, "
+            f"spare hits {pool['spare_hits']} / misses {pool['spare_misses']} (hit rate {rate})")
+    if resources.enabled:
+        workers = resources.summary_for_all_workers()
+        if workers:
+            terminalreporter.section("Browser resources")
+            terminalreporter.write_line(resources.format_summary(workers))
+    if any(s["sessions"] for s in getattr(config, "local_grid_stats", {}).values()):
+        terminalreporter.section("Local grid")
+        terminalreporter.write_line(LocalGrid.format_summary(config.local_grid_stats))
+
+
+@pytest.fixture(autouse=True)
+def selenium_profile():
+    """Attach the timings recorded during each test to its Allure result."""
+    yield
+    events = profiler.end_test()
+    if events:
+        allure.attach(json.dumps(events, indent=2), name="Selenium timings",
+                      attachment_type=allure.attachment_type.JSON)
+
+
+@pytest.fixture(autouse=True)
+def network_report(request):
+    """Report each test's requests and bytes (and what --block-assets saved) when CDP tracking is on."""
+    yield
+    usage = network_usage.end_test()
+    if usage:
+        print(f" Network: {network_usage.describe(usage)}")
+        request.node.user_properties.append(("network", usage))
+        allure.attach(json.dumps(usage, indent=2), name="Network usage",
+                      attachment_type=allure.attachment_type.JSON)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def selenium_profile_summary():
+    """Attach this worker's end-of-session profile summary to Allure."""
+    yield
+    if profiler.enabled:
+        allure.attach(profiler.format_summary(profiler.summary()), name="Selenium profile summary",
+                      attachment_type=allure.attachment_type.TEXT)
+
+
+@pytest.fixture(scope="session")
+def driver_pool(request):
+    """
+    Session-wide browser pool (one per xdist worker).
+    Browsers are launched once and reused by every test class; spare
+    browsers (--spare-browsers) are pre-launched in the background.
+    """
+    config = request.config
+    pool = DriverPool(max_uses=config.getoption("--recycle-after"), spares=config.getoption("--spare-browsers"),
+                      keep_grid_sessions=not config.getoption("--local-grid"))
+    for browser in selected_browsers(config):
+        if not config.getoption("--grid"):
+            # Resolve the driver and spawn it while collection output / login data loads
+            driver_services.prestart(browser)
+        pool.prewarm(browser, headless=config.getoption("--headless"), grid=config.getoption("--grid"))
+    yield pool
+    pool.close_all()
+    pool.save_stats(request.config.pool_stats_dir)
+    driver_services.close_all()
+
+
+@pytest.fixture(scope="class")
+def setup(request, driver_pool):
     """
-    Fixture to initialize local Chrome or Firefox driver.
-    Detects GitHub Actions for headless mode.
+    Fixture to check out a Chrome, Firefox or Edge driver (--browser) from the session pool.
+    The browser arrives with cookies/storage cleared on a blank page.
     """
     browser = request.param
     #headless = os.getenv("GITHUB_ACTIONS") == "true"
     headless=request.config.getoption("--headless")
+    use_grid = request.config.getoption("--grid")
 
-    driver = None
-
-    if browser.lower() == "chrome":
-        options = webdriver.ChromeOptions()
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--disable-gpu")
-        options.add_argument("--window-size=1920,1080")
-        options.add_argument("--disable-extensions")
-        options.add_argument("--disable-infobars")
-        options.add_argument("--ignore-certificate-errors")
-        options.add_argument("--disable-blink-features=AutomationControlled")
-        options.add_argument("--start-maximized")
-        if headless:
-            options.add_argument("--headless=new")
-
-        driver = webdriver.Chrome(service=ChromeService(ChromeDriverManager().install()), options=options)
-
-    elif browser.lower() == "firefox":
-        options = webdriver.FirefoxOptions()
-        if headless:
-            options.add_argument("--headless")
-            options.add_argument("--start-maximized")
-
-
-        driver = webdriver.Firefox(service=FirefoxService(GeckoDriverManager().install()), options=options)
-        timeout=300
-    else:
-        raise ValueError(f"Unsupported browser: {browser}")
-
-    driver.set_page_load_timeout(60)
-    driver.implicitly_wait(10)
-    driver.maximize_window()
+    driver = driver_pool.acquire(browser, headless=headless, grid=use_grid)
     request.cls.driver = driver
     yield driver
-    driver.quit()
+    driver_pool.release(driver)
+
+@pytest.fixture(scope="session")
+def auth_session(request):
+    """
+    Admin login shared by the whole worker: the form is used once and the
+    auth cookies are replayed for every later test.
+    """
+    return AuthSessionCache(cookie_file=request.config.getoption("--auth-cookie-file"))
+
+
+def seed_customers():
+    """Create the customers of the search data files over HTTP (existing ones are left as they are)."""
+    customers = {c["email"]: c for path in SEED_CUSTOMER_FILES for c in data_loader.load_test_data(path)}
+    seeder = DataSeeder()
+    try:
+        return seeder.seed_customers(customers.values())
+    finally:
+        seeder.close()
+
+
+@pytest.fixture(scope="session")
+def seeded_customers(request):
+    """
+    With --seed-customers: the seeding summary. The controller seeds once before
+    the workers start (pytest_sessionstart); only workers that each run their
+    own --mock-server seed for themselves.
+    """
+    config = request.config
+    if not config.getoption("--seed-customers"):
+        return None
+    summary = getattr(config, "seed_summary", None)
+    if summary is None:
+        summary = getattr(config, "workerinput", {}).get("seed_summary")
+    if summary is None:
+        summary = config.seed_summary = seed_customers()
+    assert not summary["failed"], f"Could not seed customers: {summary['failed']}"
+    return summary
+
 
 @pytest.fixture
-def login_fixture(setup):
+def login_fixture(setup, auth_session):
     """Reusable fixture for admin login"""
     driver = setup
-    login_page = LoginPage(driver)
-    driver.get("https://admin-demo.nopcommerce.com/login?ReturnUrl=%2Fadmin%2F")
-
-
-    login_page.login("admin@yourstore.com", "admin")
+    assert auth_session.login(driver), "Admin login failed!"
 
     dashboard = DashboardPage(driver)
     assert "Dashboard" in dashboard.get_title()
-    yield driver, dashboard
\ No newline at end of file
+    yield driver, dashboard
@@ -1,13 +1,19 @@
 
-import os
-import shutil
 import time
 
 import allure
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
-from selenium.webdriver.common.by import By
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from Selenium_Ecommerce.utils import locators
+from Selenium_Ecommerce.utils.config import Config
+from Selenium_Ecommerce.utils.element_cache import ElementCache
+from Selenium_Ecommerce.utils.impact_analysis import recorder as impact
+from Selenium_Ecommerce.utils.locators import Locator
+from Selenium_Ecommerce.utils.network_monitor import NetworkMonitor
+from Selenium_Ecommerce.utils.profiler import profiler
+from Selenium_Ecommerce.utils.screenshot_service import screenshots
 
 class BaseModule:
     """
@@ -17,13 +23,81 @@ class BaseModule:
 
     Comments: Keep waits centralized so changes here affect all pages.
     """
-    _cleaned_folders = set()
+    # Snapshot of every readiness signal, read in a single round trip.
+    # arguments[0] is an optional DataTables grid id (e.g. "orders-grid").
+    READY_STATE_JS = """
+        var gridId = arguments[0];
+        var visible = function (el) { return !!el && window.getComputedStyle(el).display !== 'none'; };
+        var state = {
+            readyState: document.readyState,
+            ajax: window.jQuery ? window.jQuery.active : 0,
+            busy: visible(document.getElementById('ajaxBusy')),
+            animating: window.jQuery ? window.jQuery(':animated').length > 0 : false,
+            processing: false,
+            grid: null,
+            draws: null
+        };
+        if (gridId) {
+            state.processing = visible(document.getElementById(gridId + '_processing'));
+            var body = document.querySelector('#' + gridId + ' tbody');
+            state.grid = body ? body.rows.length + ':' + body.textContent.length : null;
+            // Count the grid's redraws from the first look on: DataTables' draw.dt event, or a plain
+            // 'draw' DOM event (the mock server's grids)
+            var table = document.getElementById(gridId);
+            if (table && table.seleniumDraws === undefined) {
+                table.seleniumDraws = 0;
+                var drawn = function () { table.seleniumDraws++; };
+                table.addEventListener('draw', drawn);
+                if (window.jQuery) { window.jQuery(table).on('draw.dt', drawn); }
+            }
+            state.draws = table ? table.seleniumDraws : null;
+        }
+        return state;
+    """
 
+    # Whole DataTables grid as rows of visible cell text, in one round trip.
+    # arguments: grid id, optional column list (indexes or header texts),
+    # optional case-insensitive text every returned row must contain.
+    READ_GRID_JS = """
+        var table = document.getElementById(arguments[0]);
+        var columns = arguments[1];
+        var needle = arguments[2] ? arguments[2].toLowerCase() : null;
+        if (!table || !table.tBodies.length) { return null; }
+
+        var headers = Array.prototype.map.call(table.querySelectorAll('thead th'), function (th, i) {
+            return th.innerText.trim() || ('col' + i);
+        });
+        var picked = columns ? columns.map(function (c) {
+            return typeof c === 'number' ? c : headers.indexOf(c);
+        }) : headers.map(function (h, i) { return i; });
+
+        var rows = [];
+        Array.prototype.forEach.call(table.tBodies[0].rows, function (tr) {
+            if (tr.querySelector('td.dataTables_empty')) { return; }
+            var cells = Array.prototype.map.call(tr.cells, function (td) { return td.innerText.trim(); });
+            if (needle && cells.join(' ').toLowerCase().indexOf(needle) === -1) { return; }
+            var row = {};
+            picked.forEach(function (i) {
+                row[i >= 0 && i < headers.length ? headers[i] : 'col' + i] = i >= 0 && i < cells.length ? cells[i] : null;
+            });
+            rows.push(row);
+        });
+        return rows;
+    """
 
+    # The list request each grid reloads from (with --cdp-network a grid counts as reloaded
+    # once its own request has finished, not just any XHR)
+    GRID_LIST_URLS = {
+        "customers-grid": "/Admin/Customer/CustomerList",
+        "orders-grid": "/Admin/Order/OrderList",
+        "products-grid": "/Admin/Product/ProductList",
+    }
 
     def __init__(self, driver):
         self.driver = driver
         self.wait = WebDriverWait(driver, 10)
+        self.last_ready_wait = 0.0
+        impact.touch_class(type(self))
 
     def login(self, username, password):
         self.navigate_to_login()
@@ -32,37 +106,93 @@ class BaseModule:
         self.click_login()
 
     def navigate_to_login(self):
-        self.driver.get("https://admin-demo.nopcommerce.com/")
-        time.sleep(1)
+        self.driver.get(Config.BASE_URL)
+        self.wait_for_page_ready()
 
     def enter_username(self, username):
-        field = self.driver.find_element(By.ID, "Email")
+        field = self.find(locators.LOGIN_EMAIL)
         field.clear()
         field.send_keys(username)
 
     def enter_password(self, password):
-        field = self.driver.find_element(By.ID, "Password")
+        field = self.find(locators.LOGIN_PASSWORD)
         field.clear()
         field.send_keys(password)
 
     def click_login(self):
-        self.driver.find_element(By.XPATH, "//button[normalize-space()='Log in']").click()
-        time.sleep(2)
+        self.find(locators.LOGIN_BUTTON).click()
+        self.wait_for_page_ready()
+
+    # -------------------------------------------------------------------
+    # Element Lookup
+    # -------------------------------------------------------------------
+    def find(self, locator, timeout=None):
+        """
+        Element for a registry Locator (utils/locators.py), cached per page
+        generation and re-resolved automatically when it goes stale.
+        """
+        impact.touch_locator(locator)
+        return ElementCache.for_driver(self.driver).find(locator, timeout)
+
+    def _target(self, by, locator):
+        """The registry Locator for (by, locator), or the plain tuple for ad-hoc selectors."""
+        target = locators.registry.lookup(by, locator) or (by, locator)
+        impact.touch_locator(target)
+        return target
+
+    def _element_or_locator(self, target):
+        """What to hand to an expected condition: the cached element when registered."""
+        return self.find(target) if isinstance(target, Locator) else target
+
+    def locate(self, by, locator):
+        """find_element() that goes through the element cache for registered locators."""
+        target = self._target(by, locator)
+        return self.find(target) if isinstance(target, Locator) else self.driver.find_element(*target)
+
+    def _wait_for(self, event, condition, timeout=10):
+        """WebDriverWait.until() that books the time spent waiting on the profiler event."""
+        start = time.perf_counter()
+        try:
+            return WebDriverWait(self.driver, timeout).until(condition)
+        finally:
+            event["wait"] += time.perf_counter() - start
+
+    def _lookup(self, event, target, condition, element_condition=None):
+        """
+        Wait for a locator's element. Registered locators come from the element
+        cache, so only element_condition (e.g. visibility) is polled, not a new search.
+        """
+        if not isinstance(target, Locator):
+            return self._wait_for(event, condition(target))
+        element = self.find(target)
+        if element_condition is None:
+            return element
+        return self._wait_for(event, element_condition(element))
 
     def click_element(self, by, locator):
         """Wait for an element to be clickable, then click."""
-        WebDriverWait(self.driver, 10).until(EC.element_to_be_clickable((by, locator))).click()
+        target = self._target(by, locator)
+        with profiler.record("click_element", target) as event:
+            self._wait_for(event, EC.element_to_be_clickable(self._element_or_locator(target))).click()
 
     def enter_text(self, by, locator, text):
         """Clear and enter text into an input field."""
-        element = WebDriverWait(self.driver, 10).until(EC.presence_of_element_located((by, locator)))
-        element.clear()
-        element.send_keys(text)
+        target = self._target(by, locator)
+        with profiler.record("enter_text", target) as event:
+            element = self._lookup(event, target, EC.presence_of_element_located)
+            element.clear()
+            element.send_keys(text)
 
     def get_title(self):
         return self.driver.title
 
+    def find_all(self, locator):
+        """find_elements() for a locator, without waiting: an empty list when it matches nothing."""
+        impact.touch_locator(locator)
+        return self.driver.find_elements(*locator)
+
     def is_element_present(self, locator):
+        impact.touch_locator(locator)
         try:
             self.wait.until(EC.presence_of_element_located(locator))
             return True
@@ -70,6 +200,7 @@ class BaseModule:
             return False
 
     def wait_not_present(self, locator, timeout=10):
+        impact.touch_locator(locator)
         try:
             WebDriverWait(self.driver, timeout).until_not(EC.presence_of_element_located(locator))
             return True
@@ -77,57 +208,54 @@ class BaseModule:
             return False
 
     def wait_for_element_visible(self, locator, timeout=10):
+        impact.touch_locator(locator)
         return WebDriverWait(self.driver, timeout).until(
             EC.visibility_of_element_located(locator)
         )
 
+    def wait_for_element_invisible(self, locator, timeout=10):
+        """Wait until the locator's element is hidden or gone (e.g. the ajaxBusy overlay)."""
+        impact.touch_locator(locator)
+        return WebDriverWait(self.driver, timeout).until(
+            EC.invisibility_of_element_located(locator)
+        )
+
     def safe_click(self, locator):
-        try:
-            element = self.wait.until(EC.element_to_be_clickable(locator))
-            element.click()
-        except Exception:
-            element = self.driver.find_element(*locator)
-            self.driver.execute_script("arguments[0].click();", element)
+        target = self._target(*locator)
+        with profiler.record("safe_click", target) as event:
+            try:
+                element = self._wait_for(event, EC.element_to_be_clickable(self._element_or_locator(target)))
+                element.click()
+            except Exception:
+                event["retries"] += 1
+                event["js_fallback"] = True
+                element = self.locate(*target)
+                self.driver.execute_script("arguments[0].click();", element)
 
 
 
-    def take_screenshot(self, folder_name="general", name_prefix="screenshot"):
+    def take_screenshot(self, folder_name="general", name_prefix="screenshot", attach_name=None):
         """
          Takes a screenshot and saves it in:
-            Selenium_Ecommerce/screenshots/<folder_name>/
+            Selenium_Ecommerce/Output/screenshots/<folder_name>/
 
-         Cleans the folder ONCE per test run (per test file),
-        so old screenshots are deleted only at the first capture of the test.
+         The first capture of a run moves the folder's old screenshots aside
+        and deletes them in the background, so capturing never waits for it.
+         The file is written in the background (failed writes are reported at
+        the end of the test); pass attach_name to attach the image to Allure
+        straight from memory instead of re-reading the file.
         """
-
-        screenshot_dir = os.path.join(os.getcwd(), "Selenium_Ecommerce", "Output", "screenshots", folder_name)
-
-        # Clean only once per folder per test run
-        if folder_name not in self._cleaned_folders:
-            if os.path.exists(screenshot_dir):
-                print(f" Cleaning old screenshots in: {screenshot_dir}")
-                shutil.rmtree(screenshot_dir)  # Delete entire folder
-            os.makedirs(screenshot_dir, exist_ok=True)
-            self._cleaned_folders.add(folder_name)
-
-        # Generate new screenshot file
-        timestamp = time.strftime("%Y%m%d_%H%M%S")
-        file_path = os.path.join(screenshot_dir, f"{name_prefix}_{timestamp}.png")
-
-        # Save screenshot
-        self.driver.save_screenshot(file_path)
-        print(f" Screenshot saved: {file_path}")
-
-        return file_path
+        with profiler.record("take_screenshot", name_prefix):
+            return screenshots.capture(self.driver, folder_name, name_prefix, attach_name)
 
     @allure.step("Scrolling to element")
     def scroll_to_element(self, by, locator):
         """Scrolls to the element before interacting (works across browsers)."""
         try:
-            element = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((by, locator))
-            )
-            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
+            target = self._target(by, locator)
+            with profiler.record("scroll_to_element", target) as event:
+                element = self._lookup(event, target, EC.presence_of_element_located)
+                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
             print(f"  Scrolled to element: {locator}")
             return element
         except TimeoutException:
@@ -141,11 +269,11 @@ class BaseModule:
         Works reliably across Chrome, Edge, and Firefox.
         """
         try:
-            element = WebDriverWait(self.driver, 10).until(
-                EC.visibility_of_element_located((by, locator))
-            )
-            element.clear()
-            element.send_keys(text)
+            target = self._target(by, locator)
+            with profiler.record("clear_and_type", target) as event:
+                element = self._lookup(event, target, EC.visibility_of_element_located, EC.visibility_of)
+                element.clear()
+                element.send_keys(text)
             print(f" Entered text '{text}' into element: {locator}")
         except TimeoutException:
             print(f" Timeout: Unable to locate element {locator} for typing.")
@@ -156,7 +284,8 @@ class BaseModule:
 
     def get_error_message(self):
         try:
-            return self.driver.find_element(By.CSS_SELECTOR, ".message-error").text
+            errors = self.find_all(locators.LOGIN_ERROR_ANY)
+            return errors[0].text if errors else None
         except:
             return None
 
@@ -168,8 +297,8 @@ class BaseModule:
 
     def logout(self):
         try:
-            self.driver.find_element(By.XPATH, "//a[normalize-space()='Logout']").click()
-            time.sleep(1)
+            self.find(locators.LOGOUT_LINK).click()
+            self.wait_for_page_ready()
             return True
         except:
             return False
@@ -177,12 +306,129 @@ class BaseModule:
     def scroll_into_view(self, element):
         """Scroll the page so that the given element is visible."""
         try:
-            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
+            # behavior 'instant' so the element is in place as soon as the call returns
+            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center', behavior: 'instant'});", element)
             print(f" Scrolled to element: {element}")
-            time.sleep(0.5)  # small pause to ensure stability
         except Exception as e:
             print(f" Could not scroll to element: {e}")
 
+    # -------------------------------------------------------------------
+    # Navigation
+    # -------------------------------------------------------------------
+    def open_admin_page(self, page, timeout=15):
+        """
+        Open an admin page from Config.ADMIN_ROUTES with a single driver.get()
+        instead of clicking through the sidebar. Raises AssertionError when the
+        browser lands somewhere else (e.g. redirected to the login page).
+        """
+        path, title = Config.ADMIN_ROUTES[page]
+        self.driver.get(Config.BASE_URL + path)
+        try:
+            WebDriverWait(self.driver, timeout).until(EC.title_contains(title))
+        except TimeoutException:
+            raise AssertionError(f"'{page}' page did not open — landed on {self.driver.current_url}")
+        self.wait_for_page_ready()
+        print(f" Opened {page} page directly: /{path}")
+
+    @staticmethod
+    def use_menu(via_menu=None):
+        """Whether go_to_* methods click through the sidebar (explicit argument wins over Config.NAVIGATION)."""
+        return Config.NAVIGATION == "menu" if via_menu is None else via_menu
+
+    # -------------------------------------------------------------------
+    # Readiness Engine
+    # -------------------------------------------------------------------
+    def page_state(self, grid_id=None):
+        """Return document / jQuery / ajaxBusy / DataTables state in one call."""
+        return self.driver.execute_script(self.READY_STATE_JS, grid_id)
+
+    def grid_signature(self, grid_id):
+        """The grid's draw count; take it before a search so wait_for_grid can wait for the next redraw."""
+        try:
+            return self.page_state(grid_id)["draws"]
+        except WebDriverException:
+            return None
 
+    def wait_until_ready(self, grid_id=None, previous_grid=None, timeout=10, stable_polls=2,
+                         poll_frequency=0.1, label="Page"):
+        """
+        Wait until the page is idle instead of sleeping a fixed time:
+          - document.readyState is 'complete'
+          - no jQuery AJAX request or animation is running
+          - the nopCommerce #ajaxBusy overlay is hidden
+          - for a grid: DataTables is not processing, it has been redrawn since
+            previous_grid (its grid_signature) was taken and the row count is stable.
+        With CDP network tracking (--cdp-network) no XHR/fetch may be in flight,
+        and a grid is ready as soon as its list request has finished and it is drawn.
+        Returns the seconds actually waited. Never raises on timeout.
+        """
+        start = time.monotonic()
+        history = []
+        network = NetworkMonitor.for_driver(self.driver)
+        list_url = self.GRID_LIST_URLS.get(grid_id)
+        if network is not None:
+            settled = network.completed_for(list_url)
+            poll_frequency = min(poll_frequency, 0.05)
+
+        def is_ready(driver):
+            if network is not None and network.busy():
+                history.clear()
+                return False
+            try:
+                state = self.page_state(grid_id)
+            except WebDriverException:
+                return False  # page is navigating
+            if state["readyState"] != "complete" or state["ajax"] or state["busy"] or state["animating"]:
+                history.clear()
+                return False
+            if not grid_id:
+                return True
+            if state["processing"]:
+                history.clear()
+                return False
+            if previous_grid is not None and state["draws"] == previous_grid:
+                return False  # not redrawn since the search started
+            if network is not None and list_url and network.completed_for(list_url) > settled:
+                return True  # the grid's list request is done and drawn
+            history.append(state["grid"])
+            return len(history) >= stable_polls and len(set(history[-stable_polls:])) == 1
+
+        with profiler.record("wait_until_ready", label) as event:
+            try:
+                WebDriverWait(self.driver, timeout, poll_frequency=poll_frequency).until(is_ready)
+            except TimeoutException:
+                print(f" {label} not ready after {timeout}s — continuing anyway.")
+            event["wait"] = time.monotonic() - start
+
+        waited = time.monotonic() - start
+        self.last_ready_wait = waited
+        print(f" {label} ready after {waited:.2f}s")
+        return waited
+
+    def wait_for_page_ready(self, timeout=10):
+        return self.wait_until_ready(timeout=timeout, label="Page")
+
+    def wait_for_grid(self, grid_id, previous_grid=None, timeout=10):
+        return self.wait_until_ready(grid_id=grid_id, previous_grid=previous_grid,
+                                     timeout=timeout, label=f"Grid '{grid_id}'")
+
+    # -------------------------------------------------------------------
+    # Grid Reading
+    # -------------------------------------------------------------------
+    def read_grid(self, grid_id, columns=None, contains=None):
+        """
+        Read a grid (orders-grid, products-grid, customers-grid, ...) in a single
+        execute_script call instead of one row.text round trip per <tr>.
 
+        columns  - optional list of column indexes or header texts to return
+        contains - optional text (case-insensitive) a row must contain; filtered in the browser
+        Returns a list of {header: cell text} dicts (the "No data" row is skipped),
+        or an empty list when the grid is not on the page.
+        """
+        with profiler.record("read_grid", grid_id):
+            rows = self.driver.execute_script(self.READ_GRID_JS, grid_id, columns, contains)
+        return rows or []
 
+    def grid_contains(self, grid_id, text):
+        """True if any row of the grid contains the text (case-insensitive)."""
+        return len(self.read_grid(grid_id, columns=[], contains=text)) > 0
@@ -1,40 +1,48 @@
-import time
 import allure
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from Selenium_Ecommerce.modules.BaseModule import BaseModule
+from Selenium_Ecommerce.utils import locators
 
 
 class OrdersModule(BaseModule):
     # -------------------- Locators --------------------
-    order_id_input = (By.ID, "GoDirectlyToCustomOrderNumber")
-    go_button = (By.XPATH, "//button[contains(.,'Go')]")
-    order_status_div = (By.CSS_SELECTOR, "div.input-group-text.align-items-start > div.font-weight-bold")
+    order_id_input = locators.ORDERS_GO_TO_NUMBER
+    go_button = locators.ORDERS_GO_BUTTON
+    order_status_div = locators.ORDER_STATUS_BOX
+    order_status = locators.ORDER_STATUS
 
 
-    sales_menu = (By.XPATH, "//p[normalize-space()='Sales']")
-    orders_submenu = (By.XPATH, "//p[normalize-space()='Orders']")
+    sales_menu = locators.SALES_MENU
+    orders_submenu = locators.ORDERS_SUBMENU
 
 
-    billing_email_input = (By.ID, "BillingEmail")
-    billing_lastname_input = (By.ID, "BillingLastName")
-    search_button = (By.ID, "search-orders")
+    billing_email_input = locators.ORDERS_BILLING_EMAIL
+    billing_lastname_input = locators.ORDERS_BILLING_LAST_NAME
+    search_button = locators.ORDERS_SEARCH_BUTTON
 
 
-    status_cell = (By.XPATH, "//table[@id='orders-grid']//tbody/tr[1]/td[3]")
+    status_cell = locators.ORDERS_STATUS_CELL
 
     # Locator for orders table result
-    order_row = (By.XPATH, "//table//tr[td]")
+    order_row = locators.ORDERS_ROWS
 
     @allure.step("Navigating to Orders Page")
-    def go_to_orders(self):
-        """Navigate from Dashboard → Sales → Orders (Firefox-safe)."""
+    def go_to_orders(self, via_menu=None):
+        """
+        Open the Orders list by URL, or navigate Dashboard → Sales → Orders
+        (Firefox-safe) when via_menu is set or Config.NAVIGATION is 'menu'.
+        """
+        if not self.use_menu(via_menu):
+            self.open_admin_page("orders")
+            self.take_screenshot("test_orders", "orders_page_loaded")
+            return
+
         print(" Navigating to Orders section...")
 
         try:
-            sales_menu = (By.XPATH, "//p[normalize-space()='Sales']")
-            orders_menu = (By.XPATH, "//p[normalize-space()='Orders']")
+            sales_menu = self.sales_menu
+            orders_menu = self.orders_submenu
 
             # Step 1: Scroll and click 'Sales'
             self.scroll_to_element(*sales_menu)
@@ -42,14 +50,15 @@ class OrdersModule(BaseModule):
 
             try:
                 WebDriverWait(self.driver, 10).until(
-                    EC.element_to_be_clickable(sales_menu)
+                    EC.element_to_be_clickable(self.find(sales_menu))
                 ).click()
             except Exception:
                 print(" Normal click failed — using JS click for Sales menu")
-                element = self.driver.find_element(*sales_menu)
+                element = self.find(sales_menu)
                 self.driver.execute_script("arguments[0].click();", element)
 
-            time.sleep(1)
+            # Wait for the Sales treeview to finish expanding
+            self.wait_for_page_ready()
 
             # Step 2: Scroll and click 'Orders'
             self.scroll_to_element(*orders_menu)
@@ -57,11 +66,11 @@ class OrdersModule(BaseModule):
 
             try:
                 WebDriverWait(self.driver, 10).until(
-                    EC.element_to_be_clickable(orders_menu)
+                    EC.element_to_be_clickable(self.find(orders_menu))
                 ).click()
             except Exception:
                 print(" Normal click failed — using JS click for Orders submenu")
-                element = self.driver.find_element(*orders_menu)
+                element = self.find(orders_menu)
                 self.driver.execute_script("arguments[0].click();", element)
 
             # Step 3: Wait until Orders page loads
@@ -78,12 +87,10 @@ class OrdersModule(BaseModule):
         print(f" Verifying status for Order ID: {order_id}")
         try:
             # Step 1: Type order ID
-            self.clear_and_type(By.ID, "GoDirectlyToCustomOrderNumber", order_id)
+            self.clear_and_type(*self.order_id_input, order_id)
 
             # Step 2: Locate the 'Go' button
-            go_button = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.XPATH, "//button[normalize-space()='Go']"))
-            )
+            go_button = self.find(self.go_button)
 
             # Step 3: Try normal click first
             try:
@@ -95,9 +102,7 @@ class OrdersModule(BaseModule):
                 print("Clicked 'Go' button via JavaScript (Firefox fallback)")
 
             # Step 4: Wait for status box to appear (Processing / Pending / Complete)
-            status_locator = (By.XPATH, "//div[@class='font-weight-bold']")
-            WebDriverWait(self.driver, 15).until(EC.visibility_of_element_located(status_locator))
-            status = self.driver.find_element(*status_locator).text.strip()
+            status = self.wait_for_element_visible(self.order_status, timeout=15).text.strip()
 
             print(f" Order ID {order_id} status: {status}")
             self.take_screenshot("test_orders", f"order_status_{order_id}_{status.lower()}")
@@ -114,18 +119,15 @@ class OrdersModule(BaseModule):
         print(f" Searching orders by email: {email}")
         try:
             self.clear_and_type(*self.billing_email_input, email)
+            previous_grid = self.grid_signature("orders-grid")
             self.click_element(*self.search_button)
-            time.sleep(2)
-
-            # Wait for table rows to load
-            rows = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_all_elements_located(self.order_row)
-            )
-            for row in rows:
-                if email.lower() in row.text.lower():
-                    print(f" Found order with email: {email}")
-                    self.take_screenshot("test_orders", f"search_email_success_{email.replace('@', '_')}")
-                    return True
+            self.wait_for_grid("orders-grid", previous_grid)
+
+            # Match rows in the browser: one round trip for the whole grid
+            if self.grid_contains("orders-grid", email):
+                print(f" Found order with email: {email}")
+                self.take_screenshot("test_orders", f"search_email_success_{email.replace('@', '_')}")
+                return True
             print(f" No matching order found for email: {email}")
             return False
 
@@ -138,18 +140,15 @@ class OrdersModule(BaseModule):
         print(f" Searching orders by last name: {last_name}")
         try:
             self.clear_and_type(*self.billing_lastname_input, last_name)
+            previous_grid = self.grid_signature("orders-grid")
             self.click_element(*self.search_button)
-            time.sleep(2)
-
-            # Wait for table rows to load
-            rows = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_all_elements_located(self.order_row)
-            )
-            for row in rows:
-                if last_name.lower() in row.text.lower():
-                    print(f" Found order with last name: {last_name}")
-                    self.take_screenshot("test_orders", f"search_lastname_success_{last_name}")
-                    return True
+            self.wait_for_grid("orders-grid", previous_grid)
+
+            # Match rows in the browser: one round trip for the whole grid
+            if self.grid_contains("orders-grid", last_name):
+                print(f" Found order with last name: {last_name}")
+                self.take_screenshot("test_orders", f"search_lastname_success_{last_name}")
+                return True
             print(f" No matching order found for last name: {last_name}")
             return False
 
@@ -1,23 +1,30 @@
-import time
 import allure
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, ElementClickInterceptedException, ElementNotInteractableException
 from Selenium_Ecommerce.modules.BaseModule import BaseModule
+from Selenium_Ecommerce.utils import locators
 
 
 class ProductsModule(BaseModule):
     # ---------------- Locators ----------------
-    CATALOG_MENU = (By.XPATH, "//p[normalize-space()='Catalog']")
-    PRODUCTS_SUBMENU = (By.XPATH, "//p[normalize-space()='Products']")
-    SEARCH_INPUT = (By.ID, "SearchProductName")
-    SEARCH_BUTTON = (By.ID, "search-products")
-    PRODUCT_ROW = (By.XPATH, "//table[@id='products-grid']//tbody/tr")
+    CATALOG_MENU = locators.CATALOG_MENU
+    PRODUCTS_SUBMENU = locators.PRODUCTS_SUBMENU
+    SEARCH_INPUT = locators.PRODUCTS_SEARCH_NAME
+    SEARCH_BUTTON = locators.PRODUCTS_SEARCH_BUTTON
+    PRODUCT_ROW = locators.PRODUCTS_ROWS
 
     @allure.step("Navigating to Products Page")
-    def go_to_products(self):
-        """Navigate from Dashboard → Catalog → Products (cross-browser safe)."""
+    def go_to_products(self, via_menu=None):
+        """
+        Open the Products list by URL, or navigate Dashboard → Catalog → Products
+        (cross-browser safe) when via_menu is set or Config.NAVIGATION is 'menu'.
+        """
+        if not self.use_menu(via_menu):
+            self.open_admin_page("products")
+            self.take_screenshot("test_products", "products_page_loaded")
+            return
+
         print(" Navigating to Products section...")
 
         try:
@@ -28,14 +35,15 @@ class ProductsModule(BaseModule):
             # Step 2: Try normal click, fallback to JS
             try:
                 WebDriverWait(self.driver, 10).until(
-                    EC.element_to_be_clickable(self.CATALOG_MENU)
+                    EC.element_to_be_clickable(self.find(self.CATALOG_MENU))
                 ).click()
             except (TimeoutException, ElementClickInterceptedException, ElementNotInteractableException):
                 print("  Normal click failed — using JS click for Catalog menu")
-                element = self.driver.find_element(*self.CATALOG_MENU)
+                element = self.find(self.CATALOG_MENU)
                 self.driver.execute_script("arguments[0].click();", element)
 
-            time.sleep(1)
+            # Wait for the Catalog treeview to finish expanding
+            self.wait_for_page_ready()
 
             # Step 3: Scroll to Products submenu
             self.scroll_to_element(*self.PRODUCTS_SUBMENU)
@@ -44,11 +52,11 @@ class ProductsModule(BaseModule):
             # Step 4: Click Products submenu
             try:
                 WebDriverWait(self.driver, 10).until(
-                    EC.element_to_be_clickable(self.PRODUCTS_SUBMENU)
+                    EC.element_to_be_clickable(self.find(self.PRODUCTS_SUBMENU))
                 ).click()
             except (TimeoutException, ElementClickInterceptedException, ElementNotInteractableException):
                 print("  Normal click failed — using JS click for Products submenu")
-                element = self.driver.find_element(*self.PRODUCTS_SUBMENU)
+                element = self.find(self.PRODUCTS_SUBMENU)
                 self.driver.execute_script("arguments[0].click();", element)
 
             # Step 5: Wait for Products page load
@@ -66,18 +74,15 @@ class ProductsModule(BaseModule):
         print(f" Searching for product: {product_name}")
         try:
             self.clear_and_type(*self.SEARCH_INPUT, product_name)
+            previous_grid = self.grid_signature("products-grid")
             self.click_element(*self.SEARCH_BUTTON)
-            time.sleep(2)
-
-            rows = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_all_elements_located(self.PRODUCT_ROW)
-            )
+            self.wait_for_grid("products-grid", previous_grid)
 
-            for row in rows:
-                if product_name.lower() in row.text.lower():
-                    print(f"  Product '{product_name}' found in results!")
-                    self.take_screenshot("test_products", f"search_success_{product_name}")
-                    return True
+            # Match rows in the browser: one round trip for the whole grid
+            if self.grid_contains("products-grid", product_name):
+                print(f"  Product '{product_name}' found in results!")
+                self.take_screenshot("test_products", f"search_success_{product_name}")
+                return True
 
             print(f"  Product '{product_name}' not found in results.")
             return False
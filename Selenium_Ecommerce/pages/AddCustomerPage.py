@@ -1,31 +1,30 @@
 
-import time
-
 from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 
 from Selenium_Ecommerce.modules.BaseModule import BaseModule
+from Selenium_Ecommerce.utils import locators
 
 
 class AddCustomerPage(BaseModule):
     # ----------------------------
     # Locators
     # ----------------------------
-    MORE_INFO_LINK = (By.XPATH, "//a[@href='/Admin/Customer/List' and contains(.,'More info')]")
-    ADD_CUSTOMER_BUTTON = (By.XPATH, "/html/body/div[3]/div[1]/form[1]/div/div/a")
+    MORE_INFO_LINK = locators.CUSTOMERS_MORE_INFO
+    ADD_CUSTOMER_BUTTON = locators.CUSTOMERS_ADD_NEW
 
-    FIRST_NAME = (By.ID, "FirstName")
-    LAST_NAME = (By.ID, "LastName")
-    EMAIL = (By.ID, "Email")
-    PASSWORD = (By.ID, "Password")
-    SAVE_BUTTON = (By.NAME, "save")
+    FIRST_NAME = locators.CUSTOMER_FIRST_NAME
+    LAST_NAME = locators.CUSTOMER_LAST_NAME
+    EMAIL = locators.CUSTOMER_EMAIL
+    PASSWORD = locators.CUSTOMER_PASSWORD
+    SAVE_BUTTON = locators.CUSTOMER_SAVE
 
-    SUCCESS_MESSAGE = (By.XPATH, "//div[contains(@class, 'alert-success') and contains(text(), 'added successfully')]")
+    SUCCESS_MESSAGE = locators.CUSTOMER_SAVED
     #EXISTING_EMAIL_ALERT = (By.XPATH, "//form//ul/li[contains(text(), 'Email is already registered')]")
-    DUPLICATE_EMAIL_MESSAGE = (By.XPATH, "//li[contains(text(),'Email is already registered')]")
+    DUPLICATE_EMAIL_MESSAGE = locators.CUSTOMER_DUPLICATE_EMAIL
 
-    PAGE_HEADER = (By.XPATH, "//h1[contains(text(), 'Customers')]")
+    PAGE_HEADER = locators.CUSTOMERS_HEADER
 
     # ----------------------------
     # Constructor
@@ -42,15 +41,15 @@ class AddCustomerPage(BaseModule):
 
         try:
             # Wait for Customers page header
-            self.wait.until(EC.visibility_of_element_located(self.PAGE_HEADER))
+            self.wait_for_element_visible(self.PAGE_HEADER)
         except TimeoutException:
             print(" Customers page header not found. Refreshing page...")
             self.driver.refresh()
-            self.wait.until(EC.visibility_of_element_located(self.PAGE_HEADER))
+            self.wait_for_element_visible(self.PAGE_HEADER)
 
         # Try to find and click Add New button
         try:
-            button = self.wait.until(EC.element_to_be_clickable(self.ADD_CUSTOMER_BUTTON))
+            button = self.wait.until(EC.element_to_be_clickable(self.find(self.ADD_CUSTOMER_BUTTON)))
             self.driver.execute_script("arguments[0].scrollIntoView(true);", button)
             button.click()
             print("Clicked 'Add new' button successfully.")
@@ -62,9 +61,7 @@ class AddCustomerPage(BaseModule):
         print(f" Adding customer: {first_name} {last_name} ({email})")
 
         try:
-            add_new_btn = self.wait.until(
-                EC.element_to_be_clickable((By.XPATH, "//a[@class='btn btn-primary' and contains(.,'Add new')]"))
-            )
+            add_new_btn = self.wait.until(EC.element_to_be_clickable(self.find(self.ADD_CUSTOMER_BUTTON)))
             add_new_btn.click()
             print(" Clicked 'Add new' button successfully.")
         except Exception as e:
@@ -72,14 +69,13 @@ class AddCustomerPage(BaseModule):
             return False
 
         try:
-            self.wait.until(EC.presence_of_element_located((By.ID, "Email"))).send_keys(email)
-            self.driver.find_element(By.ID, "Password").send_keys(password)
-            self.driver.find_element(By.ID, "FirstName").send_keys(first_name)
-            self.driver.find_element(By.ID, "LastName").send_keys(last_name)
-
-            save_btn = self.driver.find_element(By.XPATH, "//button[@name='save']")
-            self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", save_btn)
-            time.sleep(1)
+            self.find(self.EMAIL).send_keys(email)
+            self.find(self.PASSWORD).send_keys(password)
+            self.find(self.FIRST_NAME).send_keys(first_name)
+            self.find(self.LAST_NAME).send_keys(last_name)
+
+            save_btn = self.find(self.SAVE_BUTTON)
+            self.scroll_into_view(save_btn)
             save_btn.click()
             print(" Clicked 'Save' button.")
             return True
@@ -89,7 +85,8 @@ class AddCustomerPage(BaseModule):
 
     def get_alert_message(self):
         try:
-            time.sleep(2)
+            # Wait for the post-save page to finish loading
+            self.wait_for_page_ready()
             success_alerts = self.driver.find_elements(
                 By.XPATH, "//div[@class='alert alert-success alert-dismissable' and contains(.,'added successfully')]"
             )
@@ -97,9 +94,7 @@ class AddCustomerPage(BaseModule):
                 print(" Detected success alert message: Customer added successfully.")
                 return "success"
 
-            duplicate_msgs = self.driver.find_elements(
-                By.XPATH, "//li[contains(text(),'Email is already registered')]"
-            )
+            duplicate_msgs = self.find_all(self.DUPLICATE_EMAIL_MESSAGE)
             if duplicate_msgs:
                 print(" Detected 'Email already registered' message.")
                 return "exists"
@@ -1,82 +1,69 @@
-import time
-
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC, wait
+from selenium.webdriver.support import expected_conditions as EC
 from Selenium_Ecommerce.modules.BaseModule import BaseModule
-from selenium.common.exceptions import TimeoutException, ElementClickInterceptedException, \
-    StaleElementReferenceException, ElementNotInteractableException
+from Selenium_Ecommerce.utils import locators
+from selenium.common.exceptions import TimeoutException, ElementClickInterceptedException
 
 
 class DashboardPage(BaseModule):
 
-    CUSTOMERS_MENU = (By.XPATH, "//a[@href='#']//p[contains(text(),'Customers')]")
-    CUSTOMERS_ITEM = (By.XPATH, "//a[@href='/Admin/Customer/List']//p[contains(text(),'Customers')]")
-    USER_DROPDOWN = (By.XPATH, "//a[contains(text(),'Hello')]")
-    LOGOUT_LINK = (By.XPATH, "//a[@href='/logout']")
-    AJAX_BUSY = (By.ID, "ajaxBusy")
+    CUSTOMERS_MENU = locators.CUSTOMERS_MENU
+    CUSTOMERS_MENU_LINK = locators.CUSTOMERS_MENU_LINK
+    CUSTOMERS_ITEM = locators.CUSTOMERS_ITEM
+    USER_DROPDOWN = locators.USER_DROPDOWN
+    LOGOUT_LINK = locators.LOGOUT_LINK
+    AJAX_BUSY = locators.AJAX_BUSY
+
 
 
+    def go_to_customers(self, via_menu=None):
+        """
+        Opens the Customers page by URL, or navigates reliably through the sidebar
+        (works across Chrome, Edge, Firefox) when via_menu is set or Config.NAVIGATION is 'menu'.
+        """
+        if not self.use_menu(via_menu):
+            self.open_admin_page("customers")
+            self.wait_for_element_visible(locators.CUSTOMERS_SEARCH_EMAIL)
+            return
 
-    def go_to_customers(self):
-        """Navigates reliably to the Customers page (works across Chrome, Edge, Firefox)."""
         print(" Navigating to Customers section...")
 
         try:
             # Wait until dashboard is ready
-            self.wait.until(EC.presence_of_element_located((By.XPATH, "//div[@class='content-wrapper']")))
+            self.find(locators.CONTENT_WRAPPER)
 
             # Wait for ajaxBusy overlay to disappear
             try:
-                self.wait.until(EC.invisibility_of_element_located(self.AJAX_BUSY))
+                self.wait_for_element_invisible(self.AJAX_BUSY)
             except TimeoutException:
                 print(" ajaxBusy overlay still visible — continuing anyway.")
 
-            # --- Step 1: Click the main Customers menu (anchor, not paragraph)
+            # --- Step 1: Click the main Customers menu (anchor, not paragraph).
+            # Cached elements re-resolve themselves if the sidebar is re-rendered.
             print(" Expanding Customers menu...")
+            menu_link = self.find(self.CUSTOMERS_MENU_LINK)
+            self.scroll_into_view(menu_link)
+            try:
+                menu_link.click()
+            except Exception:
+                self.driver.execute_script("arguments[0].click();", menu_link)
+            print(" Main 'Customers' menu clicked.")
 
-            for attempt in range(3):
-                try:
-                    menu_link = self.driver.find_element(By.XPATH,
-                                                         "//a[@href='#']//p[contains(.,'Customers')]/ancestor::a")
-                    self.driver.execute_script("arguments[0].scrollIntoView(true);", menu_link)
-                    time.sleep(0.5)
-                    try:
-                        menu_link.click()
-                    except Exception:
-                        self.driver.execute_script("arguments[0].click();", menu_link)
-                    print(" Main 'Customers' menu clicked.")
-                    break
-                except (ElementNotInteractableException, StaleElementReferenceException) as e:
-                    print(f" Menu click attempt {attempt + 1} failed: {e}")
-                    time.sleep(1)
-            else:
-                raise AssertionError("Unable to click main Customers menu.")
-
-            # --- Step 2: Wait for submenu link to appear
+            # --- Step 2: Wait for the treeview to finish expanding
             print(" Waiting for Customers submenu to appear...")
-            self.wait.until(EC.presence_of_element_located(self.CUSTOMERS_ITEM))
+            submenu_link = self.find(self.CUSTOMERS_ITEM)
+            self.wait_for_page_ready()
 
-            # --- Step 3: Click submenu safely
-            for attempt in range(3):
-                try:
-                    submenu_link = self.driver.find_element(*self.CUSTOMERS_ITEM)
-                    self.driver.execute_script("arguments[0].scrollIntoView(true);", submenu_link)
-                    time.sleep(0.5)
-                    try:
-                        submenu_link.click()
-                    except Exception:
-                        self.driver.execute_script("arguments[0].click();", submenu_link)
-                    print(" Submenu 'Customers' clicked.")
-                    break
-                except (StaleElementReferenceException, ElementNotInteractableException) as e:
-                    print(f" Submenu click retry {attempt + 1} due to: {e}")
-                    time.sleep(1)
-            else:
-                raise AssertionError("Unable to click Customers submenu.")
+            # --- Step 3: Click submenu
+            self.scroll_into_view(submenu_link)
+            try:
+                submenu_link.click()
+            except Exception:
+                self.driver.execute_script("arguments[0].click();", submenu_link)
+            print(" Submenu 'Customers' clicked.")
 
             # --- Step 4: Verify Customers page is loaded
-            self.wait.until(EC.visibility_of_element_located((By.ID, "SearchEmail")))
+            self.wait_for_element_visible(locators.CUSTOMERS_SEARCH_EMAIL)
             print(" Customers page loaded successfully!")
 
         except Exception as e:
@@ -91,23 +78,22 @@ class DashboardPage(BaseModule):
 
         # Wait for any ajaxBusy overlay to vanish
         try:
-            wait.until(EC.invisibility_of_element_located(self.AJAX_BUSY))
+            self.wait_for_element_invisible(self.AJAX_BUSY, timeout=15)
         except TimeoutException:
             print(" ajaxBusy overlay did not disappear in time — continuing anyway.")
 
         # Locate logout link
-        logout_link = wait.until(EC.presence_of_element_located(self.LOGOUT_LINK))
+        logout_link = self.find(self.LOGOUT_LINK, timeout=15)
 
         # Try up to 3 times to click
         for attempt in range(3):
              try:
                 # Scroll into view
-                self.driver.execute_script("arguments[0].scrollIntoView(true);", logout_link)
-                time.sleep(1)
+                self.scroll_into_view(logout_link)
 
                 # Ensure not obscured by overlay
                 try:
-                    wait.until(EC.invisibility_of_element_located(self.AJAX_BUSY))
+                    self.wait_for_element_invisible(self.AJAX_BUSY, timeout=15)
                 except TimeoutException:
                     print(" Still seeing overlay — retrying click...")
 
@@ -116,8 +102,8 @@ class DashboardPage(BaseModule):
                 break
 
              except ElementClickInterceptedException:
-                print(f" Click intercepted (attempt {attempt + 1}), retrying after short wait...")
-                time.sleep(2)
+                print(f" Click intercepted (attempt {attempt + 1}), retrying once the page is idle...")
+                self.wait_for_page_ready()
                 if attempt == 2:
                     print(" Failed to click logout link — using JS fallback.")
                     self.driver.execute_script("arguments[0].click();", logout_link)
@@ -1,29 +1,30 @@
-import time
-from selenium.webdriver.common.by import By
+from Selenium_Ecommerce.modules.BaseModule import BaseModule
+from Selenium_Ecommerce.utils import locators
+from Selenium_Ecommerce.utils.config import Config
 
 
-class Keywords:
+class Keywords(BaseModule):
     def __init__(self, driver):
-        self.driver = driver
+        super().__init__(driver)
 
     # --------------------------
     # Generic Keywords
     # --------------------------
     def navigate_to_url(self, url):
         """Open a given URL."""
-        self.driver.get(url)
+        self.driver.get(Config.site_url(url))
         return True
 
     def enter_text(self, by, locator, text):
         """Enter text into any input field."""
-        element = self.driver.find_element(by, locator)
+        element = self.locate(by, locator)
         element.clear()
         element.send_keys(text)
         return True
 
     def click_element(self, by, locator):
         """Click any element."""
-        self.driver.find_element(by, locator).click()
+        self.locate(by, locator).click()
         return True
 
     def verify_page_title(self, expected_title):
@@ -35,24 +36,24 @@ class Keywords:
     # --------------------------
     def login(self, username, password):
         """Perform login using username and password."""
-        self.enter_text(By.ID, "Email", username)
-        self.enter_text(By.ID, "Password", password)
-        self.click_element(By.XPATH, "//button[normalize-space()='Log in']")
+        self.enter_text(*locators.LOGIN_EMAIL, username)
+        self.enter_text(*locators.LOGIN_PASSWORD, password)
+        self.click_element(*locators.LOGIN_BUTTON)
         return True
 
     def logout(self):
         """Log out from admin."""
         try:
-            self.click_element(By.XPATH, "//a[normalize-space()='Logout']")
+            self.click_element(*locators.LOGOUT_LINK)
             return True
         except:
             return False
 
     def verify_login_successful(self):
         """Verify dashboard is visible after login."""
-        time.sleep(2)
+        self.wait_for_page_ready()
         try:
-            dashboard = self.driver.find_element(By.XPATH, "//h1[normalize-space()='Dashboard']")
+            dashboard = self.find(locators.DASHBOARD_HEADER)
             return dashboard.is_displayed()
         except:
             return False
@@ -60,7 +61,7 @@ class Keywords:
     def verify_login_failed(self):
         """Verify invalid login error message."""
         try:
-            msg = self.driver.find_element(By.CSS_SELECTOR, ".message-error").text
+            msg = self.find(locators.LOGIN_ERROR_ANY).text
             return "Login was unsuccessful" in msg
         except:
             return False
@@ -70,17 +71,17 @@ class Keywords:
     # --------------------------
     def open_orders_page(self):
         """Navigate to Sales → Orders"""
-        self.click_element(By.XPATH, "//p[normalize-space()='Sales']")
-        time.sleep(1)
-        self.click_element(By.XPATH, "//p[normalize-space()='Orders']")
-        time.sleep(2)
+        self.click_element(*locators.SALES_MENU)
+        self.wait_for_page_ready()
+        self.click_element(*locators.ORDERS_SUBMENU)
+        self.wait_for_page_ready()
         return self.verify_page_title("Orders")
 
     def search_order_by_id(self, order_id):
         """Search for a specific order by ID"""
-        self.enter_text(By.ID, "GoDirectlyToCustomOrderNumber", order_id)
-        self.click_element(By.ID, "go-to-order-by-number")
-        time.sleep(2)
+        self.enter_text(*locators.ORDERS_GO_TO_NUMBER, order_id)
+        self.click_element(*locators.ORDERS_GO_BUTTON)
+        self.wait_for_page_ready()
         return True
 
     # --------------------------
@@ -88,19 +89,16 @@ class Keywords:
     # --------------------------
     def open_products_page(self):
         """Navigate to Catalog → Products"""
-        self.click_element(By.XPATH, "//p[normalize-space()='Catalog']")
-        time.sleep(1)
-        self.click_element(By.XPATH, "//p[normalize-space()='Products']")
-        time.sleep(2)
+        self.click_element(*locators.CATALOG_MENU)
+        self.wait_for_page_ready()
+        self.click_element(*locators.PRODUCTS_SUBMENU)
+        self.wait_for_page_ready()
         return self.verify_page_title("Products")
 
     def search_product_by_name(self, product_name):
         """Search product by name"""
-        self.enter_text(By.ID, "SearchProductName", product_name)
-        self.click_element(By.ID, "search-products")
-        time.sleep(2)
-        products = self.driver.find_elements(By.XPATH, "//table[@id='products-grid']//tbody/tr")
-        for p in products:
-            if product_name.lower() in p.text.lower():
-                return True
-        return False
+        self.enter_text(*locators.PRODUCTS_SEARCH_NAME, product_name)
+        previous_grid = self.grid_signature("products-grid")
+        self.click_element(*locators.PRODUCTS_SEARCH_BUTTON)
+        self.wait_for_grid("products-grid", previous_grid)
+        return self.grid_contains("products-grid", product_name)
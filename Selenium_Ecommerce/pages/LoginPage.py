@@ -1,19 +1,32 @@
 
-import time
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.support import expected_conditions as EC
 from Selenium_Ecommerce.modules.BaseModule import BaseModule
+from Selenium_Ecommerce.utils import locators
+from Selenium_Ecommerce.utils.config import Config
+from Selenium_Ecommerce.utils.network_monitor import NetworkMonitor
 
 
 class LoginPage(BaseModule):
-    EMAIL_FIELD = (By.ID, "Email")
-    PASSWORD_FIELD = (By.ID, "Password")
-    LOGIN_BUTTON = (By.XPATH, "//button[contains(text(),'Log in')]")
-    LOGOUT_LINK = (By.XPATH, "//a[contains(text(),'Logout')]")
-    REMEMBER_ME = (By.ID, "RememberMe")
-    ERROR_DIV = (By.CSS_SELECTOR, "div.message-error.validation-summary-errors")
+    EMAIL_FIELD = locators.LOGIN_EMAIL
+    PASSWORD_FIELD = locators.LOGIN_PASSWORD
+    LOGIN_BUTTON = locators.LOGIN_BUTTON
+    LOGOUT_LINK = locators.LOGOUT_LINK
+    REMEMBER_ME = locators.LOGIN_REMEMBER_ME
+    ERROR_DIV = locators.LOGIN_ERROR
+
+    # Current URL plus the visible text of the client-side and server-side error blocks
+    LOGIN_STATE_JS = """
+        var visibleText = function (el) {
+            return el && el.offsetParent !== null ? el.innerText.trim() : '';
+        };
+        return {
+            url: window.location.href,
+            emailError: visibleText(document.getElementById('Email-error')),
+            serverError: visibleText(document.querySelector('div.message-error.validation-summary-errors'))
+        };
+    """
 
     def __init__(self, driver):
         super().__init__(driver)
@@ -24,16 +37,16 @@ class LoginPage(BaseModule):
         """Wait until the login form is fully ready."""
         for attempt in range(max_attempts):
             try:
-                self.wait.until(EC.visibility_of_element_located(self.EMAIL_FIELD))
-                self.wait.until(EC.visibility_of_element_located(self.PASSWORD_FIELD))
-                self.wait.until(EC.element_to_be_clickable(self.LOGIN_BUTTON))
+                self.wait.until(EC.visibility_of(self.find(self.EMAIL_FIELD)))
+                self.wait.until(EC.visibility_of(self.find(self.PASSWORD_FIELD)))
+                self.wait.until(EC.element_to_be_clickable(self.find(self.LOGIN_BUTTON)))
                 print(f"Login form ready on attempt {attempt + 1}")
                 return True
             except TimeoutException:
                 print(f" Attempt {attempt + 1}: Login form not ready, refreshing...")
                 self.take_screenshot("test_login", f"login_page_not_ready_attempt{attempt + 1}")
                 self.driver.refresh()
-                time.sleep(2 * (attempt + 1))
+                self.wait_for_page_ready(timeout=5 * (attempt + 1))
         return False
 
     def login(self, email, password):
@@ -41,33 +54,30 @@ class LoginPage(BaseModule):
            'success', 'invalid_email', 'no_account', 'wrong_credentials', or 'none'."""
         print(f" Trying login: {email or '[EMPTY EMAIL]'} / {password or '[EMPTY PASSWORD]'}")
 
-        dashboard_url = "https://admin-demo.nopcommerce.com/admin/"
-        email_error_elem = (By.ID, "Email-error")
-        error_div_elem = (By.CSS_SELECTOR, "div.message-error.validation-summary-errors")
+        dashboard_url = Config.ADMIN_URL
 
         # Ensure login form is ready
         if not self.wait_for_form_ready():
             return "none"
 
         # Fill credentials
-        email_field = self.driver.find_element(*self.EMAIL_FIELD)
-        password_field = self.driver.find_element(*self.PASSWORD_FIELD)
+        email_field = self.find(self.EMAIL_FIELD)
+        password_field = self.find(self.PASSWORD_FIELD)
         email_field.clear()
         email_field.send_keys(email)
         password_field.clear()
         password_field.send_keys(password)
 
         # Toggle "Remember Me" checkbox
-        try:
-            remember_me = self.driver.find_element(*self.REMEMBER_ME)
-            if not remember_me.is_selected():
-                remember_me.click()
-        except NoSuchElementException:
+        remember_me = self.find_all(self.REMEMBER_ME)
+        if not remember_me:
             print(" Remember Me checkbox not found — skipping.")
+        elif not remember_me[0].is_selected():
+            remember_me[0].click()
 
         # Click the Login button
         try:
-            login_btn = self.driver.find_element(*self.LOGIN_BUTTON)
+            login_btn = self.find(self.LOGIN_BUTTON)
             self.driver.execute_script("arguments[0].scrollIntoView(true);", login_btn)
             try:
                 login_btn.click()
@@ -80,56 +90,66 @@ class LoginPage(BaseModule):
             self.take_screenshot("test_login", "login_click_error")
             return "none"
 
-        # Wait for either success or failure outcome
-        timeout = 25
-        poll_interval = 1
-        end_time = time.time() + timeout
-
-        while time.time() < end_time:
-            current_url = self.driver.current_url
-
-            #  Success case: Dashboard loaded
-            if current_url.strip("/") == dashboard_url.strip("/"):
-                print(" Login successful — Dashboard loaded.")
-                return "success"
+        # Wait for either success or failure outcome.
+        # Each poll reads URL and both error blocks in one script call, so a
+        # missing element never costs an implicit wait. With CDP tracking the
+        # page is only read once the form POST / redirect has completed.
+        network = NetworkMonitor.for_driver(self.driver)
+        try:
+            state = WebDriverWait(self.driver, 25, poll_frequency=0.05 if network else 0.25).until(
+                lambda d: self._login_outcome(dashboard_url, network)
+            )
+        except TimeoutException:
+            print(" Timeout: No known post-login condition detected.")
+            self.take_screenshot("test_login", "dashboard_not_loaded")
+            return "none"
 
-            #  Client-side validation: Missing email
-            try:
-                email_err = self.driver.find_element(*email_error_elem)
-                if email_err.is_displayed() and "Please enter your email" in email_err.text:
-                    print(f" Validation error: {email_err.text.strip()}")
-                    self.take_screenshot("test_login", "invalid_email")
-                    return "invalid_email"
-            except NoSuchElementException:
-                pass
-
-            #  Server-side errors
-            try:
-                err_block = self.driver.find_element(*error_div_elem)
-                if err_block.is_displayed():
-                    msg = err_block.text.strip()
-                    print(f" Server error detected: {msg}")
-                    self.take_screenshot("test_login", "login_error")
-                    if "No customer account found" in msg:
-                        return "no_account"
-                    elif "The credentials provided are incorrect" in msg:
-                        return "wrong_credentials"
-                    else:
-                        return "invalid"
-            except NoSuchElementException:
-                pass
-
-            time.sleep(poll_interval)
-
-        # Timeout fallback
-        print(" Timeout: No known post-login condition detected.")
-        self.take_screenshot("test_login", "dashboard_not_loaded")
-        return "none"
+        #  Success case: Dashboard loaded
+        if state["outcome"] == "success":
+            self.wait_for_page_ready()
+            print(" Login successful — Dashboard loaded.")
+            return "success"
+
+        #  Client-side validation: Missing email
+        if state["outcome"] == "invalid_email":
+            print(f" Validation error: {state['emailError']}")
+            self.take_screenshot("test_login", "invalid_email")
+            return "invalid_email"
+
+        #  Server-side errors
+        msg = state["serverError"]
+        print(f" Server error detected: {msg}")
+        self.take_screenshot("test_login", "login_error")
+        if "No customer account found" in msg:
+            return "no_account"
+        elif "The credentials provided are incorrect" in msg:
+            return "wrong_credentials"
+        else:
+            return "invalid"
+
+    def _login_outcome(self, dashboard_url, network=None):
+        """Return the post-login state once it is decided, otherwise False (keep polling)."""
+        if network is not None and network.busy(types=("Document",)):
+            return False  # still navigating
+        try:
+            state = self.driver.execute_script(self.LOGIN_STATE_JS)
+        except WebDriverException:
+            return False  # page is navigating
+
+        if state["url"].strip("/") == dashboard_url.strip("/"):
+            state["outcome"] = "success"
+        elif "Please enter your email" in state["emailError"]:
+            state["outcome"] = "invalid_email"
+        elif state["serverError"]:
+            state["outcome"] = "server_error"
+        else:
+            return False
+        return state
 
     def logout(self):
         """Logs out from the system."""
         try:
-            logout_btn = WebDriverWait(self.driver, 10).until(EC.element_to_be_clickable(self.LOGOUT_LINK))
+            logout_btn = WebDriverWait(self.driver, 10).until(EC.element_to_be_clickable(self.find(self.LOGOUT_LINK)))
             self.driver.execute_script("arguments[0].scrollIntoView(true);", logout_btn)
             try:
                 logout_btn.click()
@@ -1,88 +1,64 @@
 
 
-from selenium.common import StaleElementReferenceException, TimeoutException
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from Selenium_Ecommerce.modules.BaseModule import BaseModule
+from Selenium_Ecommerce.utils import locators
 
 class SearchCustomerPage(BaseModule):
-    SEARCH_EMAIL = (By.ID, "SearchEmail")
-    SEARCH_FIRST_NAME = (By.ID, "SearchFirstName")
-    SEARCH_LAST_NAME = (By.ID, "SearchLastName")
-    SEARCH_BUTTON = (By.ID, "search-customers")
-    SEARCH_RESULTS = (By.XPATH, "//table[@id='customers-grid']/tbody/tr")
-    PAGE_HEADER = (By.XPATH, "//h1[contains(text(),'Customers')]")
+    SEARCH_EMAIL = locators.CUSTOMERS_SEARCH_EMAIL
+    SEARCH_FIRST_NAME = locators.CUSTOMERS_SEARCH_FIRST_NAME
+    SEARCH_LAST_NAME = locators.CUSTOMERS_SEARCH_LAST_NAME
+    SEARCH_BUTTON = locators.CUSTOMERS_SEARCH_BUTTON
+    SEARCH_RESULTS = locators.CUSTOMERS_ROWS
+    PAGE_HEADER = locators.CUSTOMERS_HEADER
 
-    ROLE_DROPDOWN_INPUT = (By.CSS_SELECTOR, "span.select2-selection__rendered input.select2-search__field")
+    ROLE_DROPDOWN = locators.CUSTOMERS_ROLE_CONTAINER
+    ROLE_DROPDOWN_INPUT = locators.CUSTOMERS_ROLE_INPUT
+    ROLE_OPTION = locators.CUSTOMERS_ROLE_OPTION
 
     def __init__(self, driver):
         super().__init__(driver)
 
     def wait_for_customer_page(self):
-        WebDriverWait(self.driver, 10).until(
-            EC.visibility_of_element_located(self.PAGE_HEADER)
-        )
+        self.wait_for_element_visible(self.PAGE_HEADER)
+
+    def run_search(self):
+        """Click Search, wait for the grid to refresh and report whether it has result rows."""
+        previous_grid = self.grid_signature("customers-grid")
+        self.click_element(*self.SEARCH_BUTTON)
+        self.wait_for_grid("customers-grid", previous_grid)
+        return len(self.read_grid("customers-grid", columns=[])) > 0
 
     def search_by_email(self, email):
         self.enter_text(*self.SEARCH_EMAIL, email)
-        self.click_element(*self.SEARCH_BUTTON)
-        return len(self.driver.find_elements(*self.SEARCH_RESULTS)) > 0
+        return self.run_search()
 
     def search_by_first_name(self, first_name):
         self.enter_text(*self.SEARCH_FIRST_NAME, first_name)
-        self.click_element(*self.SEARCH_BUTTON)
-        return len(self.driver.find_elements(*self.SEARCH_RESULTS)) > 0
+        return self.run_search()
 
     def search_by_last_name(self, last_name):
         self.enter_text(*self.SEARCH_LAST_NAME, last_name)
-        self.click_element(*self.SEARCH_BUTTON)
-        return len(self.driver.find_elements(*self.SEARCH_RESULTS)) > 0
+        return self.run_search()
 
 
     def search_by_role(self, role_name: str) -> bool:
         wait = WebDriverWait(self.driver, 10)
 
-        # Retry loop to handle stale elements
-        for _ in range(3):
-            try:
-                #  Click the Select2 container to open the dropdown
-                dropdown_container = wait.until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, "span.select2-selection.select2-selection--multiple"))
-                )
-                dropdown_container.click()
-
-                #  Wait for the input field inside dropdown
-                dropdown_input = wait.until(
-                    EC.visibility_of_element_located((By.CSS_SELECTOR, "input.select2-search__field"))
-                )
-                dropdown_input.clear()
-                dropdown_input.send_keys(role_name)
-
-                #  Wait for the option to appear and click it
-                role_option = wait.until(
-                    EC.element_to_be_clickable(
-                        (By.XPATH,
-                         f"//li[contains(@class,'select2-results__option') and normalize-space(text())='{role_name}']")
-                    )
-                )
-                role_option.click()
-
-                #  Click the search button
-                search_button = wait.until(
-                    EC.element_to_be_clickable(self.SEARCH_BUTTON)
-                )
-                search_button.click()
-
-                #  Return True if search results exist
-                return len(self.driver.find_elements(*self.SEARCH_RESULTS)) > 0
-
-            except StaleElementReferenceException:
-                # Element went stale — retry
-                continue
-            except TimeoutException:
-                # Element never appeared — fail immediately
-                raise
-
-        # If all retries failed
-        raise StaleElementReferenceException(f"Failed to select role '{role_name}' due to stale elements.")
\ No newline at end of file
+        #  Click the Select2 container to open the dropdown.
+        #  Cached elements re-resolve themselves if Select2 re-renders them.
+        dropdown_container = wait.until(EC.element_to_be_clickable(self.find(self.ROLE_DROPDOWN)))
+        dropdown_container.click()
+
+        #  Wait for the input field inside dropdown
+        dropdown_input = wait.until(EC.visibility_of(self.find(self.ROLE_DROPDOWN_INPUT)))
+        dropdown_input.clear()
+        dropdown_input.send_keys(role_name)
+
+        #  Wait for the option to appear and click it
+        role_option = self.find(self.ROLE_OPTION.format(role=role_name))
+        wait.until(EC.element_to_be_clickable(role_option)).click()
+
+        #  Click the search button and return True if search results exist
+        return self.run_search()
@@ -39,12 +39,35 @@ echo.
 REM =======================================================
 REM  Parallel Execution (Auto-detect cores)
 REM =======================================================
-echo   2. Parallel: Running tests on all available CPU cores...
-pytest tests/ -n auto -v --alluredir=reports/allure-parallel --html=reports/parallel_report.html --self-contained-html
+echo   2. Parallel: Running tests on all available CPU cores (longest test classes first)...
+pytest tests/ -n auto --duration-schedule -v --alluredir=reports/allure-parallel --html=reports/parallel_report.html --self-contained-html
 echo.
 echo  Parallel HTML report saved at: reports\parallel_report.html
 echo.
 
+REM =======================================================
+REM  Cross-Browser Matrix (one worker group per browser, concurrently)
+REM =======================================================
+echo   Cross-browser matrix: Chrome, Firefox and Edge at the same time, 2 workers each...
+python -m Selenium_Ecommerce.utils.browser_matrix --browsers chrome,firefox,edge -n 2 -- Selenium_Ecommerce/tests -v --alluredir=reports/allure-matrix
+echo.
+echo  Per-browser timing report saved at: Selenium_Ecommerce\Output\matrix\matrix-report.html
+echo.
+
+REM =======================================================
+REM  Local Grid (in-process hub, browser slots limited per browser)
+REM =======================================================
+echo   Local grid: 4 workers sharing 3 Chrome slots (queue wait and slot usage in the summary)...
+pytest tests/ -n 4 --local-grid --grid-slots chrome=3 --headless -v --alluredir=reports/allure-localgrid
+echo.
+
+REM =======================================================
+REM  Impact Analysis (only tests affected by changes since a git ref)
+REM =======================================================
+echo   Changed-only: tests whose page objects, locators or data files changed since origin/main...
+pytest tests/ --changed-since origin/main -n auto -v --alluredir=reports/allure-changed
+echo.
+
 REM =======================================================
 REM Specific File Execution
 REM =======================================================
@@ -66,12 +89,15 @@ echo   Skipping actual headless run (manual activation required).
 echo.
 
 REM =======================================================
-REM Retry Failed Tests Automatically
+REM Retry Flaky Tests + Quarantine Lane
 REM =======================================================
-echo   5. Retrying failed tests up to 2 times...
-pytest --reruns 2 --reruns-delay 3 -v --alluredir=reports/allure-retry --html=reports/retry_report.html --self-contained-html
+echo   5. Known-flaky tests in a parallel quarantine lane, everything else in the main lane...
+echo      (only tests with a flaky history are rerun, up to 2 times, in the same browser)
+start "Quarantine lane" pytest tests/ --lane quarantine -n 2 --output-dir Output/quarantine -v --alluredir=reports/allure-quarantine --html=reports/quarantine_report.html --self-contained-html
+pytest tests/ --lane main -n auto --duration-schedule --flaky-reruns 2 -v --alluredir=reports/allure-retry --html=reports/retry_report.html --self-contained-html
 echo.
 echo  Retry report saved at: reports\retry_report.html
+echo  Quarantine report saved at: reports\quarantine_report.html
 echo.
 
 REM =======================================================
@@ -94,8 +120,10 @@ REM =======================================================
 REM  Full Regression (All Tests Sequential)
 REM =======================================================
 echo ️  8. Running full regression suite sequentially...
-pytest tests/ -v --alluredir=reports/allure-full --html=reports/full_report.html --self-contained-html
+pytest tests/ -v --journal Output/journal/full-regression.jsonl --alluredir=reports/allure-full --html=reports/full_report.html --self-contained-html
 echo.
+echo  If the run was interrupted, continue it (passed tests are skipped, their Allure results kept):
+echo     pytest tests/ -v --journal Output/journal/full-regression.jsonl --resume --alluredir=reports/allure-full --html=reports/full_report.html --self-contained-html
 echo  Full regression HTML report saved at: reports\full_report.html
 echo.
 
@@ -103,20 +131,20 @@ echo ================================================
 echo  Running Customer Search Test
 echo ================================================
 
-:: Run tests and generate both HTML + Allure result files
-pytest Selenium_Ecommerce/tests/test_custsearch.py -v -s --alluredir=Selenium_Ecommerce/reports/allure-custsearch --html=Selenium_Ecommerce/reports/custsearch_report.html --self-contained-html
+:: Run tests and generate both HTML + Allure result files (bundled into the Allure store afterwards)
+pytest Selenium_Ecommerce/tests/test_custsearch.py -v -s --alluredir=Selenium_Ecommerce/reports/allure-custsearch --allure-compact --html=Selenium_Ecommerce/reports/custsearch_report.html --self-contained-html
 
 echo  Pytest execution complete.
 echo ================================================
 echo ⚙ Generating Allure HTML report...
 echo ================================================
 
-:: Generate permanent Allure HTML dashboard
-allure generate Selenium_Ecommerce/reports/allure-custsearch -o Selenium_Ecommerce/reports/allure-report --clean
+:: Regenerate the Allure dashboards of suites whose results changed (add --full to rebuild all)
+python -m Selenium_Ecommerce.utils.allure_store generate
 
 echo  Allure report generated successfully.
-echo  Location: Selenium_Ecommerce\reports\allure-report\
-start Selenium_Ecommerce\reports\allure-report\index.html
+echo  Location: Selenium_Ecommerce\Output\reports\allure-report\
+start Selenium_Ecommerce\Output\reports\allure-report\index.html
 
 REM =======================================================
 REM  Summary
@@ -19,7 +19,6 @@ from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.edge.options import Options as EdgeOptions
 
 # Import page objects
-from Selenium_Ecommerce.pages.LoginPage import LoginPage
 from Selenium_Ecommerce.pages.DashboardPage import DashboardPage
 from Selenium_Ecommerce.pages.AddCustomerPage import AddCustomerPage
 from Selenium_Ecommerce.pages.SearchCustomerPage import SearchCustomerPage
@@ -34,18 +33,15 @@ from Selenium_Ecommerce.utils.data_loader import load_test_data  #  Universal da
 # Fixture to log into the nopCommerce Admin site
 # ------------------------------------------------------------------------
 @pytest.fixture
-def login_fixture(setup):
+def login_fixture(setup, auth_session):
     """
     Reusable login fixture that authenticates admin user before running tests.
+    Uses the cached admin session; the login form is only filled in once per worker.
     """
     driver = setup
-    login_page = LoginPage(driver)
 
-    # Open the login page
-    driver.get("https://admin-demo.nopcommerce.com/login?ReturnUrl=%2Fadmin%2F")
-
-    # Perform login using admin credentials
-    login_page.login("admin@yourstore.com", "admin")
+    # Open the Dashboard with the cached admin session
+    auth_session.login(driver)
 
     # Validate that Dashboard loaded successfully
     dashboard = DashboardPage(driver)
@@ -99,12 +95,12 @@ class TestAddCustomer:
             assert alert in ["success", "exists"], f"Unexpected alert: {alert}"
 
         if alert == "success":
-            screenshot = self.add_page.take_screenshot("test_custadd", f"success_{email}")
-            allure.attach.file(screenshot, name=f"Customer_{email}_Success", attachment_type=allure.attachment_type.PNG)
+            self.add_page.take_screenshot("test_custadd", f"success_{email}",
+                                         attach_name=f"Customer_{email}_Success")
             print(f" Customer '{email}' added successfully.")
         elif alert == "exists":
-            screenshot = self.add_page.take_screenshot("test_custadd", f"success_{email}")
-            allure.attach.file(screenshot, name=f"Customer_{email}_Success", attachment_type=allure.attachment_type.PNG)
+            self.add_page.take_screenshot("test_custadd", f"success_{email}",
+                                         attach_name=f"Customer_{email}_Success")
             print(f" Customer '{email}' already exists.")
 
     # --------------------------------------------------------------------
@@ -129,17 +125,14 @@ class TestAddCustomer:
             # Step : Check alert message after submission
             alert_result = self.add_page.get_alert_message()
             if alert_result == "success":
-                screenshot = self.add_page.take_screenshot("test_custadd", f"success_{email}")
-                allure.attach.file(screenshot, name=f"Customer_{email}_Success",
-                                   attachment_type=allure.attachment_type.PNG)
+                self.add_page.take_screenshot("test_custadd", f"success_{email}",
+                                             attach_name=f"Customer_{email}_Success")
                 print(f" Customer '{email}' added successfully.")
             elif alert_result == "exists":
-                screenshot = self.add_page.take_screenshot("test_custadd", f"success_{email}")
-                allure.attach.file(screenshot, name=f"Customer_{email}_Success",
-                                   attachment_type=allure.attachment_type.PNG)
+                self.add_page.take_screenshot("test_custadd", f"success_{email}",
+                                             attach_name=f"Customer_{email}_Success")
                 print(f" Customer '{email}' already exists.")
             else:
-                screenshot = self.add_page.take_screenshot("test_custadd", f"failed_{email}")
-                allure.attach.file(screenshot, name=f"Customer_{email}_Failed",
-                                   attachment_type=allure.attachment_type.PNG)
+                self.add_page.take_screenshot("test_custadd", f"failed_{email}",
+                                             attach_name=f"Customer_{email}_Failed")
                 assert False, f"Add Customer failed for {email}"
@@ -26,20 +26,26 @@ class TestSearchCustomer:
         Supports data-driven testing from CSV / XLSX / XML.
         """
     @pytest.fixture(autouse=True)
-    def setup_search(self, login_fixture):
+    def setup_search(self, login_fixture, seeded_customers):
         self.driver, self.dashboard = login_fixture
 
         self.search_page = SearchCustomerPage(self.driver)
         self.dashboard = DashboardPage(self.driver)
-        self.driver.get("https://admin-demo.nopcommerce.com/login?ReturnUrl=%2Fadmin%2F")
-
-        # Login once before navigating to Products (demo admin creds)
-        from Selenium_Ecommerce.pages.LoginPage import LoginPage
-        login = LoginPage(self.driver)
-        login.login("admin@yourstore.com", "admin")
 
+        # login_fixture already opened the Dashboard with the cached admin session
         self.dashboard.go_to_customers()
 
+    # --------------------------------------------------------------------
+    # Test  — Sidebar navigation (setup opens Customers by URL)
+    # --------------------------------------------------------------------
+    @allure.story("Navigate Dashboard → Customers → Customers")
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_navigate_to_customers_via_menu(self):
+        """Covers the sidebar path that the other tests skip."""
+        self.dashboard.open_admin_page("dashboard")
+        self.dashboard.go_to_customers(via_menu=True)
+        assert "Customers" in self.driver.title
+
     # --------------------------------------------------------------------
     # Test  — Search by Email
     # --------------------------------------------------------------------
@@ -55,11 +61,9 @@ class TestSearchCustomer:
             assert result, f"Email '{email}' not found in results."
 
             #  Capture screenshot for successful case
-            screenshot = self.search_page.take_screenshot("test_custsearch", f"email_found_{email}")
-            allure.attach.file(
-                screenshot,
-                name=f"Customer_Email_{email}_Success",
-                attachment_type=allure.attachment_type.PNG,
+            self.search_page.take_screenshot(
+                "test_custsearch", f"email_found_{email}",
+                attach_name=f"Customer_Email_{email}_Success",
             )
             print(f" Customer with email '{email}' found successfully.")
 
@@ -77,11 +81,9 @@ class TestSearchCustomer:
             result = self.search_page.search_by_first_name(first_name)
             assert result, f"Customer with first name '{first_name}' not found."
 
-            screenshot = self.search_page.take_screenshot("test_custsearch", f"first_name_found_{first_name}")
-            allure.attach.file(
-                screenshot,
-                name=f"Customer_FirstName_{first_name}_Success",
-                attachment_type=allure.attachment_type.PNG,
+            self.search_page.take_screenshot(
+                "test_custsearch", f"first_name_found_{first_name}",
+                attach_name=f"Customer_FirstName_{first_name}_Success",
             )
             print(f" Customer with first name '{first_name}' found successfully.")
 
@@ -98,11 +100,9 @@ class TestSearchCustomer:
             result = self.search_page.search_by_last_name(last_name)
             assert result, f"Customer with last name '{last_name}' not found."
 
-            screenshot = self.search_page.take_screenshot("test_custsearch", f"last_name_found_{last_name}")
-            allure.attach.file(
-                screenshot,
-                name=f"Customer_LastName_{last_name}_Success",
-                attachment_type=allure.attachment_type.PNG,
+            self.search_page.take_screenshot(
+                "test_custsearch", f"last_name_found_{last_name}",
+                attach_name=f"Customer_LastName_{last_name}_Success",
             )
             print(f" Customer with last name '{last_name}' found successfully.")
 
@@ -122,10 +122,8 @@ class TestSearchCustomer:
             result = self.search_page.search_by_role(role_name)
             assert result, f"Customer with role '{role_name}' not found."
 
-            screenshot = self.search_page.take_screenshot("test_custsearch", f"role_found_{role_name}")
-            allure.attach.file(
-                screenshot,
-                name=f"Customer_Role_{role_name}_Success",
-                attachment_type=allure.attachment_type.PNG,
+            self.search_page.take_screenshot(
+                "test_custsearch", f"role_found_{role_name}",
+                attach_name=f"Customer_Role_{role_name}_Success",
             )
             print(f" Customer with role '{role_name}' found successfully.")
\ No newline at end of file
@@ -1,22 +1,25 @@
 import pytest
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service as ChromeService
-from webdriver_manager.chrome import ChromeDriverManager
 from Selenium_Ecommerce.pages.Keyword import Keywords
 from Selenium_Ecommerce.utils.config import Config
+from Selenium_Ecommerce.utils.keyword_engine import KeywordEngine, load_plan
+
+# Each sheet of keyword.xlsx is an independent scenario, so xdist can run them on different workers
+KEYWORD_PLAN = load_plan("Selenium_Ecommerce/utils/data/keyword.xlsx")
 
 
 class TestKeywords:
 
     @pytest.fixture(autouse=True)
-    def setup(self):
-        """Set up Chrome browser for each test."""
-        self.driver = webdriver.Chrome(service=ChromeService(ChromeDriverManager().install()))
-        self.driver.maximize_window()
-        self.driver.implicitly_wait(10)
+    def setup(self, request, driver_pool):
+        """
+        Check out a clean browser from the session pool for each test. Overrides the
+        conftest `setup`, so it gets the same --browser parameter and honours --grid.
+        """
+        self.driver = driver_pool.acquire(request.param, headless=request.config.getoption("--headless"),
+                                          grid=request.config.getoption("--grid"))
         self.kw = Keywords(self.driver)
         yield
-        self.driver.quit()
+        driver_pool.release(self.driver)
 
     def test_valid_admin_login(self):
         """Verify admin can log in successfully."""
@@ -30,15 +33,19 @@ class TestKeywords:
         self.kw.login("wrong_user@store.com", "badpass")
         assert self.kw.verify_login_failed() is True
 
-    def test_open_orders_module(self):
+    def test_open_orders_module(self, auth_session):
         """Verify navigation to Orders page."""
-        self.kw.navigate_to_url(Config.BASE_URL)
-        self.kw.login(Config.ADMIN_USERNAME, Config.ADMIN_PASSWORD)
+        auth_session.login(self.driver)
         assert self.kw.open_orders_page() is True
 
-    def test_search_product(self):
+    def test_search_product(self, auth_session):
         """Verify searching for a product."""
-        self.kw.navigate_to_url(Config.BASE_URL)
-        self.kw.login(Config.ADMIN_USERNAME, Config.ADMIN_PASSWORD)
+        auth_session.login(self.driver)
         self.kw.open_products_page()
         assert self.kw.search_product_by_name("Build your own computer") is True
+
+    @pytest.mark.parametrize("scenario", list(KEYWORD_PLAN))
+    def test_keyword_scenario(self, scenario):
+        """Run a compiled keyword.xlsx scenario and report per-step timings."""
+        results = KeywordEngine(self.driver).run(KEYWORD_PLAN[scenario], scenario)
+        assert all(r.outcome != "failed" for r in results)
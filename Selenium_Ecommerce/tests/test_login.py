@@ -20,6 +20,7 @@ from Selenium_Ecommerce.pages.LoginPage import LoginPage
 from Selenium_Ecommerce.pages.DashboardPage import DashboardPage
 # Data loader to support CSV, Excel, XML test data
 from Selenium_Ecommerce.utils.data_loader import load_test_data
+from Selenium_Ecommerce.utils.config import Config
 
 
 
@@ -49,7 +50,7 @@ class TestLoginLogout:
 
         driver = setup
         login_page = LoginPage(driver)
-        driver.get("https://admin-demo.nopcommerce.com/login?ReturnUrl=%2Fadmin%2F")
+        driver.get(Config.LOGIN_URL)
 
         # Step: Attempt Login
         with allure.step(f"Testing login with: {email or '[EMPTY EMAIL]'} | Expected: {expected}"):
@@ -117,7 +118,7 @@ class TestLoginLogout:
         Captures screenshots for both actions.
         """
         driver = setup
-        driver.get("https://admin-demo.nopcommerce.com/login?ReturnUrl=%2Fadmin%2F")
+        driver.get(Config.LOGIN_URL)
         login_page = LoginPage(driver)
 
         with allure.step("Performing login for logout test"):
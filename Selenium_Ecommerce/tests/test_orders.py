@@ -9,7 +9,6 @@ from Selenium_Ecommerce.modules.OrdersModule import OrdersModule
 
 import pytest
 import allure
-from Selenium_Ecommerce.pages.LoginPage import LoginPage
 from Selenium_Ecommerce.pages.DashboardPage import DashboardPage
 
 
@@ -17,11 +16,9 @@ from Selenium_Ecommerce.utils.data_loader import load_test_data
 
 
 @pytest.fixture
-def login_fixture(setup):
+def login_fixture(setup, auth_session):
     driver = setup
-    login_page = LoginPage(driver)
-    driver.get("https://admin-demo.nopcommerce.com/login?ReturnUrl=%2Fadmin%2F")
-    login_page.login("admin@yourstore.com", "admin")
+    auth_session.login(driver)
     dashboard = DashboardPage(driver)
     yield driver, dashboard
 
@@ -31,21 +28,19 @@ def login_fixture(setup):
 class TestOrdersModule:
 
     @pytest.fixture(autouse=True)
-    def setup_orders(self, setup):
-        self.driver = setup
+    def setup_orders(self, login_fixture):
+        self.driver, _ = login_fixture
         self.orders_page = OrdersModule(self.driver)
-        self.driver.get("https://admin-demo.nopcommerce.com/login?ReturnUrl=%2Fadmin%2F")
-
-
-
-        # Login once before navigating to Products (demo admin creds)
-        from Selenium_Ecommerce.pages.LoginPage import LoginPage
-        login = LoginPage(self.driver)
-        login.login("admin@yourstore.com", "admin")
 
         self.orders_page.go_to_orders()
 
-
+    @allure.story("Navigate Dashboard → Sales → Orders")
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_navigate_to_orders_via_menu(self):
+        """The other tests open Orders by URL; this one covers the sidebar path."""
+        self.orders_page.open_admin_page("dashboard")
+        self.orders_page.go_to_orders(via_menu=True)
+        assert "Orders" in self.driver.title
 
     @pytest.mark.parametrize("order_id", ["1", "2", "4", "5"])
     @allure.story("Verify Order Status (Cancelled / Pending / Processing / Complete)")
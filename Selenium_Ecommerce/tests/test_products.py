@@ -8,7 +8,6 @@ import allure
 
 
 # Page imports
-from Selenium_Ecommerce.pages.LoginPage import LoginPage
 from Selenium_Ecommerce.pages.DashboardPage import DashboardPage
 from Selenium_Ecommerce.modules.ProductsModule import ProductsModule
 from Selenium_Ecommerce.utils.data_loader import load_test_data
@@ -22,11 +21,9 @@ from Selenium_Ecommerce.modules.BaseModule import BaseModule
 #  Login Fixture
 # ------------------------------------------------------------------------
 @pytest.fixture
-def login_fixture(setup):
+def login_fixture(setup, auth_session):
     driver = setup
-    login_page = LoginPage(driver)
-    driver.get("https://admin-demo.nopcommerce.com/login?ReturnUrl=%2Fadmin%2F")
-    login_page.login("admin@yourstore.com", "admin")
+    auth_session.login(driver)
     dashboard = DashboardPage(driver)
     assert "Dashboard" in dashboard.get_title()
     yield driver, dashboard
@@ -44,19 +41,21 @@ class TestProductsModule:
     """
 
     @pytest.fixture(autouse=True)
-    def setup_products(self, setup):
-        """Initialize ProductsPage"""
-        self.driver = setup
+    def setup_products(self, login_fixture):
+        """Initialize ProductsPage on an already logged-in Dashboard"""
+        self.driver, _ = login_fixture
         self.products_page = ProductsModule(self.driver)
-        self.driver.get("https://admin-demo.nopcommerce.com/login?ReturnUrl=%2Fadmin%2F")
-
-        # Login once before navigating to Products (demo admin creds)
-        from Selenium_Ecommerce.pages.LoginPage import LoginPage
-        login = LoginPage(self.driver)
-        login.login("admin@yourstore.com", "admin")
 
         self.products_page.go_to_products()
 
+    @allure.story("Navigate Dashboard → Catalog → Products")
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_navigate_to_products_via_menu(self):
+        """The other tests open Products by URL; this one covers the sidebar path."""
+        self.products_page.open_admin_page("dashboard")
+        self.products_page.go_to_products(via_menu=True)
+        assert "Products" in self.driver.title
+
     @pytest.mark.parametrize("case", load_test_data("Selenium_Ecommerce/utils/data/product_data.csv"))
     @allure.story("Search Products via File Data (CSV/XLSX/XML)")
     @allure.severity(allure.severity_level.CRITICAL)
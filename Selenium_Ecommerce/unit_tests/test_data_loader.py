@@ -0,0 +1,26 @@
+import os
+import time
+
+from Selenium_Ecommerce.utils import data_loader
+
+CUSTOMERS = "Selenium_Ecommerce/utils/data/customer_data.csv"
+
+
+def test_stale_lock_is_taken_over(tmp_path, monkeypatch):
+    """A lock left behind by a killed worker must not make every later load wait and skip the cache."""
+    monkeypatch.setattr(data_loader, "CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(data_loader, "_memory_cache", {})
+    stat = os.stat(CUSTOMERS)
+    key = (os.path.abspath(CUSTOMERS), stat.st_mtime_ns, stat.st_size,
+           data_loader._read_csv.__module__, data_loader._read_csv.__name__, None)
+    lock_file = data_loader._cache_path(key) + ".lock"
+    open(lock_file, "w").close()
+    an_hour_ago = time.time() - 3600
+    os.utime(lock_file, (an_hour_ago, an_hour_ago))
+
+    started = time.monotonic()
+    rows = data_loader.load_test_data(CUSTOMERS)
+
+    assert rows and time.monotonic() - started < 5
+    assert not os.path.exists(lock_file)
+    assert data_loader._read_cache_file(data_loader._cache_path(key)) is not None
@@ -0,0 +1,48 @@
+import threading
+import time
+
+from Selenium_Ecommerce.utils import driver_services
+
+
+class FakeGeckodriver:
+    started = []
+
+    def __init__(self, path):
+        self.path = path
+        self.running = False
+
+    def start(self):
+        time.sleep(0.01)  # spawning takes a moment, so callers overlap
+        self.running = True
+        FakeGeckodriver.started.append(self)
+
+    def shutdown(self):
+        self.running = False
+
+
+class FakeResolver:
+    def resolve(self, browser):
+        return "/usr/bin/geckodriver"
+
+
+def test_concurrent_firefox_launches_leak_no_spare(monkeypatch):
+    monkeypatch.setattr(driver_services, "PrestartedFirefoxService", FakeGeckodriver)
+    FakeGeckodriver.started = []
+    services = driver_services.DriverServices(FakeResolver())
+    handed_out = []
+
+    def launch():
+        for _ in range(5):
+            handed_out.append(services.service("firefox"))
+
+    # The test thread and the spare-browser filler launching Firefox side by side
+    threads = [threading.Thread(target=launch) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    services.close_all()
+
+    assert len({id(service) for service in handed_out}) == len(handed_out)
+    leaked = [s for s in FakeGeckodriver.started if s.running and s not in handed_out]
+    assert not leaked
@@ -0,0 +1,90 @@
+from types import SimpleNamespace
+
+from Selenium_Ecommerce.utils.duration_scheduler import LPTScheduling
+
+COLLECTION = [
+    "tests/test_a.py::TestSmall::test_1",
+    "tests/test_a.py::TestLarge::test_1",
+    "tests/test_a.py::TestLarge::test_2",
+    "tests/test_b.py::TestMedium::test_1",
+    "tests/test_b.py::test_function",
+]
+DURATIONS = {
+    "tests/test_a.py::TestSmall::test_1": 1.0,
+    "tests/test_a.py::TestLarge::test_1": 30.0,
+    "tests/test_a.py::TestLarge::test_2": 30.0,
+    "tests/test_b.py::TestMedium::test_1": 20.0,
+    "tests/test_b.py::test_function": 5.0,
+}
+
+
+class FakeNode:
+    def __init__(self, name):
+        self.gateway = SimpleNamespace(id=name)
+        self.shutting_down = False
+        self.sent = []
+
+    def send_runtest_some(self, indices):
+        self.sent.append([COLLECTION[i] for i in indices])
+
+    def shutdown(self):
+        self.shutting_down = True
+
+
+def scheduler(workers):
+    config = SimpleNamespace(getvalue=lambda name: [f"{workers}*popen"], hook=None)
+    sched = LPTScheduling(config, durations=DURATIONS)
+    nodes = [FakeNode(f"gw{n}") for n in range(workers)]
+    for node in nodes:
+        sched.add_node(node)
+        sched.add_node_collection(node, COLLECTION)
+    sched.schedule()
+    return sched, nodes
+
+
+def complete(sched, node, nodeid):
+    sched.mark_test_complete(node, COLLECTION.index(nodeid))
+
+
+def test_classes_are_handed_out_longest_first():
+    sched, (gw0, gw1) = scheduler(2)
+
+    # Whole classes, most expensive first; each worker gets one to start with
+    assert gw0.sent == [["tests/test_a.py::TestLarge::test_1", "tests/test_a.py::TestLarge::test_2"]]
+    # gw1's single test is its last, so it is topped up with the next group straight away
+    assert gw1.sent == [["tests/test_b.py::TestMedium::test_1"], ["tests/test_b.py::test_function"]]
+    assert [scope for scope, _ in sched.workqueue] == ["tests/test_a.py::TestSmall"]
+
+    # The first worker down to its last test gets the next group
+    complete(sched, gw0, "tests/test_a.py::TestLarge::test_1")
+    assert gw0.sent[-1] == ["tests/test_a.py::TestSmall::test_1"]
+    assert not sched.workqueue
+
+    # Nothing left to hand out: workers are shut down as they finish
+    complete(sched, gw1, "tests/test_b.py::TestMedium::test_1")
+    assert gw1.shutting_down
+    for nodeid in ("tests/test_a.py::TestLarge::test_2", "tests/test_a.py::TestSmall::test_1"):
+        complete(sched, gw0, nodeid)
+    complete(sched, gw1, "tests/test_b.py::test_function")
+    assert sched.tests_finished and not sched.has_pending
+
+
+def test_extra_workers_are_shut_down():
+    sched, nodes = scheduler(5)
+
+    assert len(sched.nodes) == 4
+    assert nodes[4].shutting_down and not nodes[4].sent
+
+
+def test_crashed_worker_tests_are_queued_first():
+    sched, (gw0, gw1) = scheduler(2)
+    complete(sched, gw0, "tests/test_a.py::TestLarge::test_1")
+
+    crashed = sched.remove_node(gw0)
+
+    assert crashed == "tests/test_a.py::TestLarge::test_2"
+    # gw1 still has its own work; the crashed worker's tests wait at the head of the queue
+    assert [unit for _, unit in sched.workqueue] == [
+        ["tests/test_a.py::TestLarge::test_2"], ["tests/test_a.py::TestSmall::test_1"]]
+    complete(sched, gw1, "tests/test_b.py::TestMedium::test_1")
+    assert gw1.sent[-1] == ["tests/test_a.py::TestLarge::test_2"]
@@ -0,0 +1,63 @@
+import os
+import threading
+import time
+
+from Selenium_Ecommerce.utils.file_lock import FileLock
+
+
+def make_stale(path, age=3600):
+    with open(path, "w") as f:
+        f.write("crashed-worker")
+    os.utime(path, (time.time() - age, time.time() - age))
+
+
+def test_waiting_outlasts_a_stale_lock():
+    lock = FileLock("unused.lock")
+
+    assert lock.timeout > lock.stale_after
+
+
+def test_stale_lock_is_taken_over_by_one_waiter_at_a_time(tmp_path, monkeypatch):
+    path = str(tmp_path / "driver-paths.json.lock")
+    make_stale(path)
+    getmtime = os.path.getmtime
+
+    def slow_getmtime(lock_file):
+        # Widen the gap between seeing the lock stale and removing it
+        mtime = getmtime(lock_file)
+        time.sleep(0.01)
+        return mtime
+
+    monkeypatch.setattr(os.path, "getmtime", slow_getmtime)
+    holders, overlaps = [], []
+    start = threading.Barrier(8)
+
+    def worker():
+        start.wait()
+        with FileLock(path, timeout=10, stale_after=1):
+            holders.append(1)
+            if len(holders) > 1:
+                overlaps.append(len(holders))
+            time.sleep(0.02)
+            holders.pop()
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not overlaps
+    assert not os.path.exists(path) and not os.path.exists(path + ".takeover")
+
+
+def test_owner_whose_lock_was_taken_over_leaves_the_new_lock(tmp_path):
+    path = str(tmp_path / "data.lock")
+    slow = FileLock(path, stale_after=1)
+    slow.__enter__()
+    os.utime(path, (time.time() - 10, time.time() - 10))
+
+    with FileLock(path, timeout=5, stale_after=1):
+        slow.__exit__(None, None, None)
+        assert os.path.exists(path)
+    assert not os.path.exists(path)
@@ -0,0 +1,91 @@
+import json
+
+pytest_plugins = ["pytester"]
+
+CONFTEST = """
+from Selenium_Ecommerce.utils.flaky_tracker import FlakyHistory, FlakyRerunPlugin
+
+
+def pytest_addoption(parser):
+    parser.addoption("--flaky-reruns", type=int, default=2)
+    parser.addoption("--lane", default="all")
+
+
+def pytest_configure(config):
+    config.cache.set(FlakyHistory.CACHE_KEY, {
+        "test_suite.py::TestDashboard::test_dashboard": "PRP",
+        "test_suite.py::TestFlakyLogin::test_first": "PFP",
+        "test_suite.py::TestOrders::test_bug": "PFF",
+    })
+    config.pluginmanager.register(FlakyRerunPlugin(config), "flaky-rerun")
+"""
+
+SUITE = """
+import pytest
+
+calls = {"dashboard": 0, "login": 0}
+browsers = []
+
+
+@pytest.fixture(scope="class")
+def browser():
+    browsers.append("up")
+    yield
+    browsers.append("down")
+
+
+@pytest.fixture(scope="class")
+def login():
+    calls["login"] += 1
+    if calls["login"] == 1:
+        raise TimeoutError("login page did not load")
+
+
+@pytest.mark.usefixtures("browser")
+class TestDashboard:
+    def test_dashboard(self):
+        calls["dashboard"] += 1
+        assert calls["dashboard"] > 1
+
+    def test_same_browser(self):
+        assert browsers == ["up"]
+
+
+@pytest.mark.usefixtures("login")
+class TestFlakyLogin:
+    def test_first(self):
+        pass
+
+
+class TestOrders:
+    def test_bug(self):
+        assert False
+
+    def test_after(self):
+        assert browsers == ["up", "down"]
+"""
+
+
+def test_history_flaky_tests_are_rerun_with_their_class_fixtures(pytester):
+    pytester.makeconftest(CONFTEST)
+    pytester.makepyfile(test_suite=SUITE)
+
+    result = pytester.runpytest("-p", "rerunfailures")
+
+    # A call flake and a class-setup flake are rerun; the real failure, with no flaky history, is not
+    assert result.parseoutcomes() == {"passed": 4, "failed": 1, "rerun": 2}
+    result.stdout.fnmatch_lines(["*Flaky reruns*", "*1 rerun(s)  passed  test_suite.py::TestDashboard::test_dashboard"])
+    history = json.loads((pytester.path / ".pytest_cache/v/selenium_ecommerce/flaky").read_text())
+    assert history["test_suite.py::TestDashboard::test_dashboard"] == "PRPR"
+    assert history["test_suite.py::TestFlakyLogin::test_first"] == "PFPR"
+    assert history["test_suite.py::TestOrders::test_bug"] == "PFFF"
+    assert history["test_suite.py::TestOrders::test_after"] == "P"
+
+
+def test_no_reruns_when_disabled(pytester):
+    pytester.makeconftest(CONFTEST)
+    pytester.makepyfile(test_suite=SUITE)
+
+    result = pytester.runpytest("-p", "rerunfailures", "--flaky-reruns", "0")
+
+    assert result.parseoutcomes() == {"passed": 2, "failed": 2, "errors": 1}
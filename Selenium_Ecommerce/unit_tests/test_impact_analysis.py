@@ -0,0 +1,92 @@
+# Framework unit tests (no browser): pytest Selenium_Ecommerce/unit_tests
+
+import pytest
+
+from Selenium_Ecommerce.pages.Keyword import Keywords
+from Selenium_Ecommerce.utils import impact_analysis, locators
+from Selenium_Ecommerce.utils.impact_analysis import changes_since, is_impacted
+
+SEARCH_PAGE = "Selenium_Ecommerce/pages/SearchCustomerPage.py"
+ROLES_DATA = "Selenium_Ecommerce/utils/data/rolescustomer_data.csv"
+SEARCH_TEST = {SEARCH_PAGE, ROLES_DATA, "Selenium_Ecommerce/tests/test_custsearch.py", "locator:customers.search_email"}
+LOGIN_TEST = {"Selenium_Ecommerce/pages/LoginPage.py", "Selenium_Ecommerce/utils/data/login_data.xml",
+              "Selenium_Ecommerce/tests/test_login.py"}
+
+
+@pytest.fixture
+def changed(monkeypatch):
+    """Make git report the given paths as changed since the ref."""
+    def set_changed(*paths):
+        def git(*args):
+            return "\n".join(paths) if args[0] == "diff" else ""
+        monkeypatch.setattr(impact_analysis, "_git", git)
+        return changes_since("HEAD")
+    return set_changed
+
+
+@pytest.mark.parametrize("path", ["Selenium_Ecommerce/requirements.txt", "Selenium_Ecommerce/conftest.py",
+                                  "Selenium_Ecommerce/utils/driver_factory.py"])
+def test_framework_change_runs_everything(changed, path):
+    changes = changed(path)
+    assert changes["run_all"] and path in changes["run_all"]
+    assert is_impacted(SEARCH_TEST, changes) and is_impacted(LOGIN_TEST, changes)
+
+
+def test_data_file_change_selects_its_tests(changed):
+    changes = changed(ROLES_DATA)
+    assert changes["run_all"] is None and changes["files"] == [ROLES_DATA]
+    assert is_impacted(SEARCH_TEST, changes)
+    assert not is_impacted(LOGIN_TEST, changes)
+
+
+def test_page_object_change_selects_its_tests(changed):
+    changes = changed(SEARCH_PAGE)
+    assert changes["run_all"] is None and changes["files"] == [SEARCH_PAGE]
+    assert is_impacted(SEARCH_TEST, changes)
+    assert not is_impacted(LOGIN_TEST, changes)
+
+
+def test_unrelated_change_selects_nothing(changed):
+    changes = changed("README.md")
+    assert not is_impacted(SEARCH_TEST, changes) and not is_impacted(LOGIN_TEST, changes)
+
+
+
+LOGIN_ERROR = "Login was unsuccessful. Please correct the errors and try again."
+
+
+class FakeElement:
+    """A hidden element whose commands return the login error text."""
+
+    text = LOGIN_ERROR
+
+    def __init__(self, driver):
+        self.parent = driver
+        self.id = "login-error"
+
+    def is_displayed(self):
+        return False
+
+
+class FakeDriver:
+    def find_element(self, by, value):
+        return FakeElement(self)
+
+    def find_elements(self, by, value):
+        return [FakeElement(self)]
+
+    def execute(self, command, params=None):
+        return {"value": LOGIN_ERROR}
+
+
+def test_page_object_lookups_record_their_locators():
+    impact_analysis.recorder.start("test")
+    try:
+        keywords = Keywords(FakeDriver())
+        assert keywords.verify_login_failed()
+        assert keywords.get_error_message() == LOGIN_ERROR
+        keywords.wait_for_element_invisible(locators.AJAX_BUSY)
+    finally:
+        impact_analysis.recorder.stop()
+
+    assert {"locator:login.error_any", "locator:layout.ajax_busy"} <= impact_analysis.recorder.take("test")
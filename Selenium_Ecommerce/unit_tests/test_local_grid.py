@@ -0,0 +1,102 @@
+import threading
+import time
+
+from Selenium_Ecommerce.utils.driver_pool import DriverPool
+from Selenium_Ecommerce.utils.local_grid import LocalGrid
+
+
+def test_more_clients_than_slots_take_turns_in_order():
+    grid = LocalGrid(slots={"chrome": 3}, queue_timeout=10)
+    running, peak, served = [], [], []
+    lock = threading.Lock()
+
+    def client(number):
+        time.sleep(number * 0.01)  # arrive in order
+        slot = grid.acquire("chrome")
+        assert slot is not None
+        with lock:
+            served.append(number)
+            running.append(slot)
+            peak.append(len(running))
+        grid.start_session(slot, f"session-{number}")
+        time.sleep(0.2)
+        with lock:
+            running.remove(slot)
+        grid.release(slot, f"session-{number}")
+
+    clients = [threading.Thread(target=client, args=(n,)) for n in range(8)]
+    for thread in clients:
+        thread.start()
+    for thread in clients:
+        thread.join()
+
+    assert max(peak) == 3
+    assert served == list(range(8))
+    stats = grid.stats()["chrome"]
+    assert stats["sessions"] == 8 and stats["queued_sessions"] == 5 and stats["peak_queue"] == 5
+    assert not grid.sessions
+
+
+def test_queued_request_times_out_while_every_slot_is_held():
+    grid = LocalGrid(slots={"chrome": 1}, queue_timeout=0.2)
+    grid.start_session(grid.acquire("chrome"), "held")
+
+    assert grid.acquire("chrome") is None
+
+
+def test_abandoned_session_frees_its_slot():
+    grid = LocalGrid(slots={"chrome": 1}, queue_timeout=5, session_timeout=0.1)
+    slot = grid.acquire("chrome")
+    grid.start_session(slot, "crashed-client")
+    grid.command_started(slot)
+    time.sleep(0.2)
+    assert grid.reap_abandoned() == 0  # a long-running command is not idleness
+
+    grid.command_finished(slot)
+    time.sleep(0.2)
+
+    assert grid.reap_abandoned() == 1
+    assert grid.acquire("chrome") is slot
+    assert grid.stats()["chrome"]["abandoned_sessions"] == 1
+
+
+def test_late_release_of_a_reaped_session_keeps_the_new_one():
+    grid = LocalGrid(slots={"chrome": 1}, queue_timeout=5, session_timeout=0)
+    slot = grid.acquire("chrome")
+    grid.start_session(slot, "old")
+    time.sleep(0.01)
+    grid.reap_abandoned()
+    grid.start_session(grid.acquire("chrome"), "new")
+
+    grid.release(slot, "old")
+
+    assert grid.sessions == {"new": slot}
+
+
+class FakeDriver:
+    current_url = "about:blank"
+
+    def __init__(self):
+        self.quit_called = False
+
+    def get(self, url):
+        pass
+
+    def execute_cdp_cmd(self, command, params):
+        pass
+
+    def quit(self):
+        self.quit_called = True
+
+
+def test_pool_frees_local_grid_slots_on_release():
+    pool = DriverPool(factory=lambda browser, headless, grid: FakeDriver(), spares=0, keep_grid_sessions=False)
+
+    grid_driver = pool.acquire("chrome", grid=True)
+    pool.release(grid_driver)
+    local_driver = pool.acquire("chrome")
+    pool.release(local_driver)
+
+    assert grid_driver.quit_called
+    assert not local_driver.quit_called
+    assert pool.acquire("chrome") is local_driver
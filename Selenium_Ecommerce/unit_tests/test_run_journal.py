@@ -0,0 +1,49 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from Selenium_Ecommerce.utils.run_journal import RunJournalPlugin
+
+
+def make_config(journal, resume=False):
+    options = {"--resume": resume, "--journal": str(journal), "--output-dir": None, "--lane": "all"}
+    return SimpleNamespace(getoption=options.get,
+                           option=SimpleNamespace(collectonly=False, allure_report_dir=None),
+                           invocation_params=SimpleNamespace(args=()))
+
+
+def write_journal(path, *entries):
+    path.write_text("".join(json.dumps(entry) + "\n" for entry in entries), encoding="utf-8")
+
+
+def test_new_run_does_not_overwrite_an_interrupted_journal(tmp_path):
+    journal = tmp_path / "run-journal.jsonl"
+    write_journal(journal, {"event": "start"}, {"nodeid": "tests/test_a.py::test_a", "outcome": "passed"})
+
+    with pytest.raises(pytest.UsageError, match="--resume"):
+        RunJournalPlugin(make_config(journal))
+
+    assert "tests/test_a.py::test_a" in journal.read_text(encoding="utf-8")
+
+
+def test_resume_appends_to_an_interrupted_journal(tmp_path):
+    journal = tmp_path / "run-journal.jsonl"
+    write_journal(journal, {"event": "start"}, {"nodeid": "tests/test_a.py::test_a", "outcome": "passed"})
+
+    plugin = RunJournalPlugin(make_config(journal, resume=True))
+    plugin.journal.close()
+
+    assert plugin.done == {"tests/test_a.py::test_a"}
+    assert [json.loads(line).get("event") for line in journal.read_text(encoding="utf-8").splitlines()] == \
+        ["start", None, "resume"]
+
+
+def test_new_run_replaces_a_finished_journal(tmp_path):
+    journal = tmp_path / "run-journal.jsonl"
+    write_journal(journal, {"event": "start"}, {"nodeid": "tests/test_a.py::test_a", "outcome": "passed"},
+                  {"event": "finish", "exitstatus": 0})
+
+    RunJournalPlugin(make_config(journal)).journal.close()
+
+    assert [json.loads(line)["event"] for line in journal.read_text(encoding="utf-8").splitlines()] == ["start"]
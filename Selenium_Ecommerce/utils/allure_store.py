@@ -0,0 +1,353 @@
+# Compact Allure result storage and incremental report generation:
+# python -m Selenium_Ecommerce.utils.allure_store compact Selenium_Ecommerce/Output/reports/allure-results
+# python -m Selenium_Ecommerce.utils.allure_store generate            (only suites whose results changed)
+# python -m Selenium_Ecommerce.utils.allure_store generate --full     (every suite)
+
+import argparse
+import glob
+import gzip
+import hashlib
+import html
+import json
+import os
+import shutil
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from Selenium_Ecommerce.utils.config import Config
+
+REPORTS_DIR = os.path.join(os.getcwd(), "Selenium_Ecommerce", "Output", "reports")
+
+# Keys that change on every run without the outcome changing
+VOLATILE_KEYS = {"start", "stop", "uuid", "children"}
+VOLATILE_LABELS = {"host", "thread"}
+# Allure history files that grow by one entry per generated report
+TREND_FILES = ("history-trend.json", "duration-trend.json", "categories-trend.json", "retry-trend.json")
+
+
+def iter_attachments(node):
+    """Every attachment dict of a result or container, including those of steps and fixtures."""
+    if isinstance(node, dict):
+        yield from node.get("attachments", [])
+        for key, value in node.items():
+            if key != "attachments" and isinstance(value, (dict, list)):
+                yield from iter_attachments(value)
+    elif isinstance(node, list):
+        for value in node:
+            yield from iter_attachments(value)
+
+
+def stable(node):
+    """A result without its timings, ids, host and thread, for change detection."""
+    if isinstance(node, dict):
+        result = {key: stable(value) for key, value in node.items() if key not in VOLATILE_KEYS}
+        if "labels" in result:
+            result["labels"] = [label for label in result["labels"] if label.get("name") not in VOLATILE_LABELS]
+        return result
+    if isinstance(node, list):
+        return [stable(value) for value in node]
+    return node
+
+
+def suite_of(result):
+    """The test module of a result; skipped results carry no labels, only the fullName."""
+    labels = {label["name"]: label["value"] for label in result.get("labels", [])}
+    if labels.get("suite"):
+        return labels["suite"]
+    modules = [part for part in result.get("fullName", "").split("#")[0].split(".") if part.startswith("test_")]
+    return modules[-1] if modules else "unknown"
+
+
+class AllureStore:
+    """
+    Keeps Allure results as one gzipped bundle per run instead of thousands
+    of loose *-result.json / *-container.json files, with attachments stored
+    once per content hash (blobs/) however many tests or runs attach them.
+
+    Runs beyond keep_runs or older than keep_days are pruned together with
+    the blobs only they referenced. Reports are generated per suite (test
+    module) and a suite is only regenerated when its latest results differ
+    from the ones its current report was built from.
+    """
+
+    def __init__(self, root=None, keep_runs=Config.ALLURE_KEEP_RUNS, keep_days=Config.ALLURE_KEEP_DAYS):
+        self.root = root or os.path.join(REPORTS_DIR, "allure-store")
+        self.keep_runs = keep_runs
+        self.keep_days = keep_days
+
+    @property
+    def runs_dir(self):
+        return os.path.join(self.root, "runs")
+
+    @property
+    def blobs_dir(self):
+        return os.path.join(self.root, "blobs")
+
+    def blob_path(self, name):
+        return os.path.join(self.blobs_dir, name[:2], name)
+
+    # -------------------------------------------------------------------
+    # Compaction
+    # -------------------------------------------------------------------
+    def compact(self, results_dir, remove=True):
+        """
+        Bundle every result, container and extra file (environment, categories,
+        executor) of results_dir into runs/<run id>.json.gz, moving attachments
+        into the blob store. Returns the run id, or None when there was nothing to store.
+        """
+        result_files = glob.glob(os.path.join(results_dir, "*-result.json"))
+        if not result_files:
+            return None
+        container_files = glob.glob(os.path.join(results_dir, "*-container.json"))
+        results = [self._load_json(path) for path in result_files]
+        containers = [self._load_json(path) for path in container_files]
+
+        blobs = {}
+        new_blobs = 0
+        for attachment in iter_attachments(results + containers):
+            source = attachment.get("source")
+            if source not in blobs:
+                path = os.path.join(results_dir, source or "")
+                if not source or not os.path.isfile(path):
+                    continue
+                blobs[source], added = self._store_blob(path)
+                new_blobs += added
+            attachment["source"] = blobs[source]
+
+        extras = {}
+        for name in ("environment.properties", "categories.json", "executor.json"):
+            path = os.path.join(results_dir, name)
+            if os.path.isfile(path):
+                with open(path, encoding="utf-8") as f:
+                    extras[name] = f.read()
+
+        run_id = time.strftime("%Y%m%d_%H%M%S") + f"-{os.getpid()}"
+        bundle = {"id": run_id, "created": time.time(), "results": results, "containers": containers,
+                  "extras": extras}
+        os.makedirs(self.runs_dir, exist_ok=True)
+        bundle_path = os.path.join(self.runs_dir, f"{run_id}.json.gz")
+        with gzip.open(bundle_path, "wt", encoding="utf-8") as f:
+            json.dump(bundle, f, separators=(",", ":"))
+
+        loose = result_files + container_files + [os.path.join(results_dir, s) for s in blobs]
+        if remove:
+            for path in loose + [os.path.join(results_dir, name) for name in extras]:
+                if os.path.exists(path):
+                    os.remove(path)
+        print(f" Allure run {run_id}: {len(loose)} files -> {os.path.getsize(bundle_path) / 1024:.0f} KB bundle, "
+              f"{len(blobs)} attachments ({len(blobs) - new_blobs} already stored)")
+        return run_id
+
+    def _store_blob(self, path):
+        """Copy an attachment into blobs/ under its content hash; returns (blob name, newly added)."""
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        name = digest.hexdigest() + os.path.splitext(path)[1]
+        target = self.blob_path(name)
+        if os.path.exists(target):
+            return name, 0
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        shutil.copyfile(path, target)
+        return name, 1
+
+    # -------------------------------------------------------------------
+    # Retention
+    # -------------------------------------------------------------------
+    def run_ids(self):
+        """Stored run ids, newest first."""
+        return sorted((os.path.basename(p)[:-len(".json.gz")]
+                       for p in glob.glob(os.path.join(self.runs_dir, "*.json.gz"))), reverse=True)
+
+    def load_run(self, run_id):
+        with gzip.open(os.path.join(self.runs_dir, f"{run_id}.json.gz"), "rt", encoding="utf-8") as f:
+            return json.load(f)
+
+    def prune(self):
+        """Drop runs outside the retention window, then blobs no remaining run refers to."""
+        cutoff = time.time() - self.keep_days * 86400
+        kept, removed = [], 0
+        for index, run_id in enumerate(self.run_ids()):
+            path = os.path.join(self.runs_dir, f"{run_id}.json.gz")
+            if index >= self.keep_runs or os.path.getmtime(path) < cutoff:
+                os.remove(path)
+                removed += 1
+            else:
+                kept.append(run_id)
+
+        referenced = set()
+        for run_id in kept:
+            run = self.load_run(run_id)
+            referenced.update(a["source"] for a in iter_attachments(run["results"] + run["containers"]))
+        orphans = [path for path in glob.glob(os.path.join(self.blobs_dir, "*", "*"))
+                   if os.path.basename(path) not in referenced]
+        for path in orphans:
+            os.remove(path)
+        if removed or orphans:
+            print(f" Allure store pruned: {removed} run(s), {len(orphans)} attachment(s)")
+        return removed, len(orphans)
+
+    # -------------------------------------------------------------------
+    # Report generation
+    # -------------------------------------------------------------------
+    def latest_suites(self):
+        """{suite: (run, results, containers)} from the newest run that contains each suite."""
+        suites = {}
+        for run_id in self.run_ids():
+            run = self.load_run(run_id)
+            by_suite = {}
+            for result in run["results"]:
+                by_suite.setdefault(suite_of(result), []).append(result)
+            for suite, results in by_suite.items():
+                if suite in suites:
+                    continue
+                uuids = {r["uuid"] for r in results}
+                containers = [c for c in run["containers"] if uuids.intersection(c.get("children", []))]
+                suites[suite] = (run, results, containers)
+        return suites
+
+    @staticmethod
+    def fingerprint(results):
+        canonical = sorted(json.dumps(stable(r), sort_keys=True) for r in results)
+        return hashlib.sha1("\n".join(canonical).encode("utf-8")).hexdigest()
+
+    def generate(self, report_dir=None, full=False, allure=None, workers=Config.ALLURE_GENERATE_WORKERS):
+        """
+        Build report_dir/suites/<suite>/ with the Allure CLI for every suite whose
+        results changed (all of them with full=True), then rewrite report_dir/index.html.
+        Returns the regenerated suite names.
+        """
+        report_dir = report_dir or os.path.join(REPORTS_DIR, "allure-report")
+        allure = allure or shutil.which("allure")
+        if not allure:
+            raise FileNotFoundError("Allure CLI not found on PATH")
+
+        state_path = os.path.join(report_dir, "suites.json")
+        state = self._load_json(state_path) if os.path.exists(state_path) else {}
+        suites = self.latest_suites()
+        changed = {suite: data for suite, data in suites.items()
+                   if full or state.get(suite, {}).get("fingerprint") != self.fingerprint(data[1])}
+
+        def build(suite):
+            run, results, containers = changed[suite]
+            out_dir = os.path.join(report_dir, "suites", suite)
+            work_dir = os.path.join(self.root, "work", suite)
+            self._materialize(run, results, containers, work_dir, history_from=os.path.join(out_dir, "history"))
+            started = time.perf_counter()
+            subprocess.run([allure, "generate", work_dir, "-o", out_dir, "--clean"],
+                           check=True, stdout=subprocess.DEVNULL)
+            shutil.rmtree(work_dir, ignore_errors=True)
+            print(f" Allure report for {suite} regenerated in {time.perf_counter() - started:.1f}s")
+            return suite
+
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            for suite in pool.map(build, sorted(changed)):
+                run, results, _ = changed[suite]
+                state[suite] = {"fingerprint": self.fingerprint(results), "run": run["id"],
+                                "statuses": self._statuses(results)}
+
+        for suite in set(state) - set(suites):
+            shutil.rmtree(os.path.join(report_dir, "suites", suite), ignore_errors=True)
+            del state[suite]
+        os.makedirs(report_dir, exist_ok=True)
+        with open(state_path, "w", encoding="utf-8") as f:
+            json.dump(state, f, indent=2)
+        self._write_index(report_dir, state)
+        print(f" Allure report: {len(changed)} of {len(suites)} suite(s) regenerated -> {report_dir}")
+        return sorted(changed)
+
+    def _materialize(self, run, results, containers, work_dir, history_from):
+        """Lay one suite out as a regular allure-results folder (attachments hard-linked from blobs/)."""
+        shutil.rmtree(work_dir, ignore_errors=True)
+        os.makedirs(work_dir)
+        for kind, items in (("result", results), ("container", containers)):
+            for item in items:
+                with open(os.path.join(work_dir, f"{item['uuid']}-{kind}.json"), "w", encoding="utf-8") as f:
+                    json.dump(item, f)
+        for source in {a["source"] for a in iter_attachments(results + containers)}:
+            target = os.path.join(work_dir, source)
+            try:
+                os.link(self.blob_path(source), target)
+            except OSError:
+                shutil.copyfile(self.blob_path(source), target)
+        for name, text in run.get("extras", {}).items():
+            with open(os.path.join(work_dir, name), "w", encoding="utf-8") as f:
+                f.write(text)
+        if os.path.isdir(history_from):
+            self._copy_history(history_from, os.path.join(work_dir, "history"))
+
+    def _copy_history(self, source, target):
+        """Carry the suite's Allure history into the next report, trimmed to the retention window."""
+        shutil.copytree(source, target)
+        for name in TREND_FILES:
+            path = os.path.join(target, name)
+            if os.path.exists(path):
+                self._dump_json(path, self._load_json(path)[:self.keep_runs])
+        path = os.path.join(target, "history.json")
+        if os.path.exists(path):
+            history = self._load_json(path)
+            for entry in history.values():
+                entry["items"] = entry.get("items", [])[:self.keep_runs]
+            self._dump_json(path, history)
+
+    @staticmethod
+    def _statuses(results):
+        statuses = {}
+        for result in results:
+            statuses[result.get("status", "unknown")] = statuses.get(result.get("status", "unknown"), 0) + 1
+        return statuses
+
+    @staticmethod
+    def _write_index(report_dir, state):
+        rows = "".join(
+            f"<tr><td><a href='suites/{html.escape(suite)}/index.html'>{html.escape(suite)}</a></td>"
+            f"<td>{sum(info['statuses'].values())}</td>"
+            f"<td>{', '.join(f'{k}: {v}' for k, v in sorted(info['statuses'].items()))}</td>"
+            f"<td>{html.escape(info['run'])}</td></tr>"
+            for suite, info in sorted(state.items()))
+        with open(os.path.join(report_dir, "index.html"), "w", encoding="utf-8") as f:
+            f.write("<!DOCTYPE html><html><head><meta charset='utf-8'><title>Allure reports</title>"
+                    "<style>body{font-family:sans-serif}td,th{padding:4px 12px;text-align:left}</style></head>"
+                    "<body><h1>Allure reports by suite</h1><table><tr><th>Suite</th><th>Tests</th>"
+                    f"<th>Statuses</th><th>Run</th></tr>{rows}</table></body></html>")
+
+    @staticmethod
+    def _load_json(path):
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+
+    @staticmethod
+    def _dump_json(path, data):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compact Allure results and generate reports incrementally")
+    parser.add_argument("--store", default=None, help="Store folder (default: Output/reports/allure-store)")
+    parser.add_argument("--keep-runs", type=int, default=Config.ALLURE_KEEP_RUNS)
+    parser.add_argument("--keep-days", type=int, default=Config.ALLURE_KEEP_DAYS)
+    commands = parser.add_subparsers(dest="command", required=True)
+    compact = commands.add_parser("compact", help="Bundle an allure-results folder into the store")
+    compact.add_argument("results_dir")
+    compact.add_argument("--keep-files", action="store_true", help="Leave the loose result files in place")
+    generate = commands.add_parser("generate", help="Regenerate the reports of changed suites")
+    generate.add_argument("-o", "--report-dir", default=None)
+    generate.add_argument("--full", action="store_true", help="Regenerate every suite")
+    commands.add_parser("prune", help="Apply the retention window")
+    args = parser.parse_args(argv)
+
+    store = AllureStore(args.store, keep_runs=args.keep_runs, keep_days=args.keep_days)
+    if args.command == "compact":
+        store.compact(args.results_dir, remove=not args.keep_files)
+        store.prune()
+    elif args.command == "generate":
+        store.generate(args.report_dir, full=args.full)
+    else:
+        store.prune()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+import json
+import os
+import threading
+from urllib.parse import urlparse
+
+from selenium.common.exceptions import WebDriverException
+
+from Selenium_Ecommerce.pages.LoginPage import LoginPage
+from Selenium_Ecommerce.utils.config import Config
+
+
+class AuthSessionCache:
+    """
+    Logs in through the nopCommerce login form once per worker, keeps the
+    resulting auth cookies and replays them into later browser sessions
+    so they open /admin/ directly instead of filling in the form again.
+
+    The form login is repeated only when the server rejects the cookies.
+    With a cookie_file, the cookies are also shared between processes (the
+    xdist workers of a browser matrix group), so one form login serves them all.
+    """
+
+    AUTH_COOKIE = ".Nop.Authentication"
+
+    def __init__(self, username=Config.ADMIN_USERNAME, password=Config.ADMIN_PASSWORD, cookie_file=None):
+        self.username = username
+        self.password = password
+        self.cookie_file = cookie_file
+        self.form_logins = 0
+        self.cookie_logins = 0
+        self._cookies = None
+        self._lock = threading.Lock()
+
+    # -------------------------------------------------------------------
+    # Public API
+    # -------------------------------------------------------------------
+    def login(self, driver):
+        """Make sure the driver is logged in as admin and sitting on the Dashboard."""
+        with self._lock:
+            cookies = self._cookies or self._read_cookie_file()
+
+        if cookies and self._login_with_cookies(driver, cookies):
+            self.cookie_logins += 1
+            print(" Logged in from cached admin session cookies.")
+            return True
+
+        if cookies:
+            print(" Cached admin session was rejected — logging in through the form again.")
+            self.invalidate()
+
+        return self._login_with_form(driver)
+
+    def invalidate(self):
+        """Forget the cached cookies so the next login uses the form."""
+        with self._lock:
+            self._cookies = None
+            if self.cookie_file:
+                try:
+                    os.remove(self.cookie_file)
+                except OSError:
+                    pass  # another worker got there first
+
+    # -------------------------------------------------------------------
+    # Helpers
+    # -------------------------------------------------------------------
+    def _login_with_form(self, driver):
+        driver.get(Config.LOGIN_URL)
+        if LoginPage(driver).login(self.username, self.password) != "success":
+            return False
+
+        self.form_logins += 1
+        cookies = driver.get_cookies()
+        if not any(c["name"] == self.AUTH_COOKIE for c in cookies):
+            print(f" {self.AUTH_COOKIE} cookie not found — session will not be cached.")
+            return True
+
+        with self._lock:
+            self._cookies = cookies
+            self._write_cookie_file(cookies)
+        return True
+
+    def _read_cookie_file(self):
+        if not self.cookie_file or not os.path.exists(self.cookie_file):
+            return None
+        try:
+            with open(self.cookie_file, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None  # removed or half-written by another worker
+
+    def _write_cookie_file(self, cookies):
+        if not self.cookie_file:
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self.cookie_file)), exist_ok=True)
+        temp_path = f"{self.cookie_file}.{os.getpid()}"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(cookies, f)
+        os.replace(temp_path, self.cookie_file)
+
+    def _login_with_cookies(self, driver, cookies):
+        try:
+            self._add_cookies(driver, cookies)
+            driver.get(Config.ADMIN_URL)
+            return self._on_dashboard(driver)
+        except WebDriverException as e:
+            print(f" Could not restore admin session cookies: {e}")
+            return False
+
+    @staticmethod
+    def _add_cookies(driver, cookies):
+        """
+        Chromium accepts cookies for any domain over CDP, so no page load is needed.
+        Other browsers only accept cookies for the page they are on, so load a
+        lightweight resource from the site first.
+        """
+        try:
+            driver.execute_cdp_cmd("Network.setCookies", {"cookies": [_to_cdp_cookie(c) for c in cookies]})
+            return
+        except (AttributeError, WebDriverException):
+            pass
+
+        driver.get(Config.BASE_URL + "favicon.ico")
+        for cookie in cookies:
+            driver.add_cookie({k: v for k, v in cookie.items() if k != "sameSite" or v in ("Strict", "Lax", "None")})
+
+    @staticmethod
+    def _on_dashboard(driver):
+        path = urlparse(driver.current_url).path.rstrip("/").lower()
+        return path == "/admin" and "Dashboard" in driver.title
+
+
+def _to_cdp_cookie(cookie):
+    """Convert a WebDriver cookie dict into a CDP Network.CookieParam."""
+    param = {
+        "name": cookie["name"],
+        "value": cookie["value"],
+        "domain": cookie.get("domain") or urlparse(Config.BASE_URL).hostname,
+        "path": cookie.get("path", "/"),
+        "secure": cookie.get("secure", False),
+        "httpOnly": cookie.get("httpOnly", False),
+    }
+    if "expiry" in cookie:
+        param["expires"] = cookie["expiry"]
+    if cookie.get("sameSite") in ("Strict", "Lax", "None"):
+        param["sameSite"] = cookie["sameSite"]
+    return param
@@ -0,0 +1,140 @@
+import json
+import os
+import platform
+import subprocess
+import time
+from collections import OrderedDict
+
+
+def percentile(values, pct):
+    """Linear-interpolated percentile (pct in 0..100) of a non-empty list."""
+    ordered = sorted(values)
+    if len(ordered) == 1:
+        return ordered[0]
+    rank = (len(ordered) - 1) * pct / 100.0
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def git_revision():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=10)
+        return out.stdout.strip() or "unknown"
+    except (OSError, subprocess.SubprocessError):
+        return "unknown"
+
+
+class BenchmarkRecorder:
+    """
+    Runs framework operations N times and keeps their wall-clock durations.
+
+    Results are saved as JSON (with commit, target and iteration count) so
+    runs can be compared across commits, and checked against a stored
+    baseline: a benchmark regresses when its p50 is more than `threshold`
+    (fraction) and more than `min_delta` seconds slower than the baseline p50.
+    """
+
+    def __init__(self, iterations=5, warmup=1, threshold=0.2, min_delta=0.05, target="unknown"):
+        self.iterations = iterations
+        self.warmup = warmup
+        self.threshold = threshold
+        self.min_delta = min_delta
+        self.target = target
+        self.results = OrderedDict()
+
+    # -------------------------------------------------------------------
+    # Measuring
+    # -------------------------------------------------------------------
+    def measure(self, name, action, setup=None, teardown=None, iterations=None):
+        """
+        Time action() `iterations` times after `warmup` untimed runs.
+        setup() / teardown() run around every iteration and are not timed.
+        Returns the stats of the benchmark.
+        """
+        iterations = iterations or self.iterations
+        durations = []
+
+        for i in range(self.warmup + iterations):
+            if setup:
+                setup()
+            start = time.perf_counter()
+            try:
+                action()
+            finally:
+                elapsed = time.perf_counter() - start
+                if teardown:
+                    teardown()
+            if i >= self.warmup:
+                durations.append(elapsed)
+
+        self.results[name] = durations
+        stats = self.stats(name)
+        print(f" [bench] {name}: p50 {stats['p50']:.3f}s  p95 {stats['p95']:.3f}s  max {stats['max']:.3f}s")
+        return stats
+
+    def stats(self, name):
+        durations = self.results[name]
+        return {"n": len(durations),
+                "p50": round(percentile(durations, 50), 4),
+                "p95": round(percentile(durations, 95), 4),
+                "max": round(max(durations), 4),
+                "mean": round(sum(durations) / len(durations), 4)}
+
+    # -------------------------------------------------------------------
+    # Persistence
+    # -------------------------------------------------------------------
+    def to_dict(self):
+        return {
+            "meta": {"commit": git_revision(), "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+                     "target": self.target, "iterations": self.iterations, "warmup": self.warmup,
+                     "python": platform.python_version(), "platform": platform.platform()},
+            "results": {name: self.stats(name) for name in self.results},
+        }
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+        return path
+
+    @staticmethod
+    def load(path):
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+
+    # -------------------------------------------------------------------
+    # Comparison
+    # -------------------------------------------------------------------
+    def compare(self, baseline):
+        """
+        Compare this run with a saved baseline dict.
+        Returns rows of {name, baseline, current, change, regressed} for benchmarks in both.
+        """
+        rows = []
+        for name, old in baseline.get("results", {}).items():
+            if name not in self.results:
+                continue
+            current = self.stats(name)["p50"]
+            change = (current - old["p50"]) / old["p50"] if old["p50"] else 0.0
+            regressed = change > self.threshold and current - old["p50"] > self.min_delta
+            rows.append({"name": name, "baseline": old["p50"], "current": current,
+                         "change": round(change, 4), "regressed": regressed})
+        return rows
+
+    def format_report(self, comparison=None, baseline_meta=None):
+        lines = [f"Benchmarks: {len(self.results)} x {self.iterations} iterations against {self.target}",
+                 f"  {'benchmark':<40} {'p50':>8} {'p95':>8} {'max':>8}"]
+        for name in self.results:
+            s = self.stats(name)
+            lines.append(f"  {name:<40} {s['p50']:8.3f} {s['p95']:8.3f} {s['max']:8.3f}")
+
+        if comparison:
+            meta = baseline_meta or {}
+            lines.append(f"Compared with baseline {meta.get('commit', '?')} ({meta.get('created', '?')}), "
+                         f"threshold +{self.threshold:.0%} on p50:")
+            for row in comparison:
+                flag = "  <-- REGRESSION" if row["regressed"] else ""
+                lines.append(f"  {row['name']:<40} {row['baseline']:8.3f} -> {row['current']:8.3f} "
+                             f"({row['change']:+.1%}){flag}")
+        return "\n".join(lines)
@@ -0,0 +1,191 @@
+# Cross-browser matrix: one pytest + xdist worker group per browser, all running at once.
+# python -m Selenium_Ecommerce.utils.browser_matrix --browsers chrome,firefox,edge -n 2 -- Selenium_Ecommerce/tests --headless
+# Everything after "--" is passed to every group's pytest (e.g. --alluredir: all groups write one Allure report).
+
+import argparse
+import html
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+
+from Selenium_Ecommerce.utils.driver_services import driver_services
+
+OUTPUT_DIR = os.path.join(os.getcwd(), "Selenium_Ecommerce", "Output", "matrix")
+
+
+def matrix_key(classname, name, browser):
+    """Test id without its browser, so one test's results line up across browsers."""
+    name = re.sub(rf"\[{re.escape(browser)}(?:-|(?=\]))", "[", name).replace("[]", "")
+    return f"{classname}::{name}"
+
+
+class BrowserMatrix:
+    """
+    Runs the suite once per browser, each browser in its own pytest process
+    with its own xdist workers, all groups at the same time. Within a group
+    the driver binary is resolved once up front (shared file cache) and the
+    admin login cookies are shared by its workers (--auth-cookie-file).
+
+    Afterwards the groups' JUnit results are merged into one table with an
+    outcome and duration column per browser (matrix.json / matrix-report.html).
+    """
+
+    def __init__(self, browsers, workers="auto", pytest_args=(), output_dir=OUTPUT_DIR):
+        self.browsers = browsers
+        self.workers = workers
+        self.pytest_args = list(pytest_args)
+        self.output_dir = output_dir
+        self.groups = {}
+
+    def group_dir(self, browser):
+        return os.path.join(self.output_dir, browser)
+
+    def command(self, browser):
+        group_dir = self.group_dir(browser)
+        return [sys.executable, "-m", "pytest", *self.pytest_args,
+                "--browser", browser, "-n", str(self.workers),
+                "--junitxml", os.path.join(group_dir, "junit.xml"),
+                # Pool stats, resource timelines, screenshots, profiles and journal per group:
+                # every group's workers are called gw0..gwN and would overwrite each other's files
+                "--output-dir", group_dir,
+                "--auth-cookie-file", os.path.join(group_dir, "auth-cookies.json")]
+
+    # -------------------------------------------------------------------
+    # Run
+    # -------------------------------------------------------------------
+    def prepare(self):
+        """Resolve every browser's driver once, in parallel, before the workers start."""
+        if "--grid" in self.pytest_args:
+            return
+        with ThreadPoolExecutor(max_workers=len(self.browsers)) as pool:
+            for browser, error in zip(self.browsers, pool.map(self._resolve, self.browsers)):
+                if error:
+                    print(f" {browser}: driver not resolved up front ({error}); its workers will retry")
+
+    @staticmethod
+    def _resolve(browser):
+        try:
+            driver_services.resolver.resolve(browser)
+        except Exception as e:
+            return e
+        return None
+
+    def run(self):
+        self.prepare()
+        started = time.perf_counter()
+        processes = {}
+        for browser in self.browsers:
+            os.makedirs(self.group_dir(browser), exist_ok=True)
+            for stale in ("junit.xml", "auth-cookies.json"):
+                if os.path.exists(os.path.join(self.group_dir(browser), stale)):
+                    os.remove(os.path.join(self.group_dir(browser), stale))
+            log = open(os.path.join(self.group_dir(browser), "pytest.log"), "w", encoding="utf-8")
+            processes[browser] = (subprocess.Popen(self.command(browser), stdout=log, stderr=subprocess.STDOUT), log)
+            self.groups[browser] = {"started": time.perf_counter()}
+            print(f" {browser}: started with -n {self.workers} (log: {log.name})")
+
+        while processes:
+            for browser, (process, log) in list(processes.items()):
+                if process.poll() is None:
+                    continue
+                log.close()
+                group = self.groups[browser]
+                group["exit_code"] = process.returncode
+                group["wall_seconds"] = round(time.perf_counter() - group["started"], 1)
+                print(f" {browser}: finished in {group['wall_seconds']:.1f}s, {self._last_line(log.name)}")
+                del processes[browser]
+            time.sleep(0.5)
+
+        wall = time.perf_counter() - started
+        slowest = max(g["wall_seconds"] for g in self.groups.values())
+        print(f" Matrix finished in {wall:.1f}s (slowest browser group: {slowest:.1f}s, "
+              f"sequential would be ~{sum(g['wall_seconds'] for g in self.groups.values()):.1f}s)")
+        return max(g["exit_code"] for g in self.groups.values())
+
+    @staticmethod
+    def _last_line(log_path):
+        with open(log_path, encoding="utf-8", errors="replace") as f:
+            lines = [line.strip(" =\n") for line in f if line.strip(" =\n")]
+        return lines[-1] if lines else "no output"
+
+    # -------------------------------------------------------------------
+    # Merged report
+    # -------------------------------------------------------------------
+    def merge(self):
+        """{test key: {browser: {"outcome", "seconds"}}} from every group's JUnit XML."""
+        tests = {}
+        for browser in self.browsers:
+            path = os.path.join(self.group_dir(browser), "junit.xml")
+            if not os.path.exists(path):
+                continue
+            for case in ET.parse(path).getroot().iter("testcase"):
+                outcome = "passed"
+                for tag in ("failure", "error", "skipped"):
+                    if case.find(tag) is not None:
+                        outcome = {"failure": "failed"}.get(tag, tag)
+                key = matrix_key(case.get("classname", ""), case.get("name", ""), browser)
+                tests.setdefault(key, {})[browser] = {"outcome": outcome, "seconds": float(case.get("time", 0))}
+        return tests
+
+    def write_report(self, tests):
+        os.makedirs(self.output_dir, exist_ok=True)
+        summary = {browser: {"wall_seconds": group.get("wall_seconds"), "exit_code": group.get("exit_code"),
+                             "test_seconds": round(sum(t[browser]["seconds"] for t in tests.values()
+                                                       if browser in t), 1)}
+                   for browser, group in self.groups.items()}
+        with open(os.path.join(self.output_dir, "matrix.json"), "w", encoding="utf-8") as f:
+            json.dump({"browsers": summary, "tests": tests}, f, indent=2)
+
+        head = "".join(f"<th>{html.escape(b)}</th><th>{html.escape(b)} s</th>" for b in self.browsers)
+        rows = []
+        for key, results in sorted(tests.items()):
+            cells = ""
+            for browser in self.browsers:
+                result = results.get(browser)
+                if result is None:
+                    cells += "<td>-</td><td></td>"
+                else:
+                    cells += (f"<td class='{result['outcome']}'>{result['outcome']}</td>"
+                              f"<td>{result['seconds']:.2f}</td>")
+            rows.append(f"<tr><td>{html.escape(key)}</td>{cells}</tr>")
+        totals = "".join(f"<td>wall {summary[b]['wall_seconds']}s</td><td>{summary[b]['test_seconds']:.1f}</td>"
+                         for b in self.browsers)
+        path = os.path.join(self.output_dir, "matrix-report.html")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("<!DOCTYPE html><html><head><meta charset='utf-8'><title>Browser matrix</title>"
+                    "<style>body{font-family:sans-serif}td,th{padding:3px 10px;text-align:left}"
+                    ".passed{color:green}.failed,.error{color:red}.skipped{color:gray}</style></head>"
+                    f"<body><h1>Browser matrix</h1><table><tr><th>Test</th>{head}</tr>{''.join(rows)}"
+                    f"<tr><th>Total</th>{totals}</tr></table></body></html>")
+        print(f" Matrix report: {path}")
+        return path
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    pytest_args = argv[argv.index("--") + 1:] if "--" in argv else []
+    argv = argv[:argv.index("--")] if "--" in argv else argv
+
+    parser = argparse.ArgumentParser(description="Run the suite on several browsers at once, "
+                                                 "one xdist worker group per browser")
+    parser.add_argument("--browsers", default="chrome,firefox,edge")
+    parser.add_argument("-n", "--workers", default=None,
+                        help="xdist workers per browser group (default: CPU cores / browsers)")
+    parser.add_argument("--output-dir", default=OUTPUT_DIR)
+    args = parser.parse_args(argv)
+
+    browsers = [b.strip().lower() for b in args.browsers.split(",") if b.strip()]
+    workers = args.workers or max(1, (os.cpu_count() or 1) // len(browsers))
+    matrix = BrowserMatrix(browsers, workers, pytest_args or ["Selenium_Ecommerce/tests"], args.output_dir)
+    exit_code = matrix.run()
+    matrix.write_report(matrix.merge())
+    raise SystemExit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
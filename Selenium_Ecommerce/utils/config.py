@@ -1,4 +1,102 @@
+import os
+
+
 class Config:
-    BASE_URL = "https://admin-demo.nopcommerce.com/"
+    # Public demo the suite was written against; NOP_BASE_URL or --site-url / --mock-server override it
+    DEMO_URL = "https://admin-demo.nopcommerce.com/"
+    BASE_URL = os.getenv("NOP_BASE_URL", DEMO_URL).rstrip("/") + "/"
     ADMIN_USERNAME = "admin@yourstore.com"
     ADMIN_PASSWORD = "admin"
+
+    LOGIN_URL = BASE_URL + "login?ReturnUrl=%2Fadmin%2F"
+    ADMIN_URL = BASE_URL + "admin/"
+
+    # Admin pages that can be opened by URL: name -> (path, title fragment)
+    ADMIN_ROUTES = {
+        "dashboard": ("Admin", "Dashboard"),
+        "orders": ("Admin/Order/List", "Orders"),
+        "products": ("Admin/Product/List", "Products"),
+        "categories": ("Admin/Category/List", "Categories"),
+        "manufacturers": ("Admin/Manufacturer/List", "Manufacturers"),
+        "customers": ("Admin/Customer/List", "Customers"),
+        "customer_create": ("Admin/Customer/Create", "Add a new customer"),
+    }
+
+    # "direct" opens admin pages by URL, "menu" clicks through the sidebar
+    NAVIGATION = "direct"
+
+    # Selenium Grid hub used when pytest is run with --grid
+    GRID_URL = "http://localhost:4444/wd/hub"
+
+    # --local-grid: browsers the in-process hub runs at once per browser, seconds a
+    # session request may wait for a slot, seconds a proxied command may take, and
+    # seconds without a command after which a session is closed (its client is gone)
+    LOCAL_GRID_SLOTS = {"chrome": 4, "firefox": 2, "edge": 2}
+    GRID_QUEUE_TIMEOUT = 300
+    GRID_COMMAND_TIMEOUT = 120
+    GRID_SESSION_TIMEOUT = 300
+
+    # A pooled browser is quit and relaunched after this many checkouts
+    DRIVER_MAX_USES = 20
+
+    # Idle browsers each worker keeps pre-launched to replace recycled / crashed ones
+    DRIVER_SPARES = 1
+
+    # --resource-aware: lean browser profiles, a per-browser memory budget (recycled
+    # above it), launches held while free memory is below estimate + reserve
+    LEAN_BROWSERS = False
+    BROWSER_MEMORY_BUDGET_MB = 1024
+    BROWSER_MEMORY_ESTIMATE_MB = 600
+    MEMORY_RESERVE_MB = 1024
+    RESOURCE_SAMPLE_SECONDS = 2.0
+    # Chrome keeps shared memory in /dev/shm (instead of --disable-dev-shm-usage's
+    # disk-backed files) when lean and at least this much of it is free
+    DEV_SHM_MIN_FREE_MB = 1024
+
+    # Driver binaries: pinned paths skip webdriver-manager entirely; otherwise a
+    # resolved path is shared by all xdist workers and re-checked after DRIVER_CACHE_HOURS.
+    # Offline mode never calls webdriver-manager (cached, pinned or PATH driver only).
+    DRIVER_PATHS = {browser: path for browser, path in (("chrome", os.getenv("CHROMEDRIVER_PATH")),
+                                                        ("firefox", os.getenv("GECKODRIVER_PATH")),
+                                                        ("edge", os.getenv("EDGEDRIVER_PATH"))) if path}
+    DRIVER_OFFLINE = os.getenv("DRIVER_OFFLINE", "") == "1"
+    DRIVER_CACHE_HOURS = 24
+
+    # Test data seeded over HTTP (utils/data_seeder.py): concurrent form posts
+    # (one session per posting thread), seconds before a post is given up
+    SEED_WORKERS = 16
+    SEED_TIMEOUT = 30
+
+    # Allure store (--allure-compact): compacted runs kept (and for how many days),
+    # and how many suite reports the Allure CLI generates at once
+    ALLURE_KEEP_RUNS = 20
+    ALLURE_KEEP_DAYS = 30
+    ALLURE_GENERATE_WORKERS = 4
+
+    # Local Chrome only: follow XHR/fetch traffic over CDP (--cdp-network) and
+    # block third-party / heavy assets (--block-assets)
+    NETWORK_TRACKING = False
+    BLOCK_ASSETS = False
+    BLOCKED_URL_PATTERNS = [
+        # analytics and tag managers
+        "*google-analytics.com/*", "*googletagmanager.com/*", "*doubleclick.net/*",
+        "*facebook.net/*", "*hotjar.com/*", "*clarity.ms/*",
+        # web fonts
+        "*fonts.googleapis.com/*", "*fonts.gstatic.com/*", "*.woff*", "*.ttf*", "*.otf*",
+        # images
+        "*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*", "*.svg*", "*.ico*",
+    ]
+
+    @classmethod
+    def set_base_url(cls, base_url):
+        """Point the whole suite at another nopCommerce instance, e.g. the local mock server."""
+        cls.BASE_URL = base_url.rstrip("/") + "/"
+        cls.LOGIN_URL = cls.BASE_URL + "login?ReturnUrl=%2Fadmin%2F"
+        cls.ADMIN_URL = cls.BASE_URL + "admin/"
+
+    @classmethod
+    def site_url(cls, url):
+        """Map an absolute URL of the public demo (e.g. from keyword.xlsx) onto BASE_URL."""
+        if url.startswith(cls.DEMO_URL.rstrip("/")):
+            return cls.BASE_URL + url[len(cls.DEMO_URL.rstrip("/")):].lstrip("/")
+        return url
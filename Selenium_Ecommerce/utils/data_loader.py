@@ -1,48 +1,179 @@
 import os
 import csv
+import hashlib
+import itertools
+import pickle
+import sys
 import xml.etree.ElementTree as ET
 import openpyxl
 
+from Selenium_Ecommerce.utils.file_lock import FileLock
+from Selenium_Ecommerce.utils.impact_analysis import recorder as impact
 
-def load_test_data(file_path):
+
+# Parsed data is shared between modules and xdist workers through this folder
+CACHE_DIR = os.getenv("TEST_DATA_CACHE_DIR", os.path.join(os.getcwd(), ".pytest_cache", "test-data"))
+
+# Parsed files already loaded by this process: {(path, mtime_ns, size, parser): result}
+_memory_cache = {}
+
+# (index, count) set from --data-shard; index is 1-based. None = all rows.
+DATA_SHARD = None
+
+
+def parse_shard(value):
+    """Parse an 'i/n' shard spec (1 <= i <= n) into (i, n)."""
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise ValueError(f"Invalid data shard '{value}', expected i/n (e.g. 2/4)")
+    if not 1 <= index <= count:
+        raise ValueError(f"Invalid data shard '{value}': i must be between 1 and n")
+    return index, count
+
+
+def configure_shard(shard):
+    """Select the data shard every later load_test_data / iter_test_data call uses."""
+    global DATA_SHARD
+    DATA_SHARD = parse_shard(shard) if isinstance(shard, str) else shard
+
+
+def _select(rows, start=0, stop=None, shard=None):
+    """Apply a row slice and then keep only every n-th row of the shard."""
+    rows = itertools.islice(rows, start, stop)
+    if shard:
+        index, count = shard
+        rows = (row for n, row in enumerate(rows) if n % count == index - 1)
+    return rows
+
+
+def load_test_data(file_path, shard=None):
     """
     Load test data from CSV, Excel (.xlsx/.xls), or XML file.
     Returns a list of dictionaries for use in @pytest.mark.parametrize.
+
+    Each file is parsed once; the result is cached in memory and on disk
+    (keyed by path + modification time + size) so other test modules and
+    xdist workers reuse it instead of parsing again.
+    Only rows of the active data shard (--data-shard) are returned.
+    """
+    reader = _reader_for(file_path, _read_csv, _read_excel, _read_xml)
+    # Hand out copies so a test mutating its case cannot affect another module
+    rows = _select(cached_parse(file_path, reader), shard=shard or DATA_SHARD)
+    rows = [dict(row) for row in rows]
+    impact.touch_rows(file_path, rows)
+    return rows
+
+
+def cached_parse(file_path, parser, cache_tag=None):
     """
+    Return parser(file_path), parsing the file only once for all modules and
+    workers. The (picklable) result is cached in memory and on disk, keyed by
+    path + modification time + size + parser (+ cache_tag, which callers
+    change when the parser's own rules change).
+    """
+    if not os.path.exists(file_path):
+        # Let the parser raise its usual error
+        return parser(file_path)
+
+    stat = os.stat(file_path)
+    impact.touch_file(file_path)
+    key = (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size, parser.__module__, parser.__name__, cache_tag)
+    if key not in _memory_cache:
+        _memory_cache[key] = _load_cached(key, parser, file_path)
+    return _memory_cache[key]
+
+
+def iter_test_data(file_path, start=0, stop=None, shard=None):
+    """
+    Stream rows from a CSV, Excel or XML file without materializing the file.
+    Rows are produced lazily in file order; start/stop slice them (like
+    itertools.islice) and shard=(i, n) keeps every n-th row of that slice.
+    Memory use stays flat regardless of file size. Bypasses the data cache.
+    """
+    reader = _reader_for(file_path, _iter_csv, _iter_excel, _iter_xml)
+    impact.touch_file(file_path)
+    return _select(reader(file_path), start, stop, shard or DATA_SHARD)
+
+
+def _reader_for(file_path, csv_reader, excel_reader, xml_reader):
     ext = os.path.splitext(file_path)[1].lower()
 
     if ext == ".csv":
-        return _read_csv(file_path)
+        return csv_reader
     elif ext in [".xls", ".xlsx"]:
-        return _read_excel(file_path)
+        return excel_reader
     elif ext == ".xml":
-        return _read_xml(file_path)
+        return xml_reader
     else:
         raise ValueError(f"Unsupported file format: {ext}")
 
 
 # -------------------------------------------------------------------
-# CSV Loader
+# Disk Cache
 # -------------------------------------------------------------------
-import csv
+def _cache_path(key):
+    digest = hashlib.sha1(repr((key, sys.version_info[:2])).encode("utf-8")).hexdigest()
+    return os.path.join(CACHE_DIR, f"{digest}.pkl")
 
+
+def _load_cached(key, reader, file_path, lock_timeout=30, lock_stale_after=120):
+    """
+    Return rows from the disk cache, parsing the file only on a miss.
+    The first process to miss takes a lock file and parses; the others wait
+    for its result instead of parsing the same file in parallel. A lock left
+    by a killed process is taken over once it is lock_stale_after seconds old.
+    """
+    cache_file = _cache_path(key)
+
+    rows = _read_cache_file(cache_file)
+    if rows is not None:
+        return rows
+
+    try:
+        with FileLock(cache_file + ".lock", timeout=lock_timeout, stale_after=lock_stale_after):
+            # Another worker may have written the entry while we waited
+            rows = _read_cache_file(cache_file)
+            if rows is None:
+                rows = reader(file_path)
+                tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+                with open(tmp_file, "wb") as f:
+                    pickle.dump(rows, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_file, cache_file)
+            return rows
+    except TimeoutError:
+        return reader(file_path)
+
+
+def _read_cache_file(cache_file):
+    try:
+        with open(cache_file, "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+
+
+# -------------------------------------------------------------------
+# CSV Loader
+# -------------------------------------------------------------------
 def _read_csv(file_path):
     """
     Reads a CSV file with a single 'role' column.
     Returns a list of dictionaries like [{'role': 'Registered'}, {'role': 'Administrators'}, ...]
     """
+    return list(_iter_csv(file_path))
+
+
+def _iter_csv(file_path):
+    """Yield cleaned CSV rows one at a time."""
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"CSV file not found: {file_path}")
 
-    data = []
     with open(file_path, newline="", encoding="utf-8") as csvfile:
         reader = csv.DictReader(csvfile)
         for row in reader:
             clean_row = {k.strip(): v.strip() for k, v in row.items() if v}  # remove empty values
-            data.append(clean_row)
-
-    return data
-
+            yield clean_row
 
 
 # -------------------------------------------------------------------
@@ -50,17 +181,28 @@ def _read_csv(file_path):
 # -------------------------------------------------------------------
 def _read_excel(file_path):
     """Read data from Excel file and return list of dictionaries."""
-    workbook = openpyxl.load_workbook(file_path)
-    sheet = workbook.active
-    headers = [cell.value.strip().lower() if isinstance(cell.value, str) else str(cell.value).lower()
-               for cell in next(sheet.iter_rows(min_row=1, max_row=1))]
+    return list(_iter_excel(file_path))
+
+
+def _iter_excel(file_path):
+    """
+    Yield Excel rows as dictionaries.
+    The workbook is opened read-only so rows are streamed instead of
+    loading every cell object into memory.
+    """
+    workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        sheet = workbook.active
+        rows = sheet.iter_rows(values_only=True)
+        headers = [value.strip().lower() if isinstance(value, str) else str(value).lower()
+                   for value in next(rows)]
 
-    data = []
-    for row in sheet.iter_rows(min_row=2, values_only=True):
-        if any(row):  # Skip completely empty rows
-            clean_row = {headers[i]: (str(row[i]).strip() if row[i] else "") for i in range(len(headers))}
-            data.append(clean_row)
-    return data
+        for row in rows:
+            if any(row):  # Skip completely empty rows
+                yield {headers[i]: (str(row[i]).strip() if i < len(row) and row[i] else "")
+                       for i in range(len(headers))}
+    finally:
+        workbook.close()
 
 
 # -------------------------------------------------------------------
@@ -68,16 +210,31 @@ def _read_excel(file_path):
 # -------------------------------------------------------------------
 def _read_xml(file_path):
     """Read data from XML file and return list of dictionaries."""
-    tree = ET.parse(file_path)
-    root = tree.getroot()
-
-    data = []
-    for child in root:
-        entry = {}
-        for element in child:
-            key = element.tag.strip().lower()
-            value = element.text.strip() if element.text else ""
-            entry[key] = value
-        if any(entry.values()):
-            data.append(entry)
-    return data
+    return list(_iter_xml(file_path))
+
+
+def _iter_xml(file_path):
+    """
+    Yield one dictionary per record element (direct child of the root).
+    Uses iterparse and clears each record once read, so the whole
+    document is never held in memory.
+    """
+    depth = 0
+    root = None
+    for event, element in ET.iterparse(file_path, events=("start", "end")):
+        if event == "start":
+            depth += 1
+            if root is None:
+                root = element
+            continue
+
+        depth -= 1
+        if depth == 1:  # a record just closed
+            entry = {}
+            for field in element:
+                key = field.tag.strip().lower()
+                value = field.text.strip() if field.text else ""
+                entry[key] = value
+            root.clear()  # drop the records already processed
+            if any(entry.values()):
+                yield entry
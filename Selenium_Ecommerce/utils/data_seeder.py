@@ -0,0 +1,197 @@
+# Bulk test data through the admin's own form endpoints (no browser):
+# python -m Selenium_Ecommerce.utils.data_seeder --count 500
+# python -m Selenium_Ecommerce.utils.data_seeder --file Selenium_Ecommerce/utils/data/customer_data.csv --site-url http://127.0.0.1:8081/
+
+import argparse
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin, urlparse
+
+import requests
+
+from Selenium_Ecommerce.utils.config import Config
+from Selenium_Ecommerce.utils.data_loader import load_test_data
+
+TOKEN_FIELD = "__RequestVerificationToken"
+_TOKEN_INPUT = re.compile(r'<input[^>]*name="__RequestVerificationToken"[^>]*>', re.IGNORECASE)
+_VALUE = re.compile(r'value="([^"]*)"')
+
+
+def form_token(page_html):
+    """The anti-forgery token of the first form on a page, or None."""
+    match = _TOKEN_INPUT.search(page_html)
+    value = _VALUE.search(match.group(0)) if match else None
+    return value.group(1) if value else None
+
+
+class AdminHttpSession:
+    """
+    A requests session logged into the nopCommerce admin, posting forms the
+    way the browser would: each post carries the page's anti-forgery token
+    (fetched once per form page and reused, as it is bound to the session
+    cookie, not to the request). requests.Session is not thread-safe, so each
+    posting thread gets its own session with a copy of the login cookies.
+    """
+
+    AUTH_COOKIE = ".Nop.Authentication"
+
+    def __init__(self, base_url=None, username=Config.ADMIN_USERNAME, password=Config.ADMIN_PASSWORD):
+        self.base_url = base_url or Config.BASE_URL
+        self.username = username
+        self.password = password
+        self.http = requests.Session()  # login and form tokens; only used under _lock once logged in
+        self._tokens = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._sessions = []
+
+    def url(self, path):
+        return urljoin(self.base_url, path.lstrip("/"))
+
+    def login(self):
+        page = self.http.get(self.url("login?ReturnUrl=%2Fadmin%2F"), timeout=Config.SEED_TIMEOUT)
+        fields = {"Email": self.username, "Password": self.password}
+        token = form_token(page.text)
+        if token:
+            fields[TOKEN_FIELD] = token
+        response = self.http.post(page.url, data=fields, timeout=Config.SEED_TIMEOUT)
+        if urlparse(response.url).path.lower().startswith("/login") or self.AUTH_COOKIE not in self.http.cookies:
+            raise PermissionError(f"Admin login as {self.username} failed at {page.url}")
+        print(f" HTTP admin session opened for {self.username}")
+        return self
+
+    def thread_session(self):
+        """This thread's own session, carrying the login (and anti-forgery) cookies."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            with self._lock:
+                session.cookies.update(self.http.cookies)
+                self._sessions.append(session)
+            self._local.session = session
+        return session
+
+    def token_for(self, path):
+        """Anti-forgery token of the form at path (cached)."""
+        with self._lock:
+            if path not in self._tokens:
+                self._tokens[path] = form_token(self.http.get(self.url(path), timeout=Config.SEED_TIMEOUT).text)
+            return self._tokens[path]
+
+    def post_form(self, path, fields):
+        """Submit the form at path; the response is returned unfollowed (302 = saved)."""
+        data = dict(fields)
+        token = self.token_for(path)
+        if token:
+            data[TOKEN_FIELD] = token
+        return self.thread_session().post(self.url(path), data=data, allow_redirects=False,
+                                          timeout=Config.SEED_TIMEOUT)
+
+    def close(self):
+        for session in self._sessions + [self.http]:
+            session.close()
+
+
+class DataSeeder:
+    """
+    Creates test data in bulk by posting the admin forms concurrently, so
+    tests that only need customers to exist don't drive the Add Customer
+    form (which stays covered by test_custadd).
+    """
+
+    CUSTOMER_FORM = "Admin/Customer/Create"
+    REGISTERED_ROLE_ID = "3"
+
+    def __init__(self, session=None, workers=Config.SEED_WORKERS):
+        self.workers = workers
+        self.session = session or AdminHttpSession().login()
+
+    # -------------------------------------------------------------------
+    # Generic
+    # -------------------------------------------------------------------
+    def seed(self, path, rows, to_fields, is_duplicate=lambda response: False):
+        """
+        Post one form per row concurrently. Returns {"created": n, "exists": n,
+        "failed": [(row, reason), ...]}; a 302 after saving counts as created.
+        """
+        def post(row):
+            try:
+                response = self.session.post_form(path, to_fields(row))
+            except requests.RequestException as e:
+                return row, "failed", str(e)
+            if response.status_code in (301, 302, 303):
+                return row, "created", None
+            if response.status_code == 200 and is_duplicate(response):
+                return row, "exists", None
+            return row, "failed", f"HTTP {response.status_code}"
+
+        started = time.perf_counter()
+        summary = {"created": 0, "exists": 0, "failed": []}
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            for row, outcome, reason in pool.map(post, rows):
+                if outcome == "failed":
+                    summary["failed"].append((row, reason))
+                else:
+                    summary[outcome] += 1
+        print(f" Seeded {path}: {summary['created']} created, {summary['exists']} already there, "
+              f"{len(summary['failed'])} failed in {time.perf_counter() - started:.1f}s")
+        return summary
+
+    # -------------------------------------------------------------------
+    # Customers
+    # -------------------------------------------------------------------
+    def seed_customers(self, customers):
+        """customers: dicts with email, password, first_name, last_name (as in the data files)."""
+        return self.seed(self.CUSTOMER_FORM, list(customers), self.customer_fields,
+                         is_duplicate=lambda response: "already registered" in response.text)
+
+    @classmethod
+    def customer_fields(cls, customer):
+        return {
+            "Email": customer["email"],
+            "Password": customer.get("password", ""),
+            "FirstName": customer.get("first_name", ""),
+            "LastName": customer.get("last_name", ""),
+            "SelectedCustomerRoleIds": cls.REGISTERED_ROLE_ID,
+            "Active": "true",
+            "save": "",
+        }
+
+    @staticmethod
+    def generate_customers(count, prefix="seed"):
+        """count customers with emails unique to this run."""
+        run = int(time.time())
+        return [{"email": f"{prefix}.{run}.{i}@example.com", "password": "Pwd@1234",
+                 "first_name": f"{prefix.title()}{i}", "last_name": f"Run{run}"} for i in range(1, count + 1)]
+
+    def close(self):
+        self.session.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Create nopCommerce customers in bulk over HTTP")
+    parser.add_argument("--site-url", default=None, help=f"Admin site (default: {Config.BASE_URL})")
+    parser.add_argument("--count", type=int, default=0, help="Generate this many customers with unique emails")
+    parser.add_argument("--file", action="append", default=[], help="CSV / XLSX / XML customer data file")
+    parser.add_argument("--workers", type=int, default=Config.SEED_WORKERS, help="Concurrent form posts")
+    args = parser.parse_args(argv)
+
+    if args.site_url:
+        Config.set_base_url(args.site_url)
+    customers = DataSeeder.generate_customers(args.count)
+    for path in args.file:
+        customers += load_test_data(path)
+    seeder = DataSeeder(workers=args.workers)
+    try:
+        summary = seeder.seed_customers(customers)
+    finally:
+        seeder.close()
+    for row, reason in summary["failed"]:
+        print(f" Failed: {row['email']}: {reason}")
+    raise SystemExit(1 if summary["failed"] else 0)
+
+
+if __name__ == "__main__":
+    main()
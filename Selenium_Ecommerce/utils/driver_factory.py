@@ -0,0 +1,150 @@
+import os
+import shutil
+
+from selenium import webdriver
+from selenium.common.exceptions import SessionNotCreatedException
+
+from Selenium_Ecommerce.utils.config import Config
+from Selenium_Ecommerce.utils.driver_services import driver_services
+from Selenium_Ecommerce.utils.element_cache import ElementCache
+from Selenium_Ecommerce.utils.network_monitor import NetworkMonitor
+from Selenium_Ecommerce.utils.profiler import profiler
+from Selenium_Ecommerce.utils.resource_monitor import resources
+
+# Low-memory Chrome switches used with Config.LEAN_BROWSERS
+LEAN_CHROME_ARGS = [
+    "--renderer-process-limit=2",
+    "--disable-site-isolation-trials",
+    "--disable-features=Translate,OptimizationHints,MediaRouter,BackForwardCache",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-sync",
+    "--disable-default-apps",
+    "--mute-audio",
+    "--disk-cache-size=33554432",
+    "--js-flags=--max-old-space-size=512",
+]
+
+# Low-memory Firefox preferences used with Config.LEAN_BROWSERS
+LEAN_FIREFOX_PREFS = {
+    "dom.ipc.processCount": 1,
+    "fission.autostart": False,
+    "browser.sessionhistory.max_total_viewers": 0,
+    "browser.cache.disk.enable": False,
+    "browser.cache.memory.capacity": 32768,
+    "extensions.pocket.enabled": False,
+    "datareporting.healthreport.uploadEnabled": False,
+    "toolkit.telemetry.enabled": False,
+    "app.update.auto": False,
+}
+
+
+def dev_shm_free_mb():
+    """Free space in /dev/shm (0 where it does not exist, e.g. Windows)."""
+    if not os.path.isdir("/dev/shm"):
+        return 0
+    return shutil.disk_usage("/dev/shm").free / (1024 * 1024)
+
+
+# -------------------------------------------------------------------
+# Browser Options
+# -------------------------------------------------------------------
+def chrome_options(headless=False, options=None):
+    """Chrome options shared by local and Grid sessions (and the base of Edge's)."""
+    options = options or webdriver.ChromeOptions()
+    options.add_argument("--no-sandbox")
+    if not (Config.LEAN_BROWSERS and dev_shm_free_mb() >= Config.DEV_SHM_MIN_FREE_MB):
+        options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--window-size=1920,1080")
+    options.add_argument("--disable-extensions")
+    options.add_argument("--disable-infobars")
+    options.add_argument("--ignore-certificate-errors")
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    options.add_argument("--start-maximized")
+    if headless:
+        options.add_argument("--headless=new")
+    if Config.LEAN_BROWSERS:
+        for argument in LEAN_CHROME_ARGS:
+            options.add_argument(argument)
+    if Config.NETWORK_TRACKING or Config.BLOCK_ASSETS:
+        # CDP Network events are read back through the performance log
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    return options
+
+
+def edge_options(headless=False):
+    """Edge is Chromium: the same switches as Chrome."""
+    return chrome_options(headless, options=webdriver.EdgeOptions())
+
+
+def firefox_options(headless=False):
+    """Firefox options shared by local and Grid sessions."""
+    options = webdriver.FirefoxOptions()
+    if headless:
+        options.add_argument("--headless")
+        options.add_argument("--start-maximized")
+    if Config.LEAN_BROWSERS:
+        for name, value in LEAN_FIREFOX_PREFS.items():
+            options.set_preference(name, value)
+    return options
+
+
+# -------------------------------------------------------------------
+# Driver Factory
+# -------------------------------------------------------------------
+def launch_local(driver_class, browser, options):
+    """Start a local session on the warm driver service (binary resolved once per worker)."""
+    try:
+        return driver_class(service=driver_services.service(browser), options=options)
+    except SessionNotCreatedException:
+        if browser in driver_services.resolver.pinned:
+            raise
+        # Usually a browser update the cached driver binary does not support
+        print(f" {browser} session not created with the cached driver — resolving it again.")
+        driver_services.reset(browser)
+        return driver_class(service=driver_services.service(browser), options=options)
+
+
+def create_driver(browser, headless=False, grid=False):
+    """
+    Launch a new WebDriver session for the given browser.
+    Uses Config.GRID_URL when grid=True, otherwise a local driver binary.
+    """
+    browser = browser.lower()
+    if not grid:
+        resources.wait_for_headroom()
+
+    if browser == "chrome":
+        options = chrome_options(headless)
+        if grid:
+            driver = webdriver.Remote(command_executor=Config.GRID_URL, options=options)
+        else:
+            driver = launch_local(webdriver.Chrome, "chrome", options)
+
+    elif browser == "firefox":
+        options = firefox_options(headless)
+        if grid:
+            driver = webdriver.Remote(command_executor=Config.GRID_URL, options=options)
+        else:
+            driver = launch_local(webdriver.Firefox, "firefox", options)
+
+    elif browser == "edge":
+        options = edge_options(headless)
+        if grid:
+            driver = webdriver.Remote(command_executor=Config.GRID_URL, options=options)
+        else:
+            driver = launch_local(webdriver.Edge, "edge", options)
+
+    else:
+        raise ValueError(f"Unsupported browser: {browser}")
+
+    driver.set_page_load_timeout(60)
+    driver.implicitly_wait(10)
+    driver.maximize_window()
+    print(f" Launched new {browser} session (headless={headless}, grid={grid})")
+    resources.track(driver, browser)
+    driver = ElementCache.attach(profiler.instrument_driver(driver))
+    if browser == "chrome" and not grid and (Config.NETWORK_TRACKING or Config.BLOCK_ASSETS):
+        driver = NetworkMonitor.attach(driver, Config.BLOCKED_URL_PATTERNS if Config.BLOCK_ASSETS else ())
+    return driver
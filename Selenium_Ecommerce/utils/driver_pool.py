@@ -0,0 +1,265 @@
+import glob
+import json
+import os
+import threading
+
+from selenium.common.exceptions import WebDriverException
+
+from Selenium_Ecommerce.utils.config import Config
+from Selenium_Ecommerce.utils.driver_factory import create_driver
+from Selenium_Ecommerce.utils.resource_monitor import resources
+
+
+class PooledDriver:
+    """Book-keeping for one live browser owned by the pool."""
+
+    def __init__(self, key, driver):
+        self.key = key
+        self.driver = driver
+        self.uses = 0
+
+
+class DriverPool:
+    """
+    Keeps launched browsers alive for the whole pytest session (one session
+    per xdist worker) and hands them out again instead of starting a new one.
+
+    Browsers are keyed by (browser, headless, grid). Every checkout gets a
+    browser with cookies and storage cleared and a blank page loaded.
+    A browser is quit and replaced after max_uses checkouts or when it
+    no longer responds.
+
+    With spares > 0, that many extra browsers per key are launched on a
+    background thread while tests run, so a recycled or crashed browser is
+    replaced at once instead of waiting for a full launch (a spare "hit").
+    Grid sessions get no spares: they would hold Grid slots idle. With
+    keep_grid_sessions=False (--local-grid) they are not kept between
+    checkouts either: a released one is quit at once, so its slot goes to
+    the next session request in the grid's queue.
+    """
+
+    def __init__(self, factory=create_driver, max_uses=Config.DRIVER_MAX_USES, spares=Config.DRIVER_SPARES,
+                 keep_grid_sessions=True):
+        self.factory = factory
+        self.max_uses = max_uses
+        self.spares = spares
+        self.keep_grid_sessions = keep_grid_sessions
+        self.launches = 0
+        self.reuses = 0
+        self.spare_hits = 0
+        self.spare_misses = 0
+        self.memory_recycles = 0
+        self._idle = {}
+        self._busy = {}
+        self._spare = {}
+        self._filling = set()
+        self._closed = False
+        self._lock = threading.Lock()
+        self._spare_ready = threading.Condition(self._lock)
+
+    # -------------------------------------------------------------------
+    # Checkout / Return
+    # -------------------------------------------------------------------
+    def acquire(self, browser, headless=False, grid=False):
+        """Return a clean browser for the key, launching one only if none is idle."""
+        key = (browser.lower(), bool(headless), bool(grid))
+
+        while True:
+            with self._lock:
+                idle = self._idle.get(key, [])
+                entry = idle.pop() if idle else None
+
+            if entry is None:
+                entry = self._take_spare(key)
+                if entry is None:
+                    entry = PooledDriver(key, self.factory(*key))
+                    self.launches += 1
+                self._refill(key)
+                break
+
+            if self._reset(entry.driver):
+                self.reuses += 1
+                print(f" Reusing pooled {key[0]} session (use {entry.uses + 1}/{self.max_uses})")
+                break
+
+            print(f" Pooled {key[0]} session is unresponsive — discarding it.")
+            self._quit(entry)
+
+        entry.uses += 1
+        with self._lock:
+            self._busy[id(entry.driver)] = entry
+        return entry.driver
+
+    def release(self, driver):
+        """Hand a browser back; it is recycled when worn out or crashed."""
+        with self._lock:
+            entry = self._busy.pop(id(driver), None)
+        if entry is None:
+            return
+
+        if entry.key[2] and not self.keep_grid_sessions:
+            # Idle in the pool it would keep a grid slot another worker may be queueing for
+            self._quit(entry)
+        elif entry.uses >= self.max_uses:
+            print(f" Recycling {entry.key[0]} session after {entry.uses} uses.")
+            self._quit(entry)
+            self._refill(entry.key)
+        elif not self._is_alive(driver):
+            print(f" {entry.key[0]} session crashed — it will be relaunched on next use.")
+            self._quit(entry)
+            self._refill(entry.key)
+        elif resources.over_budget(driver):
+            print(f" Recycling {entry.key[0]} session: {resources.browser_rss_mb(driver):.0f} MB "
+                  f"is over the {resources.budget_mb} MB budget.")
+            self.memory_recycles += 1
+            self._quit(entry)
+            self._refill(entry.key)
+        else:
+            with self._lock:
+                self._idle.setdefault(entry.key, []).append(entry)
+
+    def close_all(self):
+        """Quit every browser owned by the pool (end of session)."""
+        with self._lock:
+            self._closed = True
+            entries = [e for idle in self._idle.values() for e in idle] + list(self._busy.values())
+            entries += [e for spare in self._spare.values() for e in spare]
+            self._idle.clear()
+            self._busy.clear()
+            self._spare.clear()
+        for entry in entries:
+            self._quit(entry)
+        stats = self.stats()
+        print(f" Driver pool closed: {stats['launches']} launch(es), {stats['reuses']} reuse(s), "
+              f"spares {stats['spare_hits']} hit(s) / {stats['spare_misses']} miss(es).")
+
+    # -------------------------------------------------------------------
+    # Spare Browsers
+    # -------------------------------------------------------------------
+    def prewarm(self, browser, headless=False, grid=False):
+        """Start launching the spare browsers for a key before the first test needs one."""
+        self._refill((browser.lower(), bool(headless), bool(grid)))
+
+    def _take_spare(self, key):
+        if self.spares <= 0 or key[2]:
+            return None
+        with self._spare_ready:
+            # A spare that is already launching is ready sooner than a new launch
+            while not self._spare.get(key) and key in self._filling:
+                self._spare_ready.wait()
+            spare = self._spare.get(key, [])
+            entry = spare.pop() if spare else None
+        if entry is not None and not self._is_alive(entry.driver):
+            self._quit(entry)
+            entry = None
+        if entry is None:
+            self.spare_misses += 1
+        else:
+            self.spare_hits += 1
+            print(f" Swapped in a pre-launched spare {key[0]} session.")
+        return entry
+
+    def _refill(self, key):
+        """Top the key's spares back up to `spares` on a background thread."""
+        if self.spares <= 0 or key[2] or not resources.has_headroom():
+            return
+        with self._lock:
+            if self._closed or key in self._filling or len(self._spare.get(key, [])) >= self.spares:
+                return
+            self._filling.add(key)
+        threading.Thread(target=self._fill, args=(key,), name=f"spare-{key[0]}", daemon=True).start()
+
+    def _fill(self, key):
+        while True:
+            with self._spare_ready:
+                if self._closed or len(self._spare.get(key, [])) >= self.spares:
+                    self._filling.discard(key)
+                    self._spare_ready.notify_all()
+                    return
+            try:
+                entry = PooledDriver(key, self.factory(*key))
+            except Exception as e:
+                print(f" Could not launch a spare {key[0]} session: {e}")
+                with self._spare_ready:
+                    self._filling.discard(key)
+                    self._spare_ready.notify_all()
+                return
+            with self._spare_ready:
+                self.launches += 1
+                if not self._closed:
+                    self._spare.setdefault(key, []).append(entry)
+                    self._spare_ready.notify_all()
+                    continue
+            self._quit(entry)  # pool closed while this one was starting
+
+    # -------------------------------------------------------------------
+    # Metrics
+    # -------------------------------------------------------------------
+    def stats(self):
+        wanted = self.spare_hits + self.spare_misses
+        return {"launches": self.launches, "reuses": self.reuses, "memory_recycles": self.memory_recycles,
+                "spares": self.spares,
+                "spare_hits": self.spare_hits, "spare_misses": self.spare_misses,
+                "spare_hit_rate": round(self.spare_hits / wanted, 3) if wanted else None}
+
+    def save_stats(self, output_dir):
+        """Write this worker's pool metrics to pool-<worker>.json for the end-of-run summary."""
+        os.makedirs(output_dir, exist_ok=True)
+        worker = os.getenv("PYTEST_XDIST_WORKER", "master")
+        with open(os.path.join(output_dir, f"pool-{worker}.json"), "w", encoding="utf-8") as f:
+            json.dump(self.stats(), f, indent=2)
+
+    @staticmethod
+    def summary_for_all_workers(output_dir):
+        """Sum the pool metrics of every worker; None when no worker saved any."""
+        paths = glob.glob(os.path.join(output_dir, "pool-*.json"))
+        if not paths:
+            return None
+        counters = ("launches", "reuses", "memory_recycles", "spare_hits", "spare_misses")
+        totals = dict({"workers": len(paths)}, **{key: 0 for key in counters})
+        for path in paths:
+            with open(path, encoding="utf-8") as f:
+                stats = json.load(f)
+            for key in counters:
+                totals[key] += stats[key]
+            totals["spares"] = stats["spares"]
+        wanted = totals["spare_hits"] + totals["spare_misses"]
+        totals["spare_hit_rate"] = round(totals["spare_hits"] / wanted, 3) if wanted else None
+        return totals
+
+    # -------------------------------------------------------------------
+    # Helpers
+    # -------------------------------------------------------------------
+    @staticmethod
+    def _is_alive(driver):
+        try:
+            driver.current_url
+            return True
+        except WebDriverException:
+            return False
+
+    @staticmethod
+    def _reset(driver):
+        """Clear cookies and web storage and park the browser on a blank page."""
+        try:
+            on_site = driver.current_url.startswith("http")
+            if on_site:
+                driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+            try:
+                # Chromium can drop cookies for every domain in one call
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            except (AttributeError, WebDriverException):
+                if on_site:
+                    driver.delete_all_cookies()
+            driver.get("about:blank")
+            return True
+        except WebDriverException:
+            return False
+
+    @staticmethod
+    def _quit(entry):
+        resources.untrack(entry.driver)
+        try:
+            entry.driver.quit()
+        except WebDriverException:
+            pass
@@ -0,0 +1,235 @@
+import json
+import os
+import shutil
+import threading
+import time
+
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.edge.service import Service as EdgeService
+from selenium.webdriver.firefox.service import Service as FirefoxService
+from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.firefox import GeckoDriverManager
+from webdriver_manager.microsoft import EdgeChromiumDriverManager
+
+from Selenium_Ecommerce.utils.config import Config
+from Selenium_Ecommerce.utils.file_lock import FileLock
+
+
+class DriverResolver:
+    """
+    Finds the chromedriver / geckodriver binary once per process instead of
+    calling webdriver-manager (version probe + cache lookup, and network
+    access) for every browser launch.
+
+    Order: pinned path (--driver-path / CHROMEDRIVER_PATH / GECKODRIVER_PATH / EDGEDRIVER_PATH),
+    then the shared file cache written by whichever xdist worker resolved it
+    first, then webdriver-manager. In offline mode webdriver-manager is never
+    called: the cache or a driver on PATH is used instead.
+    """
+
+    MANAGERS = {"chrome": ChromeDriverManager, "firefox": GeckoDriverManager, "edge": EdgeChromiumDriverManager}
+    EXECUTABLES = {"chrome": "chromedriver", "firefox": "geckodriver", "edge": "msedgedriver"}
+
+    def __init__(self, cache_dir=None):
+        self.cache_dir = cache_dir or os.path.join(os.getcwd(), "Selenium_Ecommerce", "Output", "drivers")
+        self.pinned = dict(Config.DRIVER_PATHS)
+        self.offline = Config.DRIVER_OFFLINE
+        self._paths = {}
+        self._lock = threading.Lock()
+
+    @property
+    def cache_path(self):
+        return os.path.join(self.cache_dir, "driver-paths.json")
+
+    def configure(self, pinned=None, offline=None):
+        if pinned:
+            self.pinned.update(pinned)
+        if offline is not None:
+            self.offline = offline
+        self._paths.clear()
+
+    def resolve(self, browser):
+        with self._lock:
+            if browser not in self._paths:
+                started = time.perf_counter()
+                self._paths[browser] = self._resolve(browser)
+                print(f" {self.EXECUTABLES[browser]} resolved in {time.perf_counter() - started:.2f}s: "
+                      f"{self._paths[browser]}")
+            return self._paths[browser]
+
+    def invalidate(self, browser):
+        """Forget a cached path, e.g. after the browser was updated and the driver no longer matches."""
+        with self._lock:
+            self._paths.pop(browser, None)
+            with FileLock(self.cache_path + ".lock"):
+                cache = self._read_cache()
+                if cache.pop(browser, None) is not None:
+                    self._write_cache(cache)
+
+    def _resolve(self, browser):
+        pinned = self.pinned.get(browser)
+        if pinned:
+            if not os.path.isfile(pinned):
+                raise FileNotFoundError(f"Pinned {self.EXECUTABLES[browser]} not found: {pinned}")
+            return pinned
+
+        with FileLock(self.cache_path + ".lock"):
+            cache = self._read_cache()
+            entry = cache.get(browser)
+            fresh = entry and time.time() - entry["resolved"] < Config.DRIVER_CACHE_HOURS * 3600
+            if entry and os.path.isfile(entry["path"]) and (fresh or self.offline):
+                return entry["path"]
+
+            if self.offline:
+                path = shutil.which(self.EXECUTABLES[browser])
+                if not path:
+                    raise FileNotFoundError(f"Offline mode: no cached or pinned {self.EXECUTABLES[browser]} "
+                                            f"and none on PATH (use --driver-path {browser}=<path>)")
+            else:
+                path = self.MANAGERS[browser]().install()
+            cache[browser] = {"path": path, "resolved": time.time()}
+            self._write_cache(cache)
+            return path
+
+    def _read_cache(self):
+        if not os.path.exists(self.cache_path):
+            return {}
+        with open(self.cache_path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def _write_cache(self, cache):
+        with open(self.cache_path, "w", encoding="utf-8") as f:
+            json.dump(cache, f, indent=2)
+
+
+class _Prestarted:
+    """
+    Service mixin: start() is a no-op when the process is already running,
+    and stop() is skipped while keep_warm is set (driver.quit() calls it).
+    """
+
+    keep_warm = False
+
+    def start(self):
+        process = getattr(self, "process", None)
+        if process is not None and process.poll() is None:
+            return
+        super().start()
+
+    def stop(self):
+        if not self.keep_warm:
+            super().stop()
+
+    def shutdown(self):
+        self.keep_warm = False
+        self.stop()
+
+
+class WarmChromeService(_Prestarted, ChromeService):
+    """One chromedriver process serves every Chrome session of the worker."""
+
+    keep_warm = True
+
+
+class WarmEdgeService(_Prestarted, EdgeService):
+    """msedgedriver, like chromedriver, serves every Edge session of the worker."""
+
+    keep_warm = True
+
+
+class PrestartedFirefoxService(_Prestarted, FirefoxService):
+    """geckodriver handles a single session, so each one is spawned ahead of its use."""
+
+
+class DriverServices:
+    """
+    Per-process driver services: chromedriver / msedgedriver stay running
+    between launches, and a geckodriver is always spawned in the background
+    ready for the next Firefox launch.
+    """
+
+    WARM = {"chrome": WarmChromeService, "edge": WarmEdgeService}
+
+    def __init__(self, resolver=None):
+        self.resolver = resolver or DriverResolver()
+        self._warm = {}
+        self._spare_firefox = None
+        self._spawning = {}   # browser -> prestart thread
+        self._lock = threading.Lock()
+
+    def service(self, browser):
+        """A running service for the next local session of the browser."""
+        if browser in self.WARM:
+            with self._lock:
+                if browser not in self._warm:
+                    self._warm[browser] = self.WARM[browser](self.resolver.resolve(browser))
+                self._warm[browser].start()
+                return self._warm[browser]
+
+        if browser == "firefox":
+            with self._lock:
+                spawning = self._spawning.get("firefox")
+            if spawning is not None:
+                spawning.join()
+            with self._lock:
+                service, self._spare_firefox = self._spare_firefox, None
+            if service is None:
+                service = PrestartedFirefoxService(self.resolver.resolve("firefox"))
+                service.start()
+            self.prestart("firefox")
+            return service
+
+        raise ValueError(f"Unsupported browser: {browser}")
+
+    def prestart(self, browser):
+        """Resolve the driver and spawn its service in the background, ahead of the first launch."""
+        def spawn():
+            try:
+                if browser in self.WARM:
+                    self.service(browser)
+                else:
+                    spare = PrestartedFirefoxService(self.resolver.resolve("firefox"))
+                    spare.start()
+                    with self._lock:
+                        displaced, self._spare_firefox = self._spare_firefox, spare
+                    if displaced is not None:
+                        displaced.shutdown()
+            except Exception as e:
+                print(f" Could not pre-start the {browser} driver service: {e}")
+
+        # The test thread and the spare-browser filler can both get here: spawn once
+        with self._lock:
+            running = self._spawning.get(browser)
+            if running is not None and running.is_alive():
+                return
+            if browser not in self.WARM and self._spare_firefox is not None:
+                return
+            self._spawning[browser] = threading.Thread(target=spawn, name=f"prestart-{browser}", daemon=True)
+            self._spawning[browser].start()
+
+    def reset(self, browser):
+        """Drop the cached binary and running services of a browser so the next launch resolves again."""
+        self.resolver.invalidate(browser)
+        with self._lock:
+            if browser in self.WARM:
+                stale = self._warm.pop(browser, None)
+            else:
+                stale, self._spare_firefox = self._spare_firefox, None
+        if stale is not None:
+            stale.shutdown()
+
+    def close_all(self):
+        with self._lock:
+            threads = list(self._spawning.values())
+        for thread in threads:
+            thread.join()
+        with self._lock:
+            services = list(self._warm.values())
+            if self._spare_firefox is not None:
+                services.append(self._spare_firefox)
+            self._warm, self._spare_firefox = {}, None
+        for service in services:
+            service.shutdown()
+
+
+driver_services = DriverServices()
@@ -0,0 +1,244 @@
+import heapq
+import statistics
+from collections import defaultdict
+
+import pytest
+from xdist.report import report_collection_diff
+from xdist.workermanage import parse_tx_spec_config
+
+
+class DurationStore:
+    """
+    Per-test durations (setup + call + teardown) kept in the pytest cache
+    across runs. A new measurement is blended with the stored one so a
+    single slow run does not reorder the whole schedule.
+    """
+
+    CACHE_KEY = "selenium_ecommerce/durations"
+    # Assumed cost of a test that has never been timed (a typical browser test)
+    DEFAULT_SECONDS = 5.0
+
+    def __init__(self, cache, smoothing=0.5):
+        self.cache = cache
+        self.smoothing = smoothing
+
+    def load(self):
+        return self.cache.get(self.CACHE_KEY, {})
+
+    def update(self, measured):
+        """Merge this run's {nodeid: seconds} into the stored durations."""
+        durations = self.load()
+        for nodeid, seconds in measured.items():
+            previous = durations.get(nodeid)
+            durations[nodeid] = round(seconds if previous is None
+                                      else self.smoothing * seconds + (1 - self.smoothing) * previous, 3)
+        self.cache.set(self.CACHE_KEY, durations)
+        return durations
+
+    @classmethod
+    def estimator(cls, durations):
+        """
+        Return estimate(nodeid): the stored duration, else the median of the
+        test's class (or module), else the median of all known tests.
+        """
+        by_scope = defaultdict(list)
+        for nodeid, seconds in durations.items():
+            by_scope[nodeid.rsplit("::", 1)[0]].append(seconds)
+        overall = statistics.median(durations.values()) if durations else cls.DEFAULT_SECONDS
+
+        def estimate(nodeid):
+            if nodeid in durations:
+                return durations[nodeid]
+            siblings = by_scope.get(nodeid.rsplit("::", 1)[0])
+            return statistics.median(siblings) if siblings else overall
+
+        return estimate
+
+
+def predicted_makespan(costs, workers):
+    """Finish time of the busiest worker when costs are handed out largest-first."""
+    loads = [0.0] * max(workers, 1)
+    for cost in sorted(costs, reverse=True):
+        heapq.heapreplace(loads, loads[0] + cost)
+    return max(loads)
+
+
+class LPTScheduling:
+    """
+    xdist scheduler that keeps every test class (one class-scoped `setup`
+    browser) on a single worker, like --dist loadscope, but hands the
+    classes out longest-processing-time first using historical durations.
+    A worker only gets its next class when it is about to run out of work,
+    so the next-largest class always goes to the first worker to free up.
+
+    It owns its queue and implements xdist's public scheduler protocol
+    (xdist.scheduler.protocol.Scheduling), talking to the workers only
+    through send_runtest_some() / shutdown().
+    """
+
+    def __init__(self, config, log=None, durations=None):
+        self.config = config
+        self.numnodes = len(parse_tx_spec_config(config))
+        self.estimate = DurationStore.estimator(durations or {})
+        self.collection = None
+        self.collections = {}   # node -> test ids it collected, in collection order
+        self.workqueue = []     # [(scope, [test ids])], most expensive first
+        self.assigned = {}      # node -> {test id: completed}
+
+    @staticmethod
+    def scope_of(nodeid):
+        """Test class (or module, for plain test functions) of a test id."""
+        return nodeid.rsplit("::", 1)[0]
+
+    def unit_cost(self, work_unit):
+        return sum(self.estimate(nodeid) for nodeid in work_unit)
+
+    def pending_of(self, node):
+        return sum(not completed for completed in self.assigned[node].values())
+
+    # ------------------------------------------------------------------
+    #  Scheduling protocol
+    # ------------------------------------------------------------------
+    @property
+    def nodes(self):
+        return list(self.assigned)
+
+    @property
+    def collection_is_completed(self):
+        return len(self.collections) >= self.numnodes
+
+    @property
+    def tests_finished(self):
+        # A worker's last test runs after its shutdown, so one pending test is "finished"
+        if not self.collection_is_completed or self.workqueue:
+            return False
+        return all(self.pending_of(node) < 2 for node in self.assigned)
+
+    @property
+    def has_pending(self):
+        return bool(self.workqueue) or any(self.pending_of(node) for node in self.assigned)
+
+    def add_node(self, node):
+        assert node not in self.assigned
+        self.assigned[node] = {}
+
+    def add_node_collection(self, node, collection):
+        assert node in self.assigned
+        # A replacement for a crashed worker must collect what the others did
+        if self.collection is not None and not self._same_collection(node, collection):
+            return
+        self.collections[node] = list(collection)
+
+    def mark_test_complete(self, node, item_index, duration=0):
+        self.assigned[node][self.collections[node][item_index]] = True
+        self._reschedule(node)
+
+    def mark_test_pending(self, item):
+        raise NotImplementedError()
+
+    def remove_pending_tests_from_node(self, node, indices):
+        raise NotImplementedError()
+
+    def remove_node(self, node):
+        """Drop a finished or crashed worker; a crashed worker's unfinished tests are queued again."""
+        pending = [nodeid for nodeid, completed in self.assigned.pop(node).items() if not completed]
+        if not pending:
+            return None
+        units = defaultdict(list)
+        for nodeid in pending:
+            units[self.scope_of(nodeid)].append(nodeid)
+        self.workqueue[:0] = sorted(units.items(), key=lambda item: self.unit_cost(item[1]), reverse=True)
+        for other in self.nodes:
+            self._reschedule(other)
+        return pending[0]
+
+    def schedule(self):
+        assert self.collection_is_completed
+        # Called again when a replacement worker has collected: just give it work
+        if self.collection is not None:
+            for node in self.nodes:
+                self._reschedule(node)
+            return
+
+        (first, collection), *others = self.collections.items()
+        if not all(self._same_collection(node, other, first, collection) for node, other in others):
+            return
+        self.collection = collection
+        if not collection:
+            return
+
+        units = defaultdict(list)
+        for nodeid in collection:
+            units[self.scope_of(nodeid)].append(nodeid)
+        self.workqueue = sorted(units.items(), key=lambda item: self.unit_cost(item[1]), reverse=True)
+
+        costs = [self.unit_cost(unit) for _, unit in self.workqueue]
+        workers = min(len(self.nodes), len(costs))
+        print(f" Duration schedule: {len(costs)} test groups on {workers} workers, "
+              f"predicted wall time {predicted_makespan(costs, workers):.1f}s "
+              f"(ideal {sum(costs) / max(workers, 1):.1f}s, largest group {max(costs, default=0):.1f}s)")
+
+        # More workers than test groups: the extra ones would only idle
+        for node in self.nodes[len(self.workqueue):]:
+            del self.assigned[node]
+            node.shutdown()
+        for node in self.nodes:
+            self._assign_work_unit(node)
+        for node in self.nodes:
+            self._reschedule(node)
+
+    # ------------------------------------------------------------------
+    #  Assignment
+    # ------------------------------------------------------------------
+    def _same_collection(self, node, collection, reference_node=None, reference=None):
+        if reference is None:
+            reference_node, reference = next(iter(self.collections.items()))
+        message = report_collection_diff(reference, collection, reference_node.gateway.id, node.gateway.id)
+        if message:
+            self.config.hook.pytest_collectreport(
+                report=pytest.CollectReport(node.gateway.id, "failed", longrepr=message, result=[]))
+        return not message
+
+    def _assign_work_unit(self, node):
+        _, unit = self.workqueue.pop(0)
+        self.assigned[node].update((nodeid, False) for nodeid in unit)
+        positions = {nodeid: index for index, nodeid in enumerate(self.collections[node])}
+        node.send_runtest_some([positions[nodeid] for nodeid in unit])
+
+    def _reschedule(self, node):
+        if node.shutting_down:
+            return
+        if not self.workqueue:
+            node.shutdown()
+            return
+        # A worker holds back its last queued test until it knows the next one,
+        # so top it up as soon as only that test is left
+        if self.pending_of(node) > 1:
+            return
+        self._assign_work_unit(node)
+
+
+class DurationSchedulerPlugin:
+    """
+    Records how long every test takes (the controller sees the reports of
+    all workers) and, with --duration-schedule, installs LPTScheduling.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.store = DurationStore(config.cache)
+        self._measured = defaultdict(float)
+
+    def pytest_runtest_logreport(self, report):
+        self._measured[report.nodeid] += report.duration
+
+    def pytest_sessionfinish(self, session):
+        # Workers report to the controller; only it (or a plain run) writes the cache
+        if not hasattr(self.config, "workerinput") and self._measured:
+            self.store.update(self._measured)
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_xdist_make_scheduler(self, config, log):
+        if not config.getoption("--duration-schedule"):
+            return None
+        return LPTScheduling(config, log, self.store.load())
@@ -0,0 +1,123 @@
+import time
+
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from Selenium_Ecommerce.utils.profiler import profiler
+
+
+class CachedElement(WebElement):
+    """
+    WebElement that re-resolves its locator when the browser reports it stale
+    and repeats the command once. It is a real WebElement, so it can be passed
+    to execute_script and expected conditions like any other element.
+    """
+
+    def __init__(self, cache, locator, element):
+        super().__init__(element.parent, element.id)
+        self._cache = cache
+        self._locator = locator
+
+    def _refresh(self):
+        self._id = self._cache.resolve(self._locator, stale=True).id
+
+    def _execute(self, command, params=None):
+        try:
+            return super()._execute(command, params)
+        except StaleElementReferenceException:
+            self._refresh()
+            return super()._execute(command, params)
+
+    # These two go through execute_script instead of _execute
+    def is_displayed(self):
+        try:
+            return super().is_displayed()
+        except StaleElementReferenceException:
+            self._refresh()
+            return super().is_displayed()
+
+    def get_attribute(self, name):
+        try:
+            return super().get_attribute(name)
+        except StaleElementReferenceException:
+            self._refresh()
+            return super().get_attribute(name)
+
+
+class ElementCache:
+    """
+    Resolved elements of one browser, keyed by locator.
+
+    Entries belong to a page-state generation: driver.get() starts a new
+    generation, so elements of the previous page are never handed out.
+    Navigation the cache does not see (form posts, menu clicks) is caught
+    when the browser reports the element stale; it is then looked up again.
+    Every real lookup is recorded on the profiler as a 'locate' event.
+    """
+
+    def __init__(self, driver, timeout=10):
+        self.driver = driver
+        self.timeout = timeout
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self._elements = {}
+
+    @classmethod
+    def attach(cls, driver):
+        """Give the driver its cache and start a new generation on every driver.get()."""
+        cache = cls(driver)
+        original_get = driver.get
+
+        def get(url):
+            cache.invalidate()
+            return original_get(url)
+
+        driver.get = get
+        driver.element_cache = cache
+        return driver
+
+    @staticmethod
+    def for_driver(driver):
+        """The driver's cache, created on first use for drivers not built by the factory."""
+        cache = getattr(driver, "element_cache", None)
+        if cache is None:
+            cache = ElementCache(driver)
+            driver.element_cache = cache
+        return cache
+
+    def invalidate(self):
+        self.generation += 1
+        self._elements.clear()
+
+    def find(self, locator, timeout=None):
+        """Cached element for the locator, looked up (and waited for) on a miss."""
+        key = tuple(locator)
+        element = self._elements.get(key)
+        if element is not None:
+            self.hits += 1
+            return element
+
+        self.misses += 1
+        element = CachedElement(self, locator, self.resolve(locator, timeout))
+        self._elements[key] = element
+        return element
+
+    def resolve(self, locator, timeout=None, stale=False):
+        """Look the locator up in the document, bypassing the cache."""
+        if stale:
+            self.stale += 1
+        with profiler.record("locate", locator) as event:
+            event["retries"] = int(stale)
+            start = time.perf_counter()
+            element = WebDriverWait(self.driver, timeout or self.timeout).until(
+                EC.presence_of_element_located(tuple(locator)))
+            event["wait"] = time.perf_counter() - start
+        return element
+
+    def stats(self):
+        return {"generation": self.generation, "hits": self.hits,
+                "misses": self.misses, "stale": self.stale}
@@ -0,0 +1,81 @@
+import os
+import time
+import uuid
+
+
+class FileLock:
+    """
+    Cross-process lock (xdist workers) on an exclusively created lock file.
+    Works on Windows as well; a lock older than stale_after seconds is
+    assumed to belong to a crashed process and is taken over. Waiting
+    times out only after a lock would have gone stale (timeout defaults
+    to stale_after + 60), so a crashed holder never makes waiters fail.
+    """
+
+    def __init__(self, path, timeout=None, stale_after=300):
+        self.path = path
+        self.stale_after = stale_after
+        self.timeout = stale_after + 60 if timeout is None else timeout
+        # Written into the lock file so only its owner removes it
+        self.token = f"{os.getpid()}-{uuid.uuid4().hex}"
+
+    def __enter__(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        deadline = time.monotonic() + self.timeout
+        while True:
+            if self._create(self.path):
+                return self
+            if self._is_stale(self.path):
+                self._take_over()
+                continue
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Timed out waiting for {self.path}")
+            time.sleep(0.1)
+
+    def __exit__(self, *exc):
+        # A lock that was taken over (this process was too slow) now belongs to someone else
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                owned = f.read() == self.token
+            if owned:
+                os.remove(self.path)
+        except OSError:
+            pass
+
+    def _create(self, path):
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            return False
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(self.token)
+        return True
+
+    def _is_stale(self, path):
+        try:
+            return time.time() - os.path.getmtime(path) > self.stale_after
+        except OSError:
+            return False  # released in the meantime
+
+    def _take_over(self):
+        """
+        Remove a stale lock. Waiters that find it stale at the same time
+        take turns on a second lock file and check again under it, so the
+        fresh lock of whoever took over first is never removed.
+        """
+        guard = self.path + ".takeover"
+        if not self._create(guard):
+            # Held for a moment only; one this old was left by a crash
+            if self._is_stale(guard):
+                try:
+                    os.remove(guard)
+                except OSError:
+                    pass
+            return
+        try:
+            if self._is_stale(self.path):
+                os.remove(self.path)
+        except OSError:
+            pass
+        finally:
+            os.remove(guard)
@@ -0,0 +1,146 @@
+import re
+from collections import defaultdict
+
+import pytest
+
+
+class FlakyHistory:
+    """
+    Recent outcomes of every test id, kept in the pytest cache as a string:
+    P = passed, R = passed after a rerun, F = failed (after any reruns).
+
+    A test counts as flaky once it has passed on a rerun or failed in
+    isolation between passes; a run of failures is treated as a real bug.
+    Tests with QUARANTINE_FLAKES such events go to the quarantine lane and
+    come back after RELEASE_AFTER clean passes in a row.
+    """
+
+    CACHE_KEY = "selenium_ecommerce/flaky"
+    KEEP = 20
+    QUARANTINE_FLAKES = 2
+    RELEASE_AFTER = 5
+
+    _ISOLATED_FAILURE = re.compile(r"(?<=[PR])F(?=[PR])")
+
+    def __init__(self, cache):
+        self.cache = cache
+        self.outcomes = cache.get(self.CACHE_KEY, {})
+        self._recorded = {}
+
+    @classmethod
+    def flake_count(cls, outcomes):
+        return outcomes.count("R") + len(cls._ISOLATED_FAILURE.findall(outcomes))
+
+    def is_flaky(self, nodeid):
+        return self.flake_count(self.outcomes.get(nodeid, "")) > 0
+
+    def is_quarantined(self, nodeid):
+        outcomes = self.outcomes.get(nodeid, "")
+        released = outcomes[-self.RELEASE_AFTER:] == "P" * self.RELEASE_AFTER
+        return self.flake_count(outcomes) >= self.QUARANTINE_FLAKES and not released
+
+    def flaky_tests(self):
+        return sorted(nodeid for nodeid in self.outcomes if self.is_flaky(nodeid))
+
+    def quarantined_tests(self):
+        return sorted(nodeid for nodeid in self.outcomes if self.is_quarantined(nodeid))
+
+    def record(self, nodeid, outcome):
+        self._recorded[nodeid] = self._recorded.get(nodeid, "") + outcome
+
+    def save(self):
+        # Re-read first: the other lane may have saved while this one was running
+        outcomes = self.cache.get(self.CACHE_KEY, {})
+        for nodeid, recorded in self._recorded.items():
+            outcomes[nodeid] = (outcomes.get(nodeid, "") + recorded)[-self.KEEP:]
+        self.cache.set(self.CACHE_KEY, outcomes)
+        self.outcomes = outcomes
+
+
+class FlakyRerunPlugin:
+    """
+    Reruns failed tests only when their history says they are flaky, by
+    marking them @pytest.mark.flaky(reruns=N) for pytest-rerunfailures
+    (which keeps the class-scoped browser for the rerun), and books the
+    time spent on reruns. --lane main / quarantine splits known-flaky
+    tests into their own run.
+    """
+
+    LANES = ("all", "main", "quarantine")
+
+    def __init__(self, config):
+        self.config = config
+        self.reruns = config.getoption("--flaky-reruns")
+        self.lane = config.getoption("--lane")
+        self.history = FlakyHistory(config.cache)
+        # Workers use the controller's view so every worker collects the same tests
+        workerinput = getattr(config, "workerinput", {})
+        self.flaky = set(workerinput.get("flaky_tests", self.history.flaky_tests()))
+        self.quarantined = set(workerinput.get("quarantined_tests", self.history.quarantined_tests()))
+        self.rerun_costs = {}
+        self._rerun_seconds = defaultdict(float)
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_configure_node(self, node):
+        node.workerinput["flaky_tests"] = sorted(self.flaky)
+        node.workerinput["quarantined_tests"] = sorted(self.quarantined)
+
+    # ------------------------------------------------------------------
+    #  Quarantine lane & Reruns
+    # ------------------------------------------------------------------
+    def pytest_collection_modifyitems(self, config, items):
+        selected, deselected = [], []
+        for item in items:
+            if self.reruns > 0 and item.nodeid in self.flaky:
+                item.add_marker(pytest.mark.flaky(reruns=self.reruns))
+            quarantined = item.nodeid in self.quarantined
+            if quarantined:
+                item.add_marker(pytest.mark.quarantine)
+            if self.lane == "all" or quarantined == (self.lane == "quarantine"):
+                selected.append(item)
+            else:
+                deselected.append(item)
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = selected
+
+    # ------------------------------------------------------------------
+    #  History & Cost Accounting
+    # ------------------------------------------------------------------
+    def pytest_runtest_logreport(self, report):
+        # pytest-rerunfailures numbers the attempts: report.rerun is 0 for the first one
+        reruns = getattr(report, "rerun", 0)
+        if reruns:
+            self._rerun_seconds[report.nodeid] += report.duration
+        # The failed phase of an attempt that is about to be rerun
+        if report.outcome == "rerun" or report.skipped:
+            return
+        # The test's final outcome: its call, or the setup (e.g. the class login) if that failed
+        if report.when == "call" or (report.when == "setup" and report.failed):
+            if reruns:
+                self.rerun_costs[report.nodeid] = (reruns, round(self._rerun_seconds[report.nodeid], 3),
+                                                   report.outcome)
+            self.history.record(report.nodeid, "F" if report.failed else "R" if reruns else "P")
+
+    def pytest_sessionfinish(self, session):
+        if hasattr(self.config, "workerinput"):
+            return
+        self.history.save()
+        if self.lane == "quarantine" and session.exitstatus == pytest.ExitCode.TESTS_FAILED:
+            print(" Quarantine lane: failures are reported but do not fail the run")
+            session.exitstatus = pytest.ExitCode.OK
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if hasattr(self.config, "workerinput"):
+            return
+        if self.rerun_costs:
+            terminalreporter.section("Flaky reruns")
+            for nodeid, (reruns, seconds, outcome) in sorted(self.rerun_costs.items(),
+                                                             key=lambda row: row[1][1], reverse=True):
+                terminalreporter.write_line(f"  {seconds:7.1f}s  {reruns} rerun(s)  {outcome:<7} {nodeid}")
+            total = sum(seconds for _, seconds, _ in self.rerun_costs.values())
+            terminalreporter.write_line(f"  {total:7.1f}s  spent on reruns in total")
+        newly_quarantined = set(self.history.quarantined_tests()) - self.quarantined
+        if newly_quarantined:
+            terminalreporter.write_line(f" Moved to the quarantine lane from the next run: "
+                                        f"{', '.join(sorted(newly_quarantined))}")
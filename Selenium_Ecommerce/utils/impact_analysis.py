@@ -0,0 +1,354 @@
+"""
+Test impact analysis: which tests depend on which page objects, modules,
+locators and data files, and which of them a change can affect.
+
+Every run records, per test id, what the test touched:
+  - files of the repo modules its test module imports (static import graph),
+  - page object / module classes it instantiated (BaseModule.__init__),
+  - registry locators it looked up ("locator:<name>", BaseModule.find / _target),
+  - data files its parametrize rows came from or that it loaded at runtime.
+The map is kept in the pytest cache (pytest --cache-show selenium_ecommerce/impact).
+
+    pytest Selenium_Ecommerce/tests --changed-since origin/main
+
+runs only the tests whose recorded dependencies changed since that git ref
+(committed, uncommitted and untracked changes). Changes to shared framework
+code (conftest and everything it imports outside pages/ and modules/) run
+everything, and tests without a recorded entry (new tests) always run.
+"""
+import ast
+import functools
+import os
+import re
+import subprocess
+import sys
+
+import pytest
+
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ROOT = os.path.dirname(PACKAGE_DIR)
+PACKAGE = os.path.basename(PACKAGE_DIR)
+
+LOCATORS_FILE = f"{PACKAGE}/utils/locators.py"
+# Changing any of these can affect every test
+RUN_ALL_FILES = {f"{PACKAGE}/conftest.py", f"{PACKAGE}/pytest.ini", f"{PACKAGE}/requirements.txt"}
+# Page objects and modules are matched per test, even though conftest imports some of them
+PER_TEST_DIRS = (f"{PACKAGE}/pages/", f"{PACKAGE}/modules/", f"{PACKAGE}/tests/", f"{PACKAGE}/utils/data/")
+_HUNK = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+
+
+def relative(path):
+    """Repo-relative path with / separators, as git prints it."""
+    return os.path.relpath(os.path.abspath(path), ROOT).replace(os.sep, "/")
+
+
+# -------------------------------------------------------------------
+# Runtime recording
+# -------------------------------------------------------------------
+class DependencyRecorder:
+    """
+    Collects what the current scope touches: a test id while a test runs,
+    or a test module's node id while it is imported (data loaded for
+    @pytest.mark.parametrize). Rows handed out by the data loader are
+    remembered so each parametrized case can be traced to its file.
+    """
+
+    def __init__(self):
+        self.scope = None
+        self._touched = {}
+        self._rows = {}  # id(row) -> (row, data file); the row is kept so the id stays unique
+
+    def start(self, scope):
+        self.scope = scope
+        self._touched.setdefault(scope, set())
+
+    def stop(self):
+        self.scope = None
+
+    def take(self, scope):
+        return self._touched.pop(scope, set())
+
+    def touch(self, dependency):
+        if self.scope is not None:
+            self._touched[self.scope].add(dependency)
+
+    def touch_file(self, path):
+        if self.scope is not None:
+            self.touch(relative(path))
+
+    def touch_class(self, cls):
+        """A page object or module was created: depend on its class and base classes."""
+        if self.scope is None:
+            return
+        for klass in cls.__mro__:
+            module = sys.modules.get(klass.__module__)
+            path = getattr(module, "__file__", None)
+            if path and klass.__module__.startswith(PACKAGE + "."):
+                self.touch_file(path)
+
+    def touch_locator(self, locator):
+        name = getattr(locator, "name", None)
+        if name:
+            self.touch(f"locator:{name}")
+
+    def touch_rows(self, path, rows):
+        self.touch_file(path)
+        for row in rows:
+            self._rows[id(row)] = (row, relative(path))
+
+    def data_file_of(self, value):
+        entry = self._rows.get(id(value))
+        return entry[1] if entry is not None and entry[0] is value else None
+
+
+recorder = DependencyRecorder()
+
+
+# -------------------------------------------------------------------
+# Static import graph
+# -------------------------------------------------------------------
+def _module_file(module):
+    base = os.path.join(ROOT, *module.split("."))
+    for path in (base + ".py", os.path.join(base, "__init__.py")):
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _imported_files(path):
+    """Files of the repo modules a source file imports directly."""
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), path)
+    modules = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            modules.add(node.module)
+            modules.update(f"{node.module}.{alias.name}" for alias in node.names)
+    files = (_module_file(m) for m in modules if m.split(".")[0] == PACKAGE)
+    return frozenset(f for f in files if f)
+
+
+@functools.lru_cache(maxsize=None)
+def import_closure(path):
+    """Repo-relative paths of path and every repo module it imports, directly or not."""
+    seen, todo = set(), [os.path.abspath(path)]
+    while todo:
+        current = todo.pop()
+        if current not in seen:
+            seen.add(current)
+            todo.extend(_imported_files(current))
+    return frozenset(relative(p) for p in seen)
+
+
+# -------------------------------------------------------------------
+# Changes since a git ref
+# -------------------------------------------------------------------
+def _git(*args):
+    try:
+        return subprocess.run(["git", "-C", ROOT, *args], capture_output=True, text=True,
+                              check=True).stdout
+    except (OSError, subprocess.CalledProcessError) as e:
+        raise pytest.UsageError(f"--changed-since: git {' '.join(args)} failed: "
+                                f"{getattr(e, 'stderr', '') or e}")
+
+
+def _locator_spans(source):
+    """{(first line, last line): locator name} for every `NAME = add("name", ...)` statement."""
+    spans = {}
+    for node in ast.parse(source).body:
+        value = getattr(node, "value", None)
+        if (isinstance(node, ast.Assign) and isinstance(value, ast.Call)
+                and getattr(value.func, "id", None) == "add" and value.args
+                and isinstance(value.args[0], ast.Constant)):
+            spans[(node.lineno, node.end_lineno)] = value.args[0].value
+    return spans
+
+
+def _names_on_lines(source, lines):
+    """Locator names defined on the given line numbers; None if a line is not part of a locator."""
+    spans = _locator_spans(source)
+    text = source.splitlines()
+    names = set()
+    for number in lines:
+        name = next((n for (first, last), n in spans.items() if first <= number <= last), None)
+        if name is not None:
+            names.add(name)
+        elif number <= len(text) and text[number - 1].strip() and not text[number - 1].strip().startswith("#"):
+            return None
+    return names
+
+
+def changed_locators(ref, path=LOCATORS_FILE):
+    """Names of the locators added, removed or edited in path since ref; None when other code changed."""
+    old_lines, new_lines = [], []
+    for line in _git("diff", "-U0", ref, "--", path).splitlines():
+        hunk = _HUNK.match(line)
+        if hunk:
+            old_start, old_count, new_start, new_count = hunk.groups()
+            old_lines += range(int(old_start), int(old_start) + int(1 if old_count is None else old_count))
+            new_lines += range(int(new_start), int(new_start) + int(1 if new_count is None else new_count))
+    try:
+        old_source = _git("show", f"{ref}:{path}")
+        with open(os.path.join(ROOT, path), encoding="utf-8") as f:
+            new_source = f.read()
+    except (OSError, pytest.UsageError):
+        return None
+    old_names = _names_on_lines(old_source, old_lines)
+    new_names = _names_on_lines(new_source, new_lines)
+    if old_names is None or new_names is None:
+        return None
+    return old_names | new_names
+
+
+def changes_since(ref):
+    """
+    {"ref", "files", "locators", "run_all"}: the repo files and locator names
+    changed since ref, or the reason (run_all) every test has to run.
+    """
+    _git("rev-parse", "--verify", f"{ref}^{{commit}}")
+    paths = set(_git("diff", "--name-only", ref, "--").split())
+    paths.update(_git("ls-files", "--others", "--exclude-standard").split())
+    framework = {p for p in import_closure(os.path.join(PACKAGE_DIR, "conftest.py"))
+                 if not p.startswith(PER_TEST_DIRS)}
+
+    changes = {"ref": ref, "files": [], "locators": [], "run_all": None}
+    for path in sorted(paths):
+        if path == LOCATORS_FILE:
+            names = changed_locators(ref)
+            if names is None:
+                changes["run_all"] = f"{path} changed outside the locator definitions"
+            else:
+                changes["locators"] += sorted(names)
+        elif path in RUN_ALL_FILES or path in framework:
+            changes["run_all"] = f"framework file {path} changed"
+        else:
+            changes["files"].append(path)
+    return changes
+
+
+def is_impacted(dependencies, changes):
+    if changes["run_all"]:
+        return True
+    return (any(f in dependencies for f in changes["files"])
+            or any(f"locator:{name}" in dependencies for name in changes["locators"]))
+
+
+# -------------------------------------------------------------------
+# Plugin
+# -------------------------------------------------------------------
+class ImpactAnalysisPlugin:
+    """
+    Records each test's dependencies into the pytest cache and, with
+    --changed-since, deselects the tests no change can have affected.
+    The controller works out the changes once and hands them to the xdist
+    workers, which do the selection (they are the ones collecting).
+    """
+
+    CACHE_KEY = "selenium_ecommerce/impact"
+
+    def __init__(self, config):
+        self.config = config
+        self.map = config.cache.get(self.CACHE_KEY, {})
+        self.collected = {}   # test id -> dependencies known at collection
+        self.module_data = {}
+        self.recorded = {}
+        self.failed = set()
+        ref = config.getoption("--changed-since")
+        workerinput = getattr(config, "workerinput", {})
+        self.changes = workerinput.get("impact_changes") or (changes_since(ref) if ref else None)
+        if self.changes and not hasattr(config, "workerinput"):
+            print(f" Impact analysis since {ref}: {self.describe(self.changes)}")
+
+    @staticmethod
+    def describe(changes):
+        if changes["run_all"]:
+            return f"running every test ({changes['run_all']})"
+        return (f"{len(changes['files'])} changed file(s), {len(changes['locators'])} changed locator(s)"
+                + "".join(f"\n   {path}" for path in changes["files"])
+                + "".join(f"\n   locator:{name}" for name in changes["locators"]))
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_configure_node(self, node):
+        if self.changes:
+            node.workerinput["impact_changes"] = self.changes
+
+    # ------------------------------------------------------------------
+    #  Collection: static imports and parametrize data
+    # ------------------------------------------------------------------
+    def pytest_collectstart(self, collector):
+        if isinstance(collector, pytest.Module):
+            recorder.start(collector.nodeid)
+
+    def pytest_collectreport(self, report):
+        if recorder.scope == report.nodeid:
+            recorder.stop()
+            self.module_data[report.nodeid] = recorder.take(report.nodeid)
+
+    @staticmethod
+    def _row_files(item):
+        """Data files the item's parametrize values came from."""
+        params = getattr(getattr(item, "callspec", None), "params", {})
+        return {recorder.data_file_of(value) for value in params.values()} - {None}
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, config, items):
+        traced = {}
+        for item in items:
+            traced.setdefault(item.getparent(pytest.Module).nodeid, set()).update(self._row_files(item))
+        for item in items:
+            module = item.getparent(pytest.Module).nodeid
+            # Data a module loaded for anything but parametrize rows stays a dependency of all its tests
+            untraced = self.module_data.get(module, set()) - traced[module]
+            self.collected[item.nodeid] = set(import_closure(str(item.path))) | self._row_files(item) | untraced
+        if not self.changes:
+            return
+
+        selected, deselected = [], []
+        for item in items:
+            known = item.nodeid in self.map
+            dependencies = self.collected[item.nodeid] | set(self.map.get(item.nodeid, ()))
+            (selected if not known or is_impacted(dependencies, self.changes) else deselected).append(item)
+        print(f" Impact analysis: {len(selected)} of {len(items)} tests affected "
+              f"(changes since {self.changes['ref']})")
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = selected
+
+    # ------------------------------------------------------------------
+    #  Runtime recording
+    # ------------------------------------------------------------------
+    def pytest_runtest_logstart(self, nodeid, location):
+        recorder.start(nodeid)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        report = outcome.get_result()
+        if report.when == "teardown":
+            dependencies = self.collected.get(item.nodeid, set()) | recorder.take(item.nodeid)
+            recorder.stop()
+            report.user_properties.append(("impact", sorted(dependencies)))
+
+    def pytest_runtest_logreport(self, report):
+        # Runs on the controller for every worker's reports (and in a plain run)
+        if report.failed:
+            self.failed.add(report.nodeid)
+        if report.when == "teardown":
+            recorder.take(report.nodeid)  # xdist controller: nothing runs here, drop the empty scope
+            for name, value in report.user_properties:
+                if name == "impact":
+                    self.recorded[report.nodeid] = value
+
+    def pytest_sessionfinish(self, session):
+        if hasattr(self.config, "workerinput") or not self.recorded:
+            return
+        # A failed test may have stopped early: keep what earlier runs saw it touch
+        stored = self.config.cache.get(self.CACHE_KEY, {})
+        for nodeid, dependencies in self.recorded.items():
+            if nodeid in self.failed:
+                dependencies = sorted(set(dependencies) | set(stored.get(nodeid, ())))
+            stored[nodeid] = dependencies
+        self.config.cache.set(self.CACHE_KEY, stored)
@@ -0,0 +1,159 @@
+import time
+from collections import namedtuple
+
+import allure
+from selenium.webdriver.common.by import By
+
+from Selenium_Ecommerce.pages.Keyword import Keywords
+from Selenium_Ecommerce.utils.data_loader import cached_parse
+from Selenium_Ecommerce.utils.profiler import profiler
+from Selenium_Ecommerce.utils.read_data import read_keyword_sheets
+
+
+# LocatorType column -> Selenium By constant
+LOCATOR_TYPES = {
+    "id": By.ID,
+    "name": By.NAME,
+    "xpath": By.XPATH,
+    "css": By.CSS_SELECTOR,
+    "css_selector": By.CSS_SELECTOR,
+    "class_name": By.CLASS_NAME,
+    "link_text": By.LINK_TEXT,
+    "partial_link_text": By.PARTIAL_LINK_TEXT,
+    "tag_name": By.TAG_NAME,
+}
+
+# Sheet keyword -> (Keywords method, arguments bound from the row)
+#   locator = (By, LocatorValue), value = LocatorValue, data = TestData
+# close_browser has no method: the driver pool owns the browser.
+KEYWORD_TABLE = {
+    "open_url": ("navigate_to_url", ("value",)),
+    "navigate_to_url": ("navigate_to_url", ("value",)),
+    "input_text": ("enter_text", ("locator", "data")),
+    "enter_text": ("enter_text", ("locator", "data")),
+    "click_element": ("click_element", ("locator",)),
+    "verify_title": ("verify_page_title", ("value",)),
+    "verify_page_title": ("verify_page_title", ("value",)),
+    "take_screenshot": ("take_screenshot", ("folder", "data")),
+    "login": ("login", ("value", "data")),
+    "logout": ("logout", ()),
+    "verify_login_successful": ("verify_login_successful", ()),
+    "verify_login_failed": ("verify_login_failed", ()),
+    "open_orders_page": ("open_orders_page", ()),
+    "search_order_by_id": ("search_order_by_id", ("data",)),
+    "open_products_page": ("open_products_page", ()),
+    "search_product_by_name": ("search_product_by_name", ("data",)),
+    "close_browser": (None, ()),
+}
+
+SCREENSHOT_FOLDER = "test_keyword"
+
+CompiledStep = namedtuple("CompiledStep", "step keyword method args")
+StepResult = namedtuple("StepResult", "step keyword seconds outcome")
+
+
+class KeywordCompileError(ValueError):
+    """A keyword sheet row that cannot be turned into an executable step."""
+
+
+# -------------------------------------------------------------------
+# Compilation
+# -------------------------------------------------------------------
+def compile_steps(rows, scenario="Sheet"):
+    """Validate keyword rows and bind them to Keywords methods and arguments."""
+    plan = []
+
+    for index, row in enumerate(rows, start=1):
+        step = row.get("Step") or index
+        keyword = str(row.get("Keyword") or "").strip().lower()
+        where = f"{scenario} step {step}"
+
+        if keyword not in KEYWORD_TABLE:
+            raise KeywordCompileError(f"{where}: unknown keyword '{row.get('Keyword')}'")
+        method, arg_kinds = KEYWORD_TABLE[keyword]
+        if method is not None and not callable(getattr(Keywords, method, None)):
+            raise KeywordCompileError(f"{where}: Keywords has no method '{method}'")
+
+        value = row.get("LocatorValue")
+        data = row.get("TestData")
+        args = []
+        for kind in arg_kinds:
+            if kind == "locator":
+                locator_type = str(row.get("LocatorType") or "").strip().lower()
+                if locator_type not in LOCATOR_TYPES:
+                    raise KeywordCompileError(f"{where}: unsupported locator type '{row.get('LocatorType')}'")
+                if not value:
+                    raise KeywordCompileError(f"{where}: '{keyword}' needs a LocatorValue")
+                args.extend([LOCATOR_TYPES[locator_type], str(value)])
+            elif kind == "value":
+                if value is None:
+                    raise KeywordCompileError(f"{where}: '{keyword}' needs a LocatorValue")
+                args.append(str(value))
+            elif kind == "data":
+                args.append("" if data is None else str(data))
+            elif kind == "folder":
+                args.append(SCREENSHOT_FOLDER)
+
+        plan.append(CompiledStep(step, keyword, method, tuple(args)))
+
+    return plan
+
+
+def compile_workbook(file_path):
+    """Compile every sheet of a keyword workbook into {scenario: [CompiledStep, ...]}."""
+    return {sheet: compile_steps(rows, sheet) for sheet, rows in read_keyword_sheets(file_path).items()}
+
+
+def load_plan(file_path):
+    """Compiled plan for a workbook, compiled once and shared by modules and workers."""
+    # Recompile when the keyword or locator tables change, not only the workbook
+    return cached_parse(file_path, compile_workbook, cache_tag=repr((KEYWORD_TABLE, LOCATOR_TYPES)))
+
+
+# -------------------------------------------------------------------
+# Execution
+# -------------------------------------------------------------------
+class KeywordEngine:
+    """Runs compiled keyword scenarios against a driver and times every step."""
+
+    def __init__(self, driver):
+        self.keywords = Keywords(driver)
+
+    def run(self, steps, scenario="Sheet"):
+        """
+        Execute the steps in order. A keyword returning False fails the
+        scenario with an AssertionError. Returns a list of StepResult.
+        """
+        results = []
+        try:
+            for step in steps:
+                if step.method is None:
+                    results.append(StepResult(step.step, step.keyword, 0.0, "skipped"))
+                    continue
+
+                start = time.perf_counter()
+                with allure.step(f"{step.step}. {step.keyword} {' '.join(map(str, step.args))}"), \
+                        profiler.record(f"keyword.{step.keyword}", f"{scenario}#{step.step}"):
+                    outcome = getattr(self.keywords, step.method)(*step.args)
+                seconds = time.perf_counter() - start
+
+                if outcome is False:
+                    results.append(StepResult(step.step, step.keyword, seconds, "failed"))
+                    raise AssertionError(f"{scenario} step {step.step} '{step.keyword}' failed")
+                results.append(StepResult(step.step, step.keyword, seconds, "passed"))
+        finally:
+            report = self.format_timings(results, scenario)
+            print(report)
+            allure.attach(report, name=f"Keyword timings - {scenario}", attachment_type=allure.attachment_type.TEXT)
+
+        return results
+
+    @staticmethod
+    def format_timings(results, scenario="Sheet"):
+        """Per-step timing table, slowest step flagged."""
+        slowest = max(results, key=lambda r: r.seconds, default=None)
+        lines = [f" Keyword timings for '{scenario}' ({sum(r.seconds for r in results):.2f}s total):"]
+        for r in results:
+            flag = "  <-- slowest" if r is slowest and r.seconds > 0 else ""
+            lines.append(f"  {r.step!s:>4} {r.keyword:<25} {r.seconds:7.2f}s  {r.outcome}{flag}")
+        return "\n".join(lines)
@@ -0,0 +1,365 @@
+"""
+In-process stand-in for a Selenium Grid hub on this machine.
+
+Exposes the WebDriver HTTP API (what webdriver.Remote talks to), routes
+each new session to a free local browser slot and proxies the session's
+commands to that slot's driver (chromedriver / geckodriver / msedgedriver).
+Session requests beyond the per-browser slot limit wait in a FIFO queue.
+A session that gets no command for Config.GRID_SESSION_TIMEOUT seconds
+(its client crashed without closing it) is closed to free its slot.
+
+In-process (what --local-grid does, on the pytest controller):
+    grid = LocalGrid(slots={"chrome": 4, "firefox": 2}).start()
+    Config.GRID_URL = grid.url
+
+As a separate process:
+    python -m Selenium_Ecommerce.utils.local_grid --port 4444 --slots chrome=4,firefox=2
+    pytest ... --grid
+"""
+import argparse
+import json
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import urllib3
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.edge.service import Service as EdgeService
+from selenium.webdriver.firefox.service import Service as FirefoxService
+
+from Selenium_Ecommerce.utils.config import Config
+from Selenium_Ecommerce.utils.driver_services import driver_services
+
+SERVICES = {"chrome": ChromeService, "firefox": FirefoxService, "edge": EdgeService}
+BROWSER_NAMES = {"chrome": "chrome", "firefox": "firefox", "microsoftedge": "edge", "msedge": "edge"}
+
+
+def parse_slots(value):
+    """'chrome=4,firefox=2' -> {"chrome": 4, "firefox": 2}"""
+    slots = {}
+    for part in value.split(","):
+        browser, _, count = part.partition("=")
+        if browser.strip():
+            slots[browser.strip().lower()] = int(count)
+    return slots
+
+
+def requested_browser(payload):
+    capabilities = payload.get("capabilities", {})
+    for match in [capabilities.get("alwaysMatch", {})] + capabilities.get("firstMatch", []):
+        name = match.get("browserName")
+        if name:
+            return BROWSER_NAMES.get(name.lower(), name.lower())
+    return None
+
+
+def webdriver_error(error, message):
+    return json.dumps({"value": {"error": error, "message": message, "stacktrace": ""}})
+
+
+class Slot:
+    """One browser a node can run at a time, with its own driver process (started on first use)."""
+
+    def __init__(self, browser, index):
+        self.browser = browser
+        self.index = index
+        self.service = None
+        self.session_id = None
+        self.busy_since = None
+        self.busy_seconds = 0.0
+        self.last_command = None
+        self.commands_running = 0
+
+    def driver_url(self):
+        if self.service is None or self.service.process is None or self.service.process.poll() is not None:
+            self.service = SERVICES[self.browser](driver_services.resolver.resolve(self.browser))
+            self.service.start()
+        return self.service.service_url
+
+    def stop(self):
+        if self.service is not None:
+            self.service.stop()
+            self.service = None
+
+
+class LocalGrid:
+    """
+    Slots per browser (Config.LOCAL_GRID_SLOTS), a FIFO queue per browser for
+    session requests that find every slot busy, and the numbers needed to
+    tune concurrency: queue wait per session and how busy each browser's
+    slots were over the grid's uptime. Sessions idle for session_timeout
+    seconds are closed, so a crashed client does not keep its slot.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, slots=None, queue_timeout=Config.GRID_QUEUE_TIMEOUT,
+                 session_timeout=Config.GRID_SESSION_TIMEOUT):
+        self.host = host
+        self.port = port
+        self.queue_timeout = queue_timeout
+        self.session_timeout = session_timeout
+        self.slots = {browser: [Slot(browser, i) for i in range(count)]
+                      for browser, count in (slots or Config.LOCAL_GRID_SLOTS).items()}
+        self.sessions = {}  # session id -> Slot
+        self.waits = {browser: [] for browser in self.slots}
+        self.peak_queue = {browser: 0 for browser in self.slots}
+        self.abandoned = {browser: 0 for browser in self.slots}
+        self.http = urllib3.PoolManager(maxsize=sum(len(s) for s in self.slots.values()) or 1)
+        self._queues = {browser: deque() for browser in self.slots}
+        self._free = threading.Condition()
+        self._started = None
+        self._httpd = None
+        self._stopping = threading.Event()
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}/wd/hub"
+
+    def start(self):
+        self._httpd = ThreadingHTTPServer((self.host, self.port), GridRequestHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.grid = self
+        self.port = self._httpd.server_address[1]
+        threading.Thread(target=self._httpd.serve_forever, name="local-grid", daemon=True).start()
+        threading.Thread(target=self._reap_loop, name="local-grid-reaper", daemon=True).start()
+        self._started = time.monotonic()
+        print(f" Local grid running at {self.url} with slots "
+              f"{', '.join(f'{b}={len(s)}' for b, s in self.slots.items())}")
+        return self
+
+    def stop(self):
+        self._stopping.set()
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+        for session_id, slot in list(self.sessions.items()):
+            self._quit_session(slot, session_id)
+        for slots in self.slots.values():
+            for slot in slots:
+                slot.stop()
+
+    # -------------------------------------------------------------------
+    # Slots & queue
+    # -------------------------------------------------------------------
+    def acquire(self, browser):
+        """Wait (FIFO) for a free slot of the browser; None after queue_timeout."""
+        ticket = object()
+        queued = time.monotonic()
+        with self._free:
+            queue = self._queues[browser]
+            queue.append(ticket)
+            self.peak_queue[browser] = max(self.peak_queue[browser], len(queue))
+            while True:
+                slot = next((s for s in self.slots[browser] if s.session_id is None and s.busy_since is None), None)
+                if queue[0] is ticket and slot is not None:
+                    queue.popleft()
+                    slot.busy_since = time.monotonic()
+                    self.waits[browser].append(slot.busy_since - queued)
+                    self._free.notify_all()  # the next ticket may find another free slot
+                    return slot
+                remaining = queued + self.queue_timeout - time.monotonic()
+                if remaining <= 0:
+                    queue.remove(ticket)
+                    self._free.notify_all()
+                    return None
+                self._free.wait(remaining)
+
+    def start_session(self, slot, session_id):
+        with self._free:
+            slot.session_id = session_id
+            slot.last_command = time.monotonic()
+            self.sessions[session_id] = slot
+
+    def release(self, slot, session_id=None):
+        """Free the slot; with session_id, only if it still runs that session."""
+        with self._free:
+            if session_id is not None and slot.session_id != session_id:
+                return
+            self.sessions.pop(slot.session_id, None)
+            if slot.busy_since is not None:
+                slot.busy_seconds += time.monotonic() - slot.busy_since
+            slot.session_id = slot.busy_since = None
+            self._free.notify_all()
+
+    def command_started(self, slot):
+        with self._free:
+            slot.commands_running += 1
+            slot.last_command = time.monotonic()
+
+    def command_finished(self, slot):
+        with self._free:
+            slot.commands_running -= 1
+            slot.last_command = time.monotonic()
+
+    def reap_abandoned(self):
+        """Close the sessions that got no command for session_timeout seconds; returns how many."""
+        now = time.monotonic()
+        with self._free:
+            abandoned = [(session_id, slot) for session_id, slot in self.sessions.items()
+                         if not slot.commands_running and now - slot.last_command > self.session_timeout]
+        for session_id, slot in abandoned:
+            print(f" Local grid: closing {slot.browser} session {session_id}, "
+                  f"no command for {self.session_timeout}s (client gone?)")
+            self.abandoned[slot.browser] += 1
+            self._quit_session(slot, session_id)
+        return len(abandoned)
+
+    def _reap_loop(self):
+        while not self._stopping.wait(min(self.session_timeout / 4, 15)):
+            self.reap_abandoned()
+
+    def _quit_session(self, slot, session_id):
+        """Close a session its client left open (client gone, or grid shutting down)."""
+        if slot.service is not None:
+            try:
+                self.http.request("DELETE", f"{slot.service.service_url}/session/{session_id}", timeout=30)
+            except urllib3.exceptions.HTTPError:
+                pass
+        self.release(slot, session_id)
+
+    # -------------------------------------------------------------------
+    # Stats
+    # -------------------------------------------------------------------
+    def stats(self):
+        uptime = time.monotonic() - self._started if self._started else 0.0
+        now = time.monotonic()
+        stats = {}
+        for browser, slots in self.slots.items():
+            waits = self.waits[browser]
+            busy = sum(s.busy_seconds + (now - s.busy_since if s.busy_since else 0) for s in slots)
+            stats[browser] = {
+                "slots": len(slots),
+                "sessions": len(waits),
+                "queued_sessions": sum(1 for w in waits if w > 0.05),
+                "mean_wait_s": round(sum(waits) / len(waits), 2) if waits else 0.0,
+                "max_wait_s": round(max(waits), 2) if waits else 0.0,
+                "peak_queue": self.peak_queue[browser],
+                "abandoned_sessions": self.abandoned[browser],
+                "utilization": round(busy / (len(slots) * uptime), 3) if slots and uptime else 0.0,
+            }
+        return stats
+
+    @staticmethod
+    def format_summary(stats):
+        lines = [f"  {'browser':<8} {'slots':>5} {'sessions':>8} {'queued':>6} {'mean wait':>9} "
+                 f"{'max wait':>8} {'peak queue':>10} {'busy':>5} {'abandoned':>9}"]
+        for browser, s in stats.items():
+            lines.append(f"  {browser:<8} {s['slots']:5d} {s['sessions']:8d} {s['queued_sessions']:6d} "
+                         f"{s['mean_wait_s']:8.1f}s {s['max_wait_s']:7.1f}s {s['peak_queue']:10d} "
+                         f"{s['utilization']:5.0%} {s['abandoned_sessions']:9d}")
+        return "\n".join(lines)
+
+
+class GridRequestHandler(BaseHTTPRequestHandler):
+    """WebDriver endpoint: /session starts a session on a slot, /session/<id>/... is proxied to it."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    @property
+    def grid(self):
+        return self.server.grid
+
+    def _send(self, status, body, content_type="application/json; charset=utf-8"):
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def do_GET(self):
+        self._route("GET")
+
+    def do_POST(self):
+        self._route("POST")
+
+    def do_DELETE(self):
+        self._route("DELETE")
+
+    def _route(self, method):
+        path = self.path[len("/wd/hub"):] if self.path.startswith("/wd/hub") else self.path
+        body = self._body()
+        parts = path.strip("/").split("/")
+
+        if path.rstrip("/") == "/status":
+            return self._send(200, json.dumps({"value": {"ready": True, "message": "Local grid ready",
+                                                         "stats": self.grid.stats()}}))
+        if parts == ["session"] and method == "POST":
+            return self._new_session(body)
+        if parts[0] != "session" or len(parts) < 2 or parts[1] not in self.grid.sessions:
+            return self._send(404, webdriver_error("invalid session id", f"No session for {path}"))
+
+        slot = self.grid.sessions[parts[1]]
+        self.grid.command_started(slot)
+        try:
+            status, data, content_type = self._forward(slot, method, path, body)
+        except urllib3.exceptions.HTTPError as e:
+            # The slot's driver died: free the slot, the session is gone with it
+            self.grid.release(slot, parts[1])
+            return self._send(500, webdriver_error("unknown error", f"{slot.browser} node unreachable: {e}"))
+        finally:
+            self.grid.command_finished(slot)
+        if method == "DELETE" and len(parts) == 2:
+            self.grid.release(slot, parts[1])
+        self._send(status, data, content_type)
+
+    def _new_session(self, body):
+        try:
+            browser = requested_browser(json.loads(body or b"{}"))
+        except ValueError:
+            return self._send(400, webdriver_error("invalid argument", "Malformed new session request"))
+        if browser not in self.grid.slots:
+            return self._send(500, webdriver_error("session not created",
+                                                   f"No slots for browser {browser!r} on the local grid"))
+
+        slot = self.grid.acquire(browser)
+        if slot is None:
+            return self._send(500, webdriver_error("session not created",
+                                                   f"Timed out after {self.grid.queue_timeout}s in the {browser} queue"))
+        try:
+            status, data, content_type = self._forward(slot, "POST", "/session", body)
+            session_id = json.loads(data).get("value", {}).get("sessionId") if status == 200 else None
+        except Exception as e:
+            status, data, content_type, session_id = 500, webdriver_error("session not created", str(e)), None, None
+        if session_id is None:
+            self.grid.release(slot)
+        else:
+            self.grid.start_session(slot, session_id)
+        self._send(status, data, content_type or "application/json; charset=utf-8")
+
+    def _forward(self, slot, method, path, body):
+        response = self.grid.http.request(method, slot.driver_url() + path, body=body or None,
+                                          headers={"Content-Type": "application/json; charset=utf-8"},
+                                          timeout=urllib3.Timeout(connect=10, read=Config.GRID_COMMAND_TIMEOUT),
+                                          retries=False)
+        return response.status, response.data, response.headers.get("Content-Type")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local stand-in for a Selenium Grid hub")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=4444)
+    parser.add_argument("--slots", default=None, help="Per-browser slot limits, e.g. chrome=4,firefox=2")
+    args = parser.parse_args(argv)
+    grid = LocalGrid(args.host, args.port, parse_slots(args.slots) if args.slots else None).start()
+    try:
+        while True:
+            time.sleep(60)
+            print(grid.format_summary(grid.stats()))
+    except KeyboardInterrupt:
+        grid.stop()
+        print(grid.format_summary(grid.stats()))
+
+
+if __name__ == "__main__":
+    main()
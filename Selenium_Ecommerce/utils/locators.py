@@ -0,0 +1,149 @@
+from selenium.webdriver.common.by import By
+
+
+class Locator(tuple):
+    """
+    A named (By, value) pair. It is still a plain 2-tuple, so existing code
+    like find_element(*locator) and EC.presence_of_element_located(locator)
+    keeps working; the name is used for caching and profiling.
+    """
+
+    def __new__(cls, name, by, value):
+        locator = super().__new__(cls, (by, value))
+        locator.name = name
+        return locator
+
+    @property
+    def by(self):
+        return self[0]
+
+    @property
+    def value(self):
+        return self[1]
+
+    @property
+    def is_fast(self):
+        """ID / NAME / CSS lookups; XPath evaluates against the whole document."""
+        return self.by != By.XPATH
+
+    def format(self, **kwargs):
+        """Copy of the locator with {placeholders} in the value filled in."""
+        return Locator(self.name, self.by, self.value.format(**kwargs))
+
+    def __repr__(self):
+        return f"Locator({self.name!r}, {self.by!r}, {self.value!r})"
+
+
+class LocatorRegistry:
+    """All page locators by name, with a reverse index on (By, value)."""
+
+    def __init__(self):
+        self._by_name = {}
+        self._by_pair = {}
+
+    def add(self, name, by, value):
+        """Register a locator. A name can only be bound to one selector."""
+        locator = Locator(name, by, value)
+        existing = self._by_name.get(name)
+        if existing is not None and tuple(existing) != tuple(locator):
+            raise ValueError(f"Locator '{name}' is already registered as {existing[0]}={existing[1]}")
+        self._by_name[name] = locator
+        self._by_pair.setdefault((by, value), locator)
+        return locator
+
+    def get(self, name):
+        return self._by_name[name]
+
+    def lookup(self, by, value):
+        """The registered locator for a (By, value) pair, or None."""
+        return self._by_pair.get((by, value))
+
+    def all(self):
+        return list(self._by_name.values())
+
+    def slow(self):
+        """Locators that still need an XPath (text matches, ancestors)."""
+        return [locator for locator in self._by_name.values() if not locator.is_fast]
+
+
+registry = LocatorRegistry()
+add = registry.add
+
+
+# -------------------------------------------------------------------
+# Shared layout
+# -------------------------------------------------------------------
+CONTENT_WRAPPER = add("layout.content_wrapper", By.CSS_SELECTOR, "div.content-wrapper")
+AJAX_BUSY = add("layout.ajax_busy", By.ID, "ajaxBusy")
+LOGOUT_LINK = add("layout.logout_link", By.CSS_SELECTOR, "a[href='/logout']")
+USER_DROPDOWN = add("layout.user_dropdown", By.XPATH, "//a[contains(text(),'Hello')]")
+DASHBOARD_HEADER = add("layout.dashboard_header", By.XPATH, "//h1[normalize-space()='Dashboard']")
+
+# Sidebar entries only differ by their text
+SALES_MENU = add("menu.sales", By.XPATH, "//p[normalize-space()='Sales']")
+ORDERS_SUBMENU = add("menu.orders", By.XPATH, "//p[normalize-space()='Orders']")
+CATALOG_MENU = add("menu.catalog", By.XPATH, "//p[normalize-space()='Catalog']")
+PRODUCTS_SUBMENU = add("menu.products", By.XPATH, "//p[normalize-space()='Products']")
+CUSTOMERS_MENU = add("menu.customers", By.XPATH, "//a[@href='#']//p[contains(text(),'Customers')]")
+CUSTOMERS_MENU_LINK = add("menu.customers_link", By.XPATH, "//a[@href='#']//p[contains(.,'Customers')]/ancestor::a")
+CUSTOMERS_ITEM = add("menu.customers_item", By.CSS_SELECTOR, "a.nav-link[href='/Admin/Customer/List'] > p")
+
+# -------------------------------------------------------------------
+# Login page
+# -------------------------------------------------------------------
+LOGIN_EMAIL = add("login.email", By.ID, "Email")
+LOGIN_PASSWORD = add("login.password", By.ID, "Password")
+LOGIN_BUTTON = add("login.button", By.CSS_SELECTOR, "button.login-button")
+LOGIN_REMEMBER_ME = add("login.remember_me", By.ID, "RememberMe")
+LOGIN_EMAIL_ERROR = add("login.email_error", By.ID, "Email-error")
+LOGIN_ERROR = add("login.error", By.CSS_SELECTOR, "div.message-error.validation-summary-errors")
+LOGIN_ERROR_ANY = add("login.error_any", By.CSS_SELECTOR, ".message-error")
+
+# -------------------------------------------------------------------
+# Customers
+# -------------------------------------------------------------------
+CUSTOMERS_HEADER = add("customers.header", By.XPATH, "//h1[contains(text(),'Customers')]")
+CUSTOMERS_SEARCH_EMAIL = add("customers.search_email", By.ID, "SearchEmail")
+CUSTOMERS_SEARCH_FIRST_NAME = add("customers.search_first_name", By.ID, "SearchFirstName")
+CUSTOMERS_SEARCH_LAST_NAME = add("customers.search_last_name", By.ID, "SearchLastName")
+CUSTOMERS_SEARCH_BUTTON = add("customers.search_button", By.ID, "search-customers")
+CUSTOMERS_ROWS = add("customers.rows", By.CSS_SELECTOR, "#customers-grid > tbody > tr")
+CUSTOMERS_ROLE_CONTAINER = add("customers.role_container", By.CSS_SELECTOR,
+                               "span.select2-selection.select2-selection--multiple")
+CUSTOMERS_ROLE_INPUT = add("customers.role_input", By.CSS_SELECTOR, "input.select2-search__field")
+CUSTOMERS_ROLE_OPTION = add("customers.role_option", By.XPATH,
+                            "//li[contains(@class,'select2-results__option') and normalize-space(text())='{role}']")
+CUSTOMERS_MORE_INFO = add("customers.more_info", By.XPATH,
+                          "//a[@href='/Admin/Customer/List' and contains(.,'More info')]")
+CUSTOMERS_ADD_NEW = add("customers.add_new", By.CSS_SELECTOR, "a.btn.btn-primary[href='/Admin/Customer/Create']")
+
+CUSTOMER_FIRST_NAME = add("customer.first_name", By.ID, "FirstName")
+CUSTOMER_LAST_NAME = add("customer.last_name", By.ID, "LastName")
+CUSTOMER_EMAIL = add("customer.email", By.ID, "Email")
+CUSTOMER_PASSWORD = add("customer.password", By.ID, "Password")
+CUSTOMER_SAVE = add("customer.save", By.NAME, "save")
+CUSTOMER_SAVED = add("customer.saved", By.XPATH,
+                     "//div[contains(@class, 'alert-success') and contains(text(), 'added successfully')]")
+CUSTOMER_DUPLICATE_EMAIL = add("customer.duplicate_email", By.XPATH,
+                               "//li[contains(text(),'Email is already registered')]")
+
+# -------------------------------------------------------------------
+# Orders
+# -------------------------------------------------------------------
+ORDERS_GO_TO_NUMBER = add("orders.go_to_number", By.ID, "GoDirectlyToCustomOrderNumber")
+ORDERS_GO_BUTTON = add("orders.go_button", By.ID, "go-to-order-by-number")
+ORDERS_BILLING_EMAIL = add("orders.billing_email", By.ID, "BillingEmail")
+ORDERS_BILLING_LAST_NAME = add("orders.billing_last_name", By.ID, "BillingLastName")
+ORDERS_SEARCH_BUTTON = add("orders.search_button", By.ID, "search-orders")
+ORDERS_STATUS_CELL = add("orders.status_cell", By.CSS_SELECTOR, "#orders-grid > tbody > tr:first-child > td:nth-child(3)")
+ORDERS_ROWS = add("orders.rows", By.CSS_SELECTOR, "#orders-grid > tbody > tr")
+ORDER_STATUS = add("order.status", By.CSS_SELECTOR, "div[class='font-weight-bold']")
+ORDER_STATUS_BOX = add("order.status_box", By.CSS_SELECTOR,
+                       "div.input-group-text.align-items-start > div.font-weight-bold")
+
+# -------------------------------------------------------------------
+# Products
+# -------------------------------------------------------------------
+PRODUCTS_SEARCH_NAME = add("products.search_name", By.ID, "SearchProductName")
+PRODUCTS_SEARCH_BUTTON = add("products.search_button", By.ID, "search-products")
+PRODUCTS_ROWS = add("products.rows", By.CSS_SELECTOR, "#products-grid > tbody > tr")
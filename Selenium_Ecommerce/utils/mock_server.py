@@ -0,0 +1,661 @@
+"""
+Local stand-in for the nopCommerce admin demo.
+
+Serves the login form, Dashboard and the Customers / Orders / Products list
+pages with the element IDs, titles and grid layout the page objects use,
+backed by a small seeded in-memory store. Grids load over fetch() like the
+DataTables grids of the real site.
+
+In-process (what --mock-server does):
+    server = MockNopCommerce().start()
+    Config.set_base_url(server.url)
+
+As a separate process:
+    python -m Selenium_Ecommerce.utils.mock_server --port 8081
+    pytest ... --site-url http://127.0.0.1:8081/
+"""
+import argparse
+import copy
+import html
+import json
+import secrets
+import threading
+import time
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, quote, urlparse
+
+AUTH_COOKIE = ".Nop.Authentication"
+TOKEN_FIELD = "__RequestVerificationToken"
+ADMIN_TITLE = "{} / nopCommerce administration"
+
+# -------------------------------------------------------------------
+# Seed data
+# -------------------------------------------------------------------
+ROLES = ["Administrators", "Forum Moderators", "Guests", "Registered", "Vendors"]
+
+SEED_CUSTOMERS = [
+    {"email": "admin@yourstore.com", "password": "admin", "first_name": "John", "last_name": "Smith",
+     "roles": ["Administrators", "Forum Moderators", "Registered"]},
+    {"email": "steve_gates@nopCommerce.com", "password": "123456", "first_name": "Steve", "last_name": "Gates",
+     "roles": ["Registered"]},
+    {"email": "arthur_holmes@nopCommerce.com", "password": "123456", "first_name": "Arthur", "last_name": "Holmes",
+     "roles": ["Registered"]},
+    {"email": "james_pan@nopCommerce.com", "password": "123456", "first_name": "James", "last_name": "Pan",
+     "roles": ["Registered", "Vendors"]},
+    {"email": "brenda_lindgren@nopCommerce.com", "password": "123456", "first_name": "Brenda",
+     "last_name": "Lindgren", "roles": ["Registered"]},
+    {"email": "victoria_terces@nopCommerce.com", "password": "123456", "first_name": "Victoria",
+     "last_name": "Terces", "roles": ["Registered"]},
+    {"email": "john@example.com", "password": "password123", "first_name": "John", "last_name": "Doe",
+     "roles": ["Registered"]},
+    {"email": "jane@example.com", "password": "password123", "first_name": "Jane", "last_name": "Smith",
+     "roles": ["Registered"]},
+    {"email": "", "password": "", "first_name": "", "last_name": "", "roles": ["Guests"]},
+]
+
+SEED_ORDERS = [
+    {"id": 1, "email": "steve_gates@nopCommerce.com", "last_name": "Gates", "status": "Pending",
+     "payment": "Pending", "shipping": "Not yet shipped", "total": "$1,855.00", "created": "01/15/2026 10:12:44 AM"},
+    {"id": 2, "email": "arthur_holmes@nopCommerce.com", "last_name": "Holmes", "status": "Processing",
+     "payment": "Paid", "shipping": "Not yet shipped", "total": "$2,460.00", "created": "01/16/2026 02:03:10 PM"},
+    {"id": 3, "email": "james_pan@nopCommerce.com", "last_name": "Pan", "status": "Complete",
+     "payment": "Paid", "shipping": "Delivered", "total": "$43.50", "created": "01/18/2026 09:41:27 AM"},
+    {"id": 4, "email": "brenda_lindgren@nopCommerce.com", "last_name": "Lindgren", "status": "Cancelled",
+     "payment": "Voided", "shipping": "Shipping not required", "total": "$61.00", "created": "01/20/2026 04:55:02 PM"},
+    {"id": 5, "email": "victoria_terces@nopCommerce.com", "last_name": "Terces", "status": "Complete",
+     "payment": "Paid", "shipping": "Delivered", "total": "$1,360.00", "created": "01/22/2026 11:30:19 AM"},
+    {"id": 6, "email": "brenda_lindgren@nopCommerce.com", "last_name": "Lindgren", "status": "Processing",
+     "payment": "Paid", "shipping": "Shipped", "total": "$245.00", "created": "01/25/2026 08:15:36 AM"},
+]
+
+SEED_PRODUCTS = [
+    ("Build your own computer", "COMP_CUST", "$1,200.00", 10000),
+    ("Digital Storm VANQUISH 3 Custom Performance PC", "DS_VA3_PC", "$1,259.00", 10000),
+    ("Lenovo IdeaCentre 600 All-in-One PC", "LE_IC_600", "$500.00", 10000),
+    ("Apple MacBook Pro 13-inch", "AP_MBP_13", "$1,800.00", 10000),
+    ("Asus N551JK-XO076H Laptop", "AS_551_LP", "$1,500.00", 10000),
+    ("HP Spectre XT Pro UltraBook", "HP_SPX_UB", "$1,350.00", 10000),
+    ("Nike Floral Roshe Customized Running Shoes", "NK_FRC_RS", "$40.00", 10000),
+    ("Nike SB Zoom Stefan Janoski \"Medium Mint\"", "NK_ZSJ_MM", "$30.00", 10000),
+    ("Nike Tailwind Loose Short-Sleeve Running Shirt", "NK_TLS_RS", "$15.00", 10000),
+    ("adidas Consortium Campus 80s Running Shoes", "AD_C80_RS", "$27.56", 10000),
+    ("HTC One M8 Android L 5.0 Lollipop", "M8_HTC_5L", "$245.00", 10000),
+    ("Apple iCam", "APPLE_CAM", "$1,300.00", 10000),
+]
+
+
+class MockStore:
+    """Seeded customers, orders and products plus login sessions; thread-safe."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.customers = [dict(c, id=i, active=bool(c["email"]))
+                              for i, c in enumerate(copy.deepcopy(SEED_CUSTOMERS), start=1)]
+            self.orders = copy.deepcopy(SEED_ORDERS)
+            self.products = [{"id": i, "name": n, "sku": s, "price": p, "stock": q, "published": True}
+                             for i, (n, s, p, q) in enumerate(SEED_PRODUCTS, start=1)]
+            self.sessions = {}
+            self.flash = {}
+
+    # -------------------------------------------------------------------
+    # Auth
+    # -------------------------------------------------------------------
+    def authenticate(self, email, password):
+        """Return (token, None) or (None, error message) like the real login form."""
+        with self._lock:
+            customer = next((c for c in self.customers
+                             if c["email"] and c["email"].lower() == email.lower()), None)
+            if customer is None:
+                return None, "No customer account found"
+            if customer["password"] != password:
+                return None, "The credentials provided are incorrect"
+            token = secrets.token_hex(16)
+            self.sessions[token] = customer["id"]
+            return token, None
+
+    def user_for(self, token):
+        with self._lock:
+            customer_id = self.sessions.get(token)
+            return next((c for c in self.customers if c["id"] == customer_id), None)
+
+    def logout(self, token):
+        with self._lock:
+            self.sessions.pop(token, None)
+            self.flash.pop(token, None)
+
+    def push_flash(self, token, message):
+        with self._lock:
+            self.flash[token] = message
+
+    def pop_flash(self, token):
+        with self._lock:
+            return self.flash.pop(token, None)
+
+    # -------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------
+    def search_customers(self, email="", first_name="", last_name="", roles=()):
+        with self._lock:
+            return [c for c in self.customers
+                    if _matches(c["email"], email) and _matches(c["first_name"], first_name)
+                    and _matches(c["last_name"], last_name)
+                    and (not roles or set(roles) & set(c["roles"]))]
+
+    def add_customer(self, email, password, first_name, last_name):
+        """Add a registered customer; returns an error message if the email is taken."""
+        with self._lock:
+            if any(c["email"].lower() == email.lower() for c in self.customers if c["email"]):
+                return "Email is already registered"
+            self.customers.append({"id": len(self.customers) + 1, "email": email, "password": password,
+                                   "first_name": first_name, "last_name": last_name,
+                                   "roles": ["Registered"], "active": True})
+            return None
+
+    def search_orders(self, email="", last_name=""):
+        with self._lock:
+            return [o for o in self.orders if _matches(o["email"], email) and _matches(o["last_name"], last_name)]
+
+    def order(self, order_id):
+        with self._lock:
+            return next((o for o in self.orders if str(o["id"]) == str(order_id).strip()), None)
+
+    def search_products(self, name=""):
+        with self._lock:
+            return [p for p in self.products if _matches(p["name"], name)]
+
+
+def _matches(value, needle):
+    return not needle or needle.strip().lower() in (value or "").lower()
+
+
+# -------------------------------------------------------------------
+# Pages
+# -------------------------------------------------------------------
+esc = html.escape
+
+SIDEBAR = [
+    ("Catalog", [("Products", "/Admin/Product/List"), ("Categories", "/Admin/Category/List"),
+                 ("Manufacturers", "/Admin/Manufacturer/List")]),
+    ("Sales", [("Orders", "/Admin/Order/List")]),
+    ("Customers", [("Customers", "/Admin/Customer/List")]),
+]
+
+# Treeview toggling and fetch()-driven grids, standing in for AdminLTE and DataTables
+ADMIN_JS = """
+document.querySelectorAll('.nav-sidebar a.nav-link[href="#"]').forEach(function (link) {
+    link.addEventListener('click', function (event) {
+        event.preventDefault();
+        var tree = link.nextElementSibling;
+        tree.style.display = tree.style.display === 'none' ? 'block' : 'none';
+    });
+});
+
+function loadGrid(gridId, url, form) {
+    var processing = document.getElementById(gridId + '_processing');
+    var columns = document.querySelectorAll('#' + gridId + ' thead th').length;
+    processing.style.display = 'block';
+    return fetch(url, {method: 'POST', body: new URLSearchParams(new FormData(form))})
+        .then(function (response) { return response.json(); })
+        .then(function (data) {
+            var body = document.querySelector('#' + gridId + ' tbody');
+            body.innerHTML = data.rows.length ? data.rows.map(function (cells) {
+                return '<tr>' + cells.map(function (cell) { return '<td>' + cell + '</td>'; }).join('') + '</tr>';
+            }).join('') : '<tr class="odd"><td colspan="' + columns + '" class="dataTables_empty">No data available in table</td></tr>';
+            processing.style.display = 'none';
+            document.getElementById(gridId).dispatchEvent(new Event('draw'));  // like DataTables' draw.dt
+        });
+}
+
+function bindGrid(gridId, url, formId, buttonId) {
+    var form = document.getElementById(formId);
+    document.getElementById(buttonId).addEventListener('click', function (event) {
+        event.preventDefault();
+        loadGrid(gridId, url, form);
+    });
+    loadGrid(gridId, url, form);
+}
+"""
+
+# Just enough of Select2's multi-select markup and behaviour for the role filter
+SELECT2_JS = """
+(function () {
+    var select = document.getElementById('SelectedCustomerRoleIds');
+    var container = document.querySelector('.select2-selection--multiple');
+    var input = container.querySelector('input.select2-search__field');
+    var dropdown = document.querySelector('.select2-dropdown');
+    var options = dropdown.querySelectorAll('li.select2-results__option');
+
+    container.addEventListener('click', function () { dropdown.style.display = 'block'; input.focus(); });
+    input.addEventListener('input', function () {
+        var needle = input.value.toLowerCase();
+        options.forEach(function (li) {
+            li.style.display = li.textContent.toLowerCase().indexOf(needle) === -1 ? 'none' : 'block';
+        });
+    });
+    options.forEach(function (li) {
+        li.addEventListener('click', function (event) {
+            event.stopPropagation();
+            var option = select.querySelector('option[value="' + li.textContent + '"]');
+            if (!option.selected) {
+                option.selected = true;
+                var choice = document.createElement('li');
+                choice.className = 'select2-selection__choice';
+                choice.textContent = li.textContent;
+                input.parentNode.parentNode.insertBefore(choice, input.parentNode);
+            }
+            input.value = '';
+            dropdown.style.display = 'none';
+        });
+    });
+})();
+"""
+
+
+def page(title, body, scripts=""):
+    return f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{esc(title)}</title>
+<style>
+  body {{ font-family: sans-serif; margin: 0; }}
+  .main-sidebar {{ float: left; width: 220px; }}
+  .content-wrapper {{ margin-left: 230px; padding: 10px; }}
+  #ajaxBusy, .dataTables_processing {{ display: none; }}
+  .select2-dropdown {{ border: 1px solid #aaa; }}
+</style></head>
+<body>{body}<script>{scripts}</script></body></html>"""
+
+
+def admin_page(title, header, content, user, scripts=""):
+    menus = []
+    for label, items in SIDEBAR:
+        links = "".join(f'<li class="nav-item"><a href="{href}" class="nav-link"><p>{esc(text)}</p></a></li>'
+                        for text, href in items)
+        menus.append(f'<li class="nav-item has-treeview"><a href="#" class="nav-link"><p>{esc(label)}</p></a>'
+                     f'<ul class="nav nav-treeview" style="display: none">{links}</ul></li>')
+    body = f"""
+<div class="wrapper">
+  <nav class="main-header navbar">
+    <ul class="navbar-nav">
+      <li class="nav-item"><a href="#" class="nav-link">Hello, {esc(user["first_name"])} {esc(user["last_name"])}</a></li>
+      <li class="nav-item"><a href="/logout" class="nav-link">Logout</a></li>
+    </ul>
+  </nav>
+  <aside class="main-sidebar">
+    <ul class="nav nav-pills nav-sidebar flex-column">
+      <li class="nav-item"><a href="/Admin" class="nav-link"><p>Dashboard</p></a></li>
+      {"".join(menus)}
+    </ul>
+  </aside>
+  <div class="content-wrapper">
+    <div class="content-header"><h1 class="float-left">{esc(header)}</h1></div>
+    <section class="content">{content}</section>
+  </div>
+</div>
+<div id="ajaxBusy"><span>&nbsp;</span></div>"""
+    return page(ADMIN_TITLE.format(title), body, ADMIN_JS + scripts)
+
+
+def grid(grid_id, headers):
+    head = "".join(f"<th>{esc(h)}</th>" for h in headers)
+    return (f'<div id="{grid_id}_processing" class="dataTables_processing">Processing...</div>'
+            f'<table id="{grid_id}" class="table table-bordered table-hover"><thead><tr>{head}</tr></thead>'
+            f'<tbody></tbody></table>')
+
+
+def token_input(token):
+    """Hidden anti-forgery field, as rendered into every nopCommerce form."""
+    return f'<input name="{TOKEN_FIELD}" type="hidden" value="{esc(token)}">'
+
+
+def login_page(return_url, token, email="", email_error="", server_error=""):
+    summary = ""
+    if server_error:
+        summary = ('<div class="message-error validation-summary-errors">Login was unsuccessful. '
+                   f'Please correct the errors and try again.<ul><li>{esc(server_error)}</li></ul></div>')
+    error = f'<span id="Email-error" class="field-validation-error">{esc(email_error)}</span>' if email_error else ""
+    body = f"""
+<div class="page login-page">
+  <div class="page-title"><h1>Welcome, please sign in!</h1></div>
+  <form method="post" action="/login?ReturnUrl={quote(return_url, safe='')}">
+    {summary}
+    <div class="inputs"><label for="Email">Email:</label>
+      <input class="email" type="email" id="Email" name="Email" value="{esc(email)}">{error}</div>
+    <div class="inputs"><label for="Password">Password:</label>
+      <input class="password" type="password" id="Password" name="Password"></div>
+    <div class="inputs reversed"><input type="checkbox" id="RememberMe" name="RememberMe" value="true">
+      <label for="RememberMe">Remember me?</label></div>
+    <div class="buttons"><button type="submit" class="button-1 login-button">Log in</button></div>
+    {token_input(token)}
+  </form>
+</div>"""
+    return page("nopCommerce demo store. Login", body)
+
+
+def dashboard_page(user):
+    content = """
+<div class="row">
+  <div class="small-box bg-info"><div class="inner"><h3>6</h3><p>Orders</p></div>
+    <a href="/Admin/Order/List" class="small-box-footer">More info</a></div>
+  <div class="small-box bg-warning"><div class="inner"><h3>9</h3><p>Registered customers</p></div>
+    <a href="/Admin/Customer/List" class="small-box-footer">More info</a></div>
+</div>"""
+    return admin_page("Dashboard", "Dashboard", content, user)
+
+
+def customers_page(user, flash=None):
+    alert = f'<div class="alert alert-success alert-dismissable">{esc(flash)}</div>' if flash else ""
+    role_options = "".join(f'<option value="{esc(r)}">{esc(r)}</option>' for r in ROLES)
+    role_items = "".join(f'<li class="select2-results__option" role="option">{esc(r)}</li>' for r in ROLES)
+    content = f"""
+{alert}
+<form id="customers-search" method="post">
+  <div class="float-right"><a href="/Admin/Customer/Create" class="btn btn-primary">Add new</a></div>
+  <input type="email" id="SearchEmail" name="SearchEmail">
+  <input type="text" id="SearchFirstName" name="SearchFirstName">
+  <input type="text" id="SearchLastName" name="SearchLastName">
+  <select id="SelectedCustomerRoleIds" name="SelectedCustomerRoleIds" multiple style="display: none">{role_options}</select>
+  <span class="select2 select2-container"><span class="selection">
+    <span class="select2-selection select2-selection--multiple" tabindex="-1">
+      <ul class="select2-selection__rendered">
+        <li class="select2-search select2-search--inline"><input class="select2-search__field" type="search"></li>
+      </ul>
+    </span>
+  </span></span>
+  <span class="select2-dropdown" style="display: none"><ul class="select2-results__options">{role_items}</ul></span>
+  <button type="button" id="search-customers" class="btn btn-primary btn-search">Search</button>
+</form>
+{grid("customers-grid", ["", "Email", "Name", "Customer roles", "Company name", "Active", "Edit"])}"""
+    scripts = SELECT2_JS + "bindGrid('customers-grid', '/Admin/Customer/CustomerList', 'customers-search', 'search-customers');"
+    return admin_page("Customers", "Customers", content, user, scripts)
+
+
+def customer_create_page(user, token, values=None, error=None):
+    values = values or {}
+    summary = f'<div class="validation-summary-errors"><ul><li>{esc(error)}</li></ul></div>' if error else ""
+    fields = "".join(
+        f'<div class="form-group"><label for="{name}">{label}</label>'
+        f'<input type="{kind}" id="{name}" name="{name}" value="{esc(values.get(name, "")) if kind != "password" else ""}"></div>'
+        for name, label, kind in (("Email", "Email", "email"), ("Password", "Password", "password"),
+                                  ("FirstName", "First name", "text"), ("LastName", "Last name", "text")))
+    content = f"""
+<form method="post" action="/Admin/Customer/Create">
+  {summary}
+  {fields}
+  <button type="submit" name="save" class="btn btn-primary">Save</button>
+  {token_input(token)}
+</form>"""
+    return admin_page("Add a new customer", "Add a new customer", content, user)
+
+
+def orders_page(user, error=None):
+    message = f'<div class="alert alert-danger alert-dismissable">{esc(error)}</div>' if error else ""
+    content = f"""
+{message}
+<form id="orders-search" method="post" action="/Admin/Order/List">
+  <div class="input-group">
+    <input type="text" id="GoDirectlyToCustomOrderNumber" name="GoDirectlyToCustomOrderNumber">
+    <button type="submit" id="go-to-order-by-number" name="go-to-order-by-number" class="btn btn-info">Go</button>
+  </div>
+  <input type="email" id="BillingEmail" name="BillingEmail">
+  <input type="text" id="BillingLastName" name="BillingLastName">
+  <button type="button" id="search-orders" class="btn btn-primary btn-search">Search</button>
+</form>
+{grid("orders-grid", ["", "Order #", "Order status", "Payment status", "Shipping status", "Customer", "Store",
+                      "Created on", "Order total", "View"])}"""
+    return admin_page("Orders", "Orders", content, user,
+                      "bindGrid('orders-grid', '/Admin/Order/OrderList', 'orders-search', 'search-orders');")
+
+
+def order_page(user, order):
+    content = f"""
+<div class="form-group row">
+  <div class="col-md-3"><label>Order status</label></div>
+  <div class="col-md-9"><div class="input-group-text align-items-start"><div class="font-weight-bold">{esc(order["status"])}</div></div></div>
+</div>
+<div class="form-group row"><div class="col-md-3"><label>Customer</label></div><div class="col-md-9">{esc(order["email"])}</div></div>
+<div class="form-group row"><div class="col-md-3"><label>Order total</label></div><div class="col-md-9">{esc(order["total"])}</div></div>"""
+    title = f"Edit order details - {order['id']}"
+    return admin_page(title, title, content, user)
+
+
+def products_page(user):
+    content = f"""
+<form id="products-search" method="post">
+  <input type="text" id="SearchProductName" name="SearchProductName">
+  <button type="button" id="search-products" class="btn btn-primary btn-search">Search</button>
+</form>
+{grid("products-grid", ["", "Picture", "Product name", "SKU", "Price", "Stock quantity", "Published", "Edit"])}"""
+    return admin_page("Products", "Products", content, user,
+                      "bindGrid('products-grid', '/Admin/Product/ProductList', 'products-search', 'search-products');")
+
+
+def simple_list_page(user, title):
+    return admin_page(title, title, f"<p>No {esc(title.lower())} in the mock store.</p>", user)
+
+
+# -------------------------------------------------------------------
+# HTTP
+# -------------------------------------------------------------------
+class MockRequestHandler(BaseHTTPRequestHandler):
+    """Routes requests to the pages above; self.server.mock is the MockNopCommerce."""
+
+    protocol_version = "HTTP/1.1"
+
+    # --- plumbing ---
+    def log_message(self, format, *args):
+        pass
+
+    @property
+    def store(self):
+        return self.server.mock.store
+
+    def _token(self):
+        cookie = SimpleCookie(self.headers.get("Cookie", ""))
+        return cookie[AUTH_COOKIE].value if AUTH_COOKIE in cookie else None
+
+    def _form(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        return parse_qs(self.rfile.read(length).decode("utf-8"), keep_blank_values=True)
+
+    def _valid_token(self, form):
+        """Form posts must carry the anti-forgery token of the page they came from."""
+        token = form.get(TOKEN_FIELD, "")
+        return (token[0] if isinstance(token, list) else token) == self.server.mock.antiforgery
+
+    def _send(self, status, body=b"", content_type="text/html; charset=utf-8", headers=()):
+        if self.server.mock.latency:
+            time.sleep(self.server.mock.latency)
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _redirect(self, location, headers=()):
+        self._send(302, headers=[("Location", location), *headers])
+
+    def _json(self, rows):
+        self._send(200, json.dumps({"rows": rows}), "application/json")
+
+    # --- routing ---
+    def do_GET(self):
+        self._route("GET")
+
+    def do_HEAD(self):
+        self._route("GET")
+
+    def do_POST(self):
+        self._route("POST")
+
+    def _route(self, method):
+        url = urlparse(self.path)
+        path = url.path.rstrip("/").lower() or "/"
+        query = parse_qs(url.query)
+
+        if path == "/favicon.ico":
+            return self._send(200, b"", "image/x-icon")
+        if path == "/":
+            return self._redirect("/login?ReturnUrl=%2Fadmin%2F")
+        if path == "/login":
+            return self._login(method, query.get("ReturnUrl", ["/admin/"])[0])
+        if path == "/logout":
+            self.store.logout(self._token())
+            return self._redirect("/login", [("Set-Cookie", f"{AUTH_COOKIE}=; Path=/; Max-Age=0")])
+        if not path.startswith("/admin"):
+            return self._send(404, page("Page not found", "<h1>Page not found</h1>"))
+
+        user = self.store.user_for(self._token())
+        if user is None:
+            return self._redirect("/login?ReturnUrl=" + quote(url.path, safe=""))
+        return self._admin(method, path, user)
+
+    def _login(self, method, return_url):
+        token = self.server.mock.antiforgery
+        if method == "GET":
+            return self._send(200, login_page(return_url, token))
+
+        form = self._form()
+        if not self._valid_token(form):
+            return self._send(400, page("Bad Request", "<h1>Bad Request</h1>"))
+        email = form.get("Email", [""])[0].strip()
+        password = form.get("Password", [""])[0]
+        if not email:
+            return self._send(200, login_page(return_url, token, email_error="Please enter your email"))
+
+        session, error = self.store.authenticate(email, password)
+        if error:
+            return self._send(200, login_page(return_url, token, email=email, server_error=error))
+
+        target = return_url if return_url.startswith("/") else "/admin/"
+        self._redirect(target, [("Set-Cookie", f"{AUTH_COOKIE}={session}; Path=/; HttpOnly; SameSite=Lax")])
+
+    def _admin(self, method, path, user):
+        token = self._token()
+
+        if path in ("/admin", "/admin/home/index"):
+            return self._send(200, dashboard_page(user))
+
+        if path == "/admin/customer/list":
+            return self._send(200, customers_page(user, self.store.pop_flash(token)))
+        if path == "/admin/customer/customerlist" and method == "POST":
+            form = self._form()
+            rows = self.store.search_customers(form.get("SearchEmail", [""])[0], form.get("SearchFirstName", [""])[0],
+                                               form.get("SearchLastName", [""])[0],
+                                               form.get("SelectedCustomerRoleIds", []))
+            return self._json([["", esc(c["email"] or "Guest"), esc(f"{c['first_name']} {c['last_name']}".strip()),
+                                esc(", ".join(c["roles"])), "", "true" if c["active"] else "false",
+                                f'<a href="/Admin/Customer/Edit/{c["id"]}">Edit</a>'] for c in rows])
+        if path == "/admin/customer/create":
+            if method == "GET":
+                return self._send(200, customer_create_page(user, self.server.mock.antiforgery))
+            form = {k: v[0] for k, v in self._form().items()}
+            if not self._valid_token(form):
+                return self._send(400, page("Bad Request", "<h1>Bad Request</h1>"))
+            error = self.store.add_customer(form.get("Email", ""), form.get("Password", ""),
+                                            form.get("FirstName", ""), form.get("LastName", ""))
+            if error:
+                return self._send(200, customer_create_page(user, self.server.mock.antiforgery, form, error))
+            self.store.push_flash(token, "The new customer has been added successfully.")
+            return self._redirect("/Admin/Customer/List")
+
+        if path == "/admin/order/list":
+            if method == "POST":
+                order_id = self._form().get("GoDirectlyToCustomOrderNumber", [""])[0]
+                if self.store.order(order_id):
+                    return self._redirect(f"/Admin/Order/Edit/{order_id.strip()}")
+                return self._send(200, orders_page(user, "No order found with the specified id"))
+            return self._send(200, orders_page(user))
+        if path == "/admin/order/orderlist" and method == "POST":
+            form = self._form()
+            rows = self.store.search_orders(form.get("BillingEmail", [""])[0], form.get("BillingLastName", [""])[0])
+            return self._json([["", str(o["id"]), esc(o["status"]), esc(o["payment"]), esc(o["shipping"]), esc(o["email"]),
+                                "Your store name", esc(o["created"]), esc(o["total"]),
+                                f'<a href="/Admin/Order/Edit/{o["id"]}">View</a>'] for o in rows])
+        if path.startswith("/admin/order/edit/"):
+            order = self.store.order(path.rsplit("/", 1)[-1])
+            if order is None:
+                return self._redirect("/Admin/Order/List")
+            return self._send(200, order_page(user, order))
+
+        if path == "/admin/product/list":
+            return self._send(200, products_page(user))
+        if path == "/admin/product/productlist" and method == "POST":
+            rows = self.store.search_products(self._form().get("SearchProductName", [""])[0])
+            return self._json([["", "", esc(p["name"]), esc(p["sku"]), esc(p["price"]), str(p["stock"]),
+                                "true" if p["published"] else "false",
+                                f'<a href="/Admin/Product/Edit/{p["id"]}">Edit</a>'] for p in rows])
+
+        if path == "/admin/category/list":
+            return self._send(200, simple_list_page(user, "Categories"))
+        if path == "/admin/manufacturer/list":
+            return self._send(200, simple_list_page(user, "Manufacturers"))
+
+        return self._send(404, admin_page("Page not found", "Page not found", "", user))
+
+
+class MockNopCommerce:
+    """
+    The mock admin site on a background thread. port=0 picks a free port, so
+    every pytest process (one per xdist worker) can run its own copy.
+    latency adds a fixed delay to every response to imitate a remote server.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, latency=0.0):
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.antiforgery = secrets.token_hex(16)
+        self.store = MockStore()
+        self._httpd = None
+        self._thread = None
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}/"
+
+    def start(self):
+        self._httpd = ThreadingHTTPServer((self.host, self.port), MockRequestHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.mock = self
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="mock-nopcommerce", daemon=True)
+        self._thread.start()
+        print(f" Mock nopCommerce admin running at {self.url}")
+        return self
+
+    def stop(self):
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def serve_forever(self):
+        """Run in the foreground (subprocess mode) until interrupted."""
+        self.start()
+        try:
+            self._thread.join()
+        except KeyboardInterrupt:
+            self.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local mock of the nopCommerce admin demo")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+    args = parser.parse_args(argv)
+    MockNopCommerce(args.host, args.port, args.latency).serve_forever()
+
+
+if __name__ == "__main__":
+    main()
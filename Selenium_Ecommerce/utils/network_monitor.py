@@ -0,0 +1,229 @@
+import collections
+import fnmatch
+import json
+import os
+import weakref
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import WebDriverException
+
+
+def _new_usage():
+    return {"requests": 0, "bytes": 0, "blocked_requests": 0, "bytes_saved": 0, "blocked_unknown_size": 0}
+
+
+def _asset_key(url):
+    return url.split("#", 1)[0].split("?", 1)[0]
+
+
+class NetworkMonitor:
+    """
+    Follows a local Chrome session's traffic through the DevTools (CDP)
+    Network events in the performance log: which XHR / fetch / document
+    requests are in flight, how many bytes were transferred and which
+    requests were blocked by Network.setBlockedURLs.
+
+    Each poll() is one get_log round trip returning every event since the
+    previous poll.
+    """
+
+    TRACKED_TYPES = ("XHR", "Fetch", "Document")
+
+    def __init__(self, driver, blocked_patterns=()):
+        self.driver = driver
+        self.blocked_patterns = list(blocked_patterns)
+        self.in_flight = {}   # requestId -> resource type, for TRACKED_TYPES
+        self.completed = 0    # tracked requests finished (or failed) since launch
+        self.completed_paths = collections.Counter()  # the same, per lower-cased URL path
+        self._urls = {}       # requestId -> url, for every request still open
+        self._handlers = {
+            "Network.requestWillBeSent": self._on_request,
+            "Network.loadingFinished": self._on_finished,
+            "Network.loadingFailed": self._on_failed,
+        }
+
+    @classmethod
+    def attach(cls, driver, blocked_patterns=()):
+        """Enable CDP network tracking (and blocking) on a local Chrome driver; other drivers are returned as is."""
+        if not hasattr(driver, "execute_cdp_cmd") or not hasattr(driver, "get_log"):
+            return driver
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            if blocked_patterns:
+                driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(blocked_patterns)})
+        except WebDriverException as e:
+            print(f" CDP network tracking unavailable: {e.msg}")
+            return driver
+        driver.network = cls(driver, blocked_patterns)
+        network_usage.register(driver.network)
+        return driver
+
+    @staticmethod
+    def for_driver(driver):
+        """The driver's NetworkMonitor, or None when CDP tracking is off."""
+        return getattr(driver, "network", None)
+
+    # -------------------------------------------------------------------
+    # Events
+    # -------------------------------------------------------------------
+    def poll(self):
+        try:
+            entries = self.driver.get_log("performance")
+        except WebDriverException:
+            return  # browser is navigating or gone; the events stay buffered
+        for entry in entries:
+            message = json.loads(entry["message"])["message"]
+            handler = self._handlers.get(message.get("method"))
+            if handler:
+                handler(message.get("params", {}))
+
+    def _on_request(self, params):
+        request_id = params["requestId"]
+        if request_id not in self._urls:  # redirects reuse the request id
+            network_usage.current["requests"] += 1
+        self._urls[request_id] = params.get("request", {}).get("url", "")
+        if params.get("type") in self.TRACKED_TYPES:
+            self.in_flight[request_id] = params["type"]
+
+    def _on_finished(self, params):
+        url = self._urls.pop(params["requestId"], "")
+        size = int(params.get("encodedDataLength", 0))
+        network_usage.current["bytes"] += size
+        if url and self.is_blockable(url):
+            network_usage.asset_sizes[_asset_key(url)] = size
+        self._settle(params["requestId"], url)
+
+    def _on_failed(self, params):
+        url = self._urls.pop(params["requestId"], "")
+        if params.get("blockedReason"):
+            network_usage.current["blocked_requests"] += 1
+            size = network_usage.asset_sizes.get(_asset_key(url))
+            if size is None:
+                network_usage.current["blocked_unknown_size"] += 1
+            else:
+                network_usage.current["bytes_saved"] += size
+        self._settle(params["requestId"], url)
+
+    def _settle(self, request_id, url):
+        if self.in_flight.pop(request_id, None):
+            self.completed += 1
+            self.completed_paths[urlsplit(url).path.lower()] += 1
+
+    # -------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------
+    def is_blockable(self, url):
+        patterns = self.blocked_patterns or network_usage.blockable_patterns
+        return any(fnmatch.fnmatchcase(url, pattern) for pattern in patterns)
+
+    def completed_for(self, path):
+        """Tracked requests to this URL path (e.g. a grid's list endpoint) finished since launch."""
+        return self.completed_paths[path.lower()] if path else 0
+
+    def busy(self, types=None):
+        """Poll, then True while any tracked request (optionally only of these types) is in flight."""
+        self.poll()
+        if types is None:
+            return bool(self.in_flight)
+        return any(t in types for t in self.in_flight.values())
+
+
+class NetworkUsage:
+    """
+    Per-test network totals across every monitored browser of this process,
+    plus the learned transfer size of blockable assets (saved between runs)
+    so blocked requests can be reported as bytes saved.
+    """
+
+    def __init__(self):
+        self.output_dir = os.path.join(os.getcwd(), "Selenium_Ecommerce", "Output", "network")
+        self.blockable_patterns = []
+        self.current = _new_usage()
+        self.asset_sizes = {}
+        self.results = {}
+        self._monitors = weakref.WeakSet()
+        self._loaded = False
+
+    @property
+    def sizes_path(self):
+        return os.path.join(self.output_dir, "asset-sizes.json")
+
+    def configure(self, blockable_patterns=()):
+        self.blockable_patterns = list(blockable_patterns)
+
+    def register(self, monitor):
+        if not self._loaded:
+            self._loaded = True
+            self.asset_sizes.update(self._read_sizes())
+        self._monitors.add(monitor)
+
+    # -------------------------------------------------------------------
+    # Per-test bookkeeping
+    # -------------------------------------------------------------------
+    def start_test(self):
+        for monitor in list(self._monitors):
+            monitor.poll()  # book earlier traffic on the previous test
+        self.current = _new_usage()
+
+    def end_test(self):
+        """This test's totals, or None when no monitored browser made a request."""
+        for monitor in list(self._monitors):
+            monitor.poll()
+        usage, self.current = self.current, _new_usage()
+        return usage if usage["requests"] or usage["blocked_requests"] else None
+
+    @staticmethod
+    def describe(usage):
+        text = f"{usage['requests']} requests, {usage['bytes'] / 1024:.0f} KB"
+        if usage["blocked_requests"]:
+            text += (f"; blocked {usage['blocked_requests']} requests, "
+                     f"{usage['bytes_saved'] / 1024:.0f} KB saved")
+            if usage["blocked_unknown_size"]:
+                text += f" (+{usage['blocked_unknown_size']} of unknown size)"
+        return text
+
+    # -------------------------------------------------------------------
+    # Run summary (fed from test reports, so it covers every xdist worker)
+    # -------------------------------------------------------------------
+    def collect(self, report):
+        for name, value in report.user_properties:
+            if name == "network":
+                self.results[report.nodeid] = value
+
+    def format_summary(self, top=10):
+        totals = _new_usage()
+        for usage in self.results.values():
+            for key in totals:
+                totals[key] += usage[key]
+        lines = [f"{len(self.results)} tests: {self.describe(totals)}"]
+        ranked = sorted(self.results.items(), key=lambda item: item[1]["bytes_saved"], reverse=True)
+        for nodeid, usage in ranked[:top]:
+            if usage["blocked_requests"]:
+                lines.append(f"  {usage['bytes_saved'] / 1024:8.0f} KB saved  "
+                             f"{usage['blocked_requests']:4d} blocked  {nodeid}")
+        return "\n".join(lines)
+
+    def save_sizes(self):
+        if not self.asset_sizes:
+            return
+        os.makedirs(self.output_dir, exist_ok=True)
+        # Merge with what other workers learned in the meantime
+        sizes = self._read_sizes()
+        sizes.update(self.asset_sizes)
+        # Replace atomically: other workers read the file while their browsers start
+        tmp_path = f"{self.sizes_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(sizes, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.sizes_path)
+
+    def _read_sizes(self):
+        """Learned asset sizes, or {} when there are none yet or the file is unreadable."""
+        try:
+            with open(self.sizes_path, encoding="utf-8") as f:
+                sizes = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return sizes if isinstance(sizes, dict) else {}
+
+
+network_usage = NetworkUsage()
@@ -0,0 +1,199 @@
+import glob
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+
+# Actions that move the browser to another page (reported as "page transitions")
+TRANSITION_ACTIONS = {"driver.get", "wait_until_ready"}
+
+
+def describe_locator(locator):
+    """Turn a registry Locator, (By, value) tuple, URL or label into a short printable key."""
+    if getattr(locator, "name", None):
+        return locator.name
+    if isinstance(locator, tuple) and len(locator) == 2:
+        return f"{locator[0]}={locator[1]}"
+    if locator is None:
+        return "-"
+    return str(locator)
+
+
+class SeleniumProfiler:
+    """
+    Records wall time, wait time, retries and JS-click fallbacks for every
+    Selenium interaction made through BaseModule and driver.get().
+
+    Each pytest process (one per xdist worker) appends one JSON line per
+    interaction to Output/profiling/profile-<worker>.jsonl.
+    """
+
+    def __init__(self):
+        self.enabled = True
+        self.output_dir = os.path.join(os.getcwd(), "Selenium_Ecommerce", "Output", "profiling")
+        self.current_test = None
+        self._test_events = []
+        self._file = None
+        self._lock = threading.Lock()
+
+    @property
+    def worker(self):
+        return os.getenv("PYTEST_XDIST_WORKER", "master")
+
+    @property
+    def jsonl_path(self):
+        return os.path.join(self.output_dir, f"profile-{self.worker}.jsonl")
+
+    def configure(self, output_dir=None, enabled=True):
+        self.enabled = enabled
+        if output_dir:
+            self.output_dir = output_dir
+
+    # -------------------------------------------------------------------
+    # Per-test bookkeeping
+    # -------------------------------------------------------------------
+    def start_test(self, nodeid):
+        with self._lock:
+            self.current_test = nodeid
+            self._test_events = []
+
+    def end_test(self):
+        """Return the events recorded for the current test and reset the buffer."""
+        with self._lock:
+            events, self._test_events = self._test_events, []
+            return events
+
+    # -------------------------------------------------------------------
+    # Recording
+    # -------------------------------------------------------------------
+    @contextmanager
+    def record(self, action, locator=None):
+        """
+        Time the enclosed block. The yielded dict can be updated with
+        'wait' (seconds spent in explicit waits), 'retries' and 'js_fallback'.
+        """
+        event = {"action": action, "locator": describe_locator(locator),
+                 "wait": 0.0, "retries": 0, "js_fallback": False, "ok": True}
+        start = time.perf_counter()
+        try:
+            yield event
+        except Exception:
+            event["ok"] = False
+            raise
+        finally:
+            event["duration"] = round(time.perf_counter() - start, 4)
+            event["wait"] = round(event["wait"], 4)
+            self._emit(event)
+
+    def instrument_driver(self, driver):
+        """Wrap driver.get so page loads are recorded too."""
+        original_get = driver.get
+
+        def get(url):
+            with self.record("driver.get", url):
+                return original_get(url)
+
+        driver.get = get
+        return driver
+
+    def _emit(self, event):
+        if not self.enabled:
+            return
+        event["test"] = self.current_test
+        event["worker"] = self.worker
+        event["ts"] = round(time.time(), 3)
+        with self._lock:
+            self._test_events.append(event)
+            if self._file is None:
+                os.makedirs(self.output_dir, exist_ok=True)
+                self._file = open(self.jsonl_path, "a", encoding="utf-8")
+            self._file.write(json.dumps(event) + "\n")
+            self._file.flush()
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def clean(self):
+        """Remove profile files from a previous run (controller process only)."""
+        for path in glob.glob(os.path.join(self.output_dir, "profile-*.jsonl")):
+            os.remove(path)
+
+    # -------------------------------------------------------------------
+    # Summary
+    # -------------------------------------------------------------------
+    def summary(self, paths=None, top=10):
+        """
+        Aggregate one or more JSONL files (default: this worker's file) into
+        slowest locators, slowest page transitions and JS-fallback rates.
+        """
+        paths = paths if paths is not None else [self.jsonl_path]
+        stats = defaultdict(lambda: {"count": 0, "total": 0.0, "max": 0.0, "wait": 0.0,
+                                     "retries": 0, "fallbacks": 0, "failures": 0})
+
+        for path in paths:
+            if not os.path.exists(path):
+                continue
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    event = json.loads(line)
+                    s = stats[(event["action"], event["locator"])]
+                    s["count"] += 1
+                    s["total"] += event["duration"]
+                    s["max"] = max(s["max"], event["duration"])
+                    s["wait"] += event["wait"]
+                    s["retries"] += event["retries"]
+                    s["fallbacks"] += int(event["js_fallback"])
+                    s["failures"] += int(not event["ok"])
+
+        rows = []
+        for (action, locator), s in stats.items():
+            rows.append(dict(action=action, locator=locator, avg=round(s["total"] / s["count"], 4),
+                             total=round(s["total"], 4), max=round(s["max"], 4), wait=round(s["wait"], 4),
+                             count=s["count"], retries=s["retries"], fallbacks=s["fallbacks"],
+                             failures=s["failures"]))
+
+        interactions = [r for r in rows if r["action"] not in TRANSITION_ACTIONS]
+        transitions = [r for r in rows if r["action"] in TRANSITION_ACTIONS]
+        fallback_rates = [dict(action=r["action"], locator=r["locator"], count=r["count"],
+                               rate=round(r["fallbacks"] / r["count"], 3))
+                          for r in interactions if r["fallbacks"]]
+
+        return {
+            "events": sum(r["count"] for r in rows),
+            "total_time": round(sum(r["total"] for r in rows), 3),
+            "slowest_locators": sorted(interactions, key=lambda r: r["total"], reverse=True)[:top],
+            "slowest_transitions": sorted(transitions, key=lambda r: r["avg"], reverse=True)[:top],
+            "fallback_rates": sorted(fallback_rates, key=lambda r: r["rate"], reverse=True)[:top],
+        }
+
+    def summary_for_all_workers(self, top=10):
+        return self.summary(glob.glob(os.path.join(self.output_dir, "profile-*.jsonl")), top)
+
+    @staticmethod
+    def format_summary(summary):
+        lines = [f"Selenium profile: {summary['events']} interactions, {summary['total_time']:.1f}s total"]
+
+        lines.append("Slowest locators (total s / avg s / waited s / calls):")
+        for r in summary["slowest_locators"]:
+            lines.append(f"  {r['total']:8.2f} {r['avg']:7.2f} {r['wait']:8.2f} {r['count']:5d}  "
+                         f"{r['action']} {r['locator']}")
+
+        lines.append("Slowest page transitions (avg s / max s / count):")
+        for r in summary["slowest_transitions"]:
+            lines.append(f"  {r['avg']:7.2f} {r['max']:7.2f} {r['count']:5d}  {r['action']} {r['locator']}")
+
+        if summary["fallback_rates"]:
+            lines.append("JS-click fallback rates:")
+            for r in summary["fallback_rates"]:
+                lines.append(f"  {r['rate']:6.1%} of {r['count']:4d}  {r['action']} {r['locator']}")
+        return "\n".join(lines)
+
+
+# One profiler per pytest process
+profiler = SeleniumProfiler()
@@ -1,16 +1,29 @@
 import openpyxl
 
-def read_keywords(file_path):
-    workbook = openpyxl.load_workbook(file_path)
-    sheet = workbook.active
+
+def read_keyword_sheets(file_path):
+    """Read every sheet of a keyword workbook: {sheet title: steps}."""
+    workbook = openpyxl.load_workbook(file_path, read_only=True)
+    try:
+        return {sheet.title: _read_steps(sheet) for sheet in workbook.worksheets}
+    finally:
+        workbook.close()
+
+
+def _read_steps(sheet):
+    """Stream rows 2..n (columns Step, Keyword, LocatorType, LocatorValue, TestData)."""
     steps = []
 
-    for row in range(2, sheet.max_row + 1):
+    for row in sheet.iter_rows(min_row=2, max_col=5, values_only=True):
+        row = tuple(row) + (None,) * (5 - len(row))
+        if not any(row):
+            continue
         steps.append({
-            "Keyword": sheet.cell(row, 2).value,
-            "LocatorType": sheet.cell(row, 3).value,
-            "LocatorValue": sheet.cell(row, 4).value,
-            "TestData": sheet.cell(row, 5).value
+            "Step": row[0],
+            "Keyword": row[1],
+            "LocatorType": row[2],
+            "LocatorValue": row[3],
+            "TestData": row[4]
         })
 
     return steps
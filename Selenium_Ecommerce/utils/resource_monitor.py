@@ -0,0 +1,242 @@
+import glob
+import json
+import os
+import threading
+import time
+
+try:
+    import psutil
+except ImportError:  # only needed for --resource-aware
+    psutil = None
+
+from Selenium_Ecommerce.utils.config import Config
+
+MB = 1024 * 1024
+
+
+class ResourceMonitor:
+    """
+    Samples the RSS and CPU of every local browser's process tree (browser,
+    renderer, GPU and utility processes) on a background thread, and writes
+    a timeline to Output/resources/resources-<worker>.jsonl.
+
+    The same samples drive the memory limits of --resource-aware runs:
+    browsers over the memory budget are recycled by the driver pool, and
+    new browsers are only launched while enough system memory is free.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.output_dir = os.path.join(os.getcwd(), "Selenium_Ecommerce", "Output", "resources")
+        self.interval = Config.RESOURCE_SAMPLE_SECONDS
+        self.budget_mb = Config.BROWSER_MEMORY_BUDGET_MB
+        self.current_test = None
+        self._browsers = {}
+        self._file = None
+        self._thread = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def worker(self):
+        return os.getenv("PYTEST_XDIST_WORKER", "master")
+
+    @property
+    def jsonl_path(self):
+        return os.path.join(self.output_dir, f"resources-{self.worker}.jsonl")
+
+    def configure(self, enabled=True, budget_mb=None, interval=None, output_dir=None):
+        if enabled and psutil is None:
+            raise RuntimeError("--resource-aware needs psutil (pip install psutil)")
+        self.enabled = enabled
+        self.budget_mb = budget_mb or self.budget_mb
+        self.interval = interval or self.interval
+        self.output_dir = output_dir or self.output_dir
+
+    # -------------------------------------------------------------------
+    # Memory headroom
+    # -------------------------------------------------------------------
+    @staticmethod
+    def available_mb():
+        return psutil.virtual_memory().available / MB
+
+    def has_headroom(self):
+        """True when one more browser fits next to the memory reserve."""
+        if not self.enabled:
+            return True
+        return self.available_mb() >= Config.BROWSER_MEMORY_ESTIMATE_MB + Config.MEMORY_RESERVE_MB
+
+    def wait_for_headroom(self, timeout=60):
+        """Hold a browser launch until memory frees up (other workers recycling); launch anyway after timeout."""
+        deadline = time.monotonic() + timeout
+        while not self.has_headroom():
+            if time.monotonic() > deadline:
+                print(f" Only {self.available_mb():.0f} MB free after {timeout}s — launching anyway.")
+                return False
+            time.sleep(1)
+        return True
+
+    def auto_workers(self, cpu_workers, spares=0):
+        """Cap xdist's -n auto so every worker's browsers (one plus spares) fit in free memory."""
+        if psutil is None:
+            return cpu_workers  # pytest_configure reports the missing dependency
+        per_worker = Config.BROWSER_MEMORY_ESTIMATE_MB * (1 + spares)
+        fits = int((self.available_mb() - Config.MEMORY_RESERVE_MB) // per_worker)
+        workers = max(1, min(cpu_workers, fits))
+        print(f" Resource-aware -n auto: {workers} worker(s) "
+              f"({cpu_workers} by CPU, {max(fits, 0)} by {self.available_mb():.0f} MB free memory)")
+        return workers
+
+    # -------------------------------------------------------------------
+    # Browsers
+    # -------------------------------------------------------------------
+    def track(self, driver, browser):
+        """Follow a local browser's process tree; drivers without one (Grid) are ignored."""
+        if not self.enabled:
+            return
+        try:
+            root = self._browser_root(driver)
+        except (psutil.Error, AttributeError):
+            root = None
+        if root is None:
+            return
+        with self._lock:
+            self._browsers[id(driver)] = {"label": f"{browser}-{root.pid}", "root": root,
+                                          "processes": {}, "rss_mb": 0.0}
+        self.start()
+
+    def untrack(self, driver):
+        with self._lock:
+            self._browsers.pop(id(driver), None)
+
+    def browser_rss_mb(self, driver):
+        """RSS of the browser's process tree at the last sample (0 when not tracked)."""
+        browser = self._browsers.get(id(driver))
+        return browser["rss_mb"] if browser else 0.0
+
+    def over_budget(self, driver):
+        return self.enabled and self.browser_rss_mb(driver) > self.budget_mb
+
+    @staticmethod
+    def _browser_root(driver):
+        capabilities = driver.capabilities
+        if capabilities.get("moz:processID"):
+            return psutil.Process(capabilities["moz:processID"])
+
+        # Chrome / Edge: the driver's child started with this session's profile directory
+        user_data_dir = (capabilities.get("chrome") or capabilities.get("msedge") or {}).get("userDataDir")
+        service_process = getattr(getattr(driver, "service", None), "process", None)
+        if not user_data_dir or service_process is None:
+            return None
+        for child in psutil.Process(service_process.pid).children():
+            try:
+                if f"--user-data-dir={user_data_dir}" in child.cmdline():
+                    return child
+            except psutil.Error:
+                continue
+        return None
+
+    # -------------------------------------------------------------------
+    # Sampling
+    # -------------------------------------------------------------------
+    def start_test(self, nodeid):
+        self.current_test = nodeid
+
+    def start(self):
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="resource-monitor", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def sample(self):
+        rows = []
+        with self._lock:
+            browsers = list(self._browsers.items())
+        for key, browser in browsers:
+            try:
+                processes = [browser["root"]] + browser["root"].children(recursive=True)
+            except psutil.Error:
+                self._browsers.pop(key, None)  # browser quit or crashed
+                continue
+            # Keep the Process objects: cpu_percent() measures since the previous call on the same object
+            known = browser["processes"]
+            browser["processes"] = {p.pid: known.get(p.pid, p) for p in processes}
+            rss = cpu = 0.0
+            for process in browser["processes"].values():
+                try:
+                    rss += process.memory_info().rss
+                    cpu += process.cpu_percent(None)
+                except psutil.Error:
+                    pass
+            browser["rss_mb"] = rss / MB
+            rows.append({"browser": browser["label"], "rss_mb": round(rss / MB, 1),
+                         "cpu": round(cpu, 1), "processes": len(processes)})
+
+        if not rows:
+            return
+        self._emit({"ts": round(time.time(), 3), "worker": self.worker, "test": self.current_test,
+                    "browsers": rows,
+                    "rss_mb": round(sum(r["rss_mb"] for r in rows), 1),
+                    "cpu": round(sum(r["cpu"] for r in rows), 1),
+                    "available_mb": round(self.available_mb(), 1)})
+
+    def _emit(self, event):
+        if self._file is None:
+            os.makedirs(self.output_dir, exist_ok=True)
+            self._file = open(self.jsonl_path, "a", encoding="utf-8")
+        self._file.write(json.dumps(event) + "\n")
+        self._file.flush()
+
+    def close(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def clean(self):
+        """Remove timelines from a previous run (called once, by the controller)."""
+        for path in glob.glob(os.path.join(self.output_dir, "resources-*.jsonl")):
+            os.remove(path)
+
+    # -------------------------------------------------------------------
+    # Summary
+    # -------------------------------------------------------------------
+    def summary_for_all_workers(self):
+        """Peak memory / CPU per worker from every timeline file."""
+        workers = {}
+        for path in sorted(glob.glob(os.path.join(self.output_dir, "resources-*.jsonl"))):
+            with open(path, encoding="utf-8") as f:
+                events = [json.loads(line) for line in f if line.strip()]
+            if not events:
+                continue
+            peak = max(events, key=lambda e: e["rss_mb"])
+            workers[events[0]["worker"]] = {
+                "samples": len(events),
+                "peak_rss_mb": peak["rss_mb"],
+                "peak_test": peak["test"],
+                "peak_browser_mb": max(b["rss_mb"] for e in events for b in e["browsers"]),
+                "peak_cpu": max(e["cpu"] for e in events),
+                "min_available_mb": min(e["available_mb"] for e in events),
+            }
+        return workers
+
+    def format_summary(self, workers):
+        lines = [f"  {'worker':<8} {'samples':>7} {'peak MB':>8} {'browser MB':>10} {'peak CPU%':>9} "
+                 f"{'min free MB':>11}  peak during"]
+        for name, w in workers.items():
+            lines.append(f"  {name:<8} {w['samples']:7d} {w['peak_rss_mb']:8.0f} {w['peak_browser_mb']:10.0f} "
+                         f"{w['peak_cpu']:9.0f} {w['min_available_mb']:11.0f}  {w['peak_test'] or '-'}")
+        total = sum(w["peak_rss_mb"] for w in workers.values())
+        lines.append(f"Browsers need up to ~{total:.0f} MB across {len(workers)} worker(s) "
+                     f"(sum of worker peaks); timelines in {self.output_dir}")
+        return "\n".join(lines)
+
+
+resources = ResourceMonitor()
@@ -0,0 +1,189 @@
+# Checkpoint / resume for long runs. Every finished test is appended to a JSON-lines journal
+# (Output/journal/run-journal.jsonl) as soon as its teardown is reported; after an interruption
+#   pytest Selenium_Ecommerce/tests <same options> --resume
+# runs only the tests that failed or never finished, keeping the passed tests' Allure results.
+# A run without --resume starts a new journal, but never over one whose last session did not finish.
+
+import glob
+import json
+import os
+import shutil
+import time
+
+import pytest
+
+JOURNAL_DIR = os.path.join(os.getcwd(), "Selenium_Ecommerce", "Output", "journal")
+
+
+class RunJournal:
+    """
+    Append-only journal of one run (and its resumptions): a "start" or
+    "resume" line per pytest session, one line per finished test and a
+    "finish" line if the session ended normally. Each line is flushed and
+    fsynced, so a crashed run leaves every completed test on disk.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = None
+
+    def read(self):
+        """{"sessions": [start/resume/finish lines], "tests": {test id: last entry}}"""
+        sessions, tests = [], {}
+        if not os.path.exists(self.path):
+            return {"sessions": sessions, "tests": tests}
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # the line being written when the run died
+                if "nodeid" in entry:
+                    tests[entry["nodeid"]] = entry
+                else:
+                    sessions.append(entry)
+        return {"sessions": sessions, "tests": tests}
+
+    def open(self, fresh):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._file = open(self.path, "w" if fresh else "a", encoding="utf-8")
+
+    def write(self, entry):
+        self._file.write(json.dumps(entry) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class RunJournalPlugin:
+    """
+    Journals every test outcome on the controller and, with --resume,
+    deselects the tests the journal already has as passed. Their Allure
+    results stay in --alluredir (or are copied over when the resumed run
+    writes elsewhere), so the final report covers the whole run.
+    """
+
+    RESUME_SKIPS = ("passed",)
+
+    def __init__(self, config):
+        self.config = config
+        self.resume = config.getoption("--resume")
+        self.journal = RunJournal(self.journal_path(config))
+        self.outcomes = {}
+        self.done = set()
+        # A --collect-only run must not replace the journal of the run it previews
+        self.recording = not hasattr(config, "workerinput") and not config.option.collectonly
+        workerinput = getattr(config, "workerinput", None)
+        if workerinput is not None:
+            self.done = set(workerinput.get("resume_done", ()))
+            return
+
+        alluredir = getattr(config.option, "allure_report_dir", None)
+        if self.resume:
+            if getattr(config.option, "clean_alluredir", False):
+                raise pytest.UsageError("--resume keeps the passed tests' results in --alluredir: "
+                                        "drop --clean-alluredir")
+            previous = self.journal.read()
+            self.done = {nodeid for nodeid, entry in previous["tests"].items()
+                         if entry["outcome"] in self.RESUME_SKIPS}
+            if not previous["sessions"]:
+                print(f" Resume: no journal at {self.journal.path}, running everything")
+            if self.recording:
+                self._carry_over_allure(previous["sessions"], alluredir)
+        if not self.recording:
+            return
+        if not self.resume and self.interrupted(self.journal.read()["sessions"]):
+            raise pytest.UsageError(f"{self.journal.path} holds a run that did not finish: continue it with "
+                                    "--resume, or start over with another --journal (or delete the file)")
+        self.journal.open(fresh=not self.resume)
+        self.journal.write({"event": "resume" if self.resume else "start", "time": time.time(),
+                            "args": list(config.invocation_params.args),
+                            "alluredir": os.path.abspath(alluredir) if alluredir else None})
+
+    @staticmethod
+    def journal_path(config):
+        if config.getoption("--journal"):
+            return config.getoption("--journal")
+        output_dir = config.getoption("--output-dir")
+        journal_dir = os.path.join(output_dir, "journal") if output_dir else JOURNAL_DIR
+        # Lanes run side by side, so each keeps its own journal
+        lane = config.getoption("--lane")
+        return os.path.join(journal_dir, "run-journal.jsonl" if lane == "all" else f"run-journal-{lane}.jsonl")
+
+    @staticmethod
+    def interrupted(sessions):
+        """True when the journal's last session has no "finish" line (it died or is still running)."""
+        return bool(sessions) and sessions[-1].get("event") != "finish"
+
+    @staticmethod
+    def _carry_over_allure(sessions, alluredir):
+        """Copy the earlier sessions' Allure results when this one writes to a different folder."""
+        if not alluredir:
+            return
+        target = os.path.abspath(alluredir)
+        for source in {s.get("alluredir") for s in sessions} - {None, target}:
+            os.makedirs(target, exist_ok=True)
+            copied = 0
+            for path in glob.glob(os.path.join(source, "*")):
+                destination = os.path.join(target, os.path.basename(path))
+                if os.path.isfile(path) and not os.path.exists(destination):
+                    shutil.copy2(path, destination)
+                    copied += 1
+            print(f" Resume: reused {copied} Allure result file(s) from {source}")
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_configure_node(self, node):
+        node.workerinput["resume_done"] = sorted(self.done)
+
+    def pytest_collection_modifyitems(self, config, items):
+        if not self.done:
+            return
+        selected = [item for item in items if item.nodeid not in self.done]
+        deselected = [item for item in items if item.nodeid in self.done]
+        print(f" Resume: {len(deselected)} test(s) already passed, running the other {len(selected)}")
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = selected
+
+    # ------------------------------------------------------------------
+    #  Journal
+    # ------------------------------------------------------------------
+    def pytest_runtest_logreport(self, report):
+        # Controller (or plain run) only: it sees the reports of every worker
+        if not self.recording:
+            return
+        if report.outcome == "rerun":
+            outcome = None  # pytest-rerunfailures is about to run the test again
+        elif report.failed:
+            outcome = "failed" if report.when == "call" else "error"
+        elif report.skipped:
+            outcome = "xfailed" if hasattr(report, "wasxfail") else "skipped"
+        else:
+            outcome = "passed" if report.when == "call" else None
+        entry = self.outcomes.setdefault(report.nodeid, {"outcome": None, "duration": 0.0})
+        entry["duration"] += report.duration
+        if outcome and entry["outcome"] not in ("failed", "error"):
+            entry["outcome"] = outcome
+        if report.outcome == "rerun":
+            entry["rerun"] = True
+
+        # The teardown of an attempt that is rerun is not the test's last report
+        if report.when == "teardown" and not entry.pop("rerun", False):
+            del self.outcomes[report.nodeid]
+            self.journal.write({"nodeid": report.nodeid, "outcome": entry["outcome"] or "error",
+                                "duration": round(entry["duration"], 3),
+                                "worker": getattr(report, "worker_id", "master"), "time": time.time()})
+
+    def pytest_sessionfinish(self, session):
+        if hasattr(self.config, "workerinput"):
+            return
+        if self.recording:
+            self.journal.write({"event": "finish", "time": time.time(), "exitstatus": int(session.exitstatus)})
+            self.journal.close()
+        if self.done and session.exitstatus == pytest.ExitCode.NO_TESTS_COLLECTED:
+            print(" Resume: every test had already passed")
+            session.exitstatus = pytest.ExitCode.OK
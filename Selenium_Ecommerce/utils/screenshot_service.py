@@ -0,0 +1,178 @@
+import base64
+import hashlib
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import allure
+
+
+class ScreenshotService:
+    """
+    Screenshot pipeline used by BaseModule.take_screenshot.
+
+    Only the base64 grab from the driver happens on the test thread; decoding
+    and disk writes run on a small background thread pool. Allure attachments
+    are made from memory, and a capture identical to the previous one from the
+    same browser is not written again.
+
+    Modes:
+        all      - write every capture (default)
+        failures - keep captures in memory and write them only if the test fails
+        off      - do not capture at all
+    """
+
+    MODES = ("all", "failures", "off")
+
+    def __init__(self, max_workers=2):
+        self.mode = "all"
+        self.root_dir = os.path.join(os.getcwd(), "Selenium_Ecommerce", "Output", "screenshots")
+        self.captured = 0
+        self.duplicates = 0
+        self._max_workers = max_workers
+        self._executor = None
+        self._cleaned_folders = set()
+        self._last_hash = {}
+        self._pending = []
+        self._written = set()
+        self._futures = []  # (future, what it does) of background writes / deletes not yet checked
+        self.failed_writes = []
+        self._lock = threading.RLock()
+
+    def configure(self, mode="all", root_dir=None):
+        if mode not in self.MODES:
+            raise ValueError(f"Unsupported screenshot mode: {mode}")
+        self.mode = mode
+        if root_dir:
+            self.root_dir = root_dir
+
+    # -------------------------------------------------------------------
+    # Capture
+    # -------------------------------------------------------------------
+    def capture(self, driver, folder_name="general", name_prefix="screenshot", attach_name=None):
+        """
+        Grab a screenshot and return the path it is (or will be) written to.
+        attach_name attaches the PNG to the current Allure test from memory.
+        """
+        if self.mode == "off":
+            return None
+
+        screenshot_dir = self._folder(folder_name)
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        file_path = os.path.join(screenshot_dir, f"{name_prefix}_{timestamp}.png")
+
+        png_b64 = driver.get_screenshot_as_base64()
+        digest = hashlib.sha1(png_b64.encode("ascii")).hexdigest()
+        self.captured += 1
+
+        with self._lock:
+            previous = self._last_hash.get(id(driver))
+            is_duplicate = previous is not None and previous[0] == digest
+            if is_duplicate:
+                # Nothing changed on screen since the last capture: reuse that file
+                self.duplicates += 1
+                file_path = previous[1]
+            else:
+                self._last_hash[id(driver)] = (digest, file_path)
+
+        if self.mode == "failures":
+            with self._lock:
+                self._pending.append((file_path, png_b64, not is_duplicate, attach_name))
+            return file_path
+
+        if is_duplicate:
+            print(f" Screenshot unchanged — reusing: {file_path}")
+        else:
+            self._save(file_path, png_b64)
+        if attach_name:
+            self._attach(png_b64, attach_name)
+        return file_path
+
+    # -------------------------------------------------------------------
+    # Per-test handling for "failures" mode
+    # -------------------------------------------------------------------
+    def start_test(self):
+        with self._lock:
+            self._pending = []
+
+    def end_test(self, failed):
+        """Write (and attach) the buffered captures of a failed test; drop them otherwise."""
+        self._report_failures(wait=False)
+        with self._lock:
+            pending, self._pending = self._pending, []
+        if not failed:
+            return
+        for file_path, png_b64, write, attach_name in pending:
+            # A duplicate may point at a capture that was dropped with a passing test
+            if write or file_path not in self._written:
+                self._save(file_path, png_b64)
+            if attach_name:
+                self._attach(png_b64, attach_name)
+
+    def shutdown(self):
+        """Wait for all pending writes to reach the disk and report the ones that failed."""
+        self._report_failures(wait=True)
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _report_failures(self, wait):
+        """Print the errors of finished background jobs (all of them when wait is set)."""
+        with self._lock:
+            futures = self._futures if wait else [f for f in self._futures if f[0].done()]
+            self._futures = [f for f in self._futures if f not in futures]
+        for future, description in futures:
+            error = future.exception()
+            if error is not None:
+                self.failed_writes.append((description, error))
+                print(f" Screenshot service could not {description}: {error}")
+
+    # -------------------------------------------------------------------
+    # Helpers
+    # -------------------------------------------------------------------
+    def _folder(self, folder_name):
+        """
+        Return the screenshot folder, cleaning it once per run.
+        The old folder is renamed away and deleted in the background.
+        """
+        screenshot_dir = os.path.join(self.root_dir, folder_name)
+        with self._lock:
+            if folder_name not in self._cleaned_folders:
+                self._cleaned_folders.add(folder_name)
+                if os.path.exists(screenshot_dir):
+                    print(f" Cleaning old screenshots in: {screenshot_dir}")
+                    trash_dir = f"{screenshot_dir}.old-{os.getpid()}-{time.time_ns()}"
+                    os.rename(screenshot_dir, trash_dir)
+                    self._submit(f"delete {trash_dir}", shutil.rmtree, trash_dir)
+                os.makedirs(screenshot_dir, exist_ok=True)
+        return screenshot_dir
+
+    def _save(self, file_path, png_b64):
+        with self._lock:
+            self._written.add(file_path)
+        self._submit(f"save {file_path}", self._write, file_path, png_b64)
+        print(f" Screenshot saving in the background: {file_path}")
+
+    def _submit(self, description, fn, *args):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self._max_workers,
+                                                    thread_name_prefix="screenshot")
+            future = self._executor.submit(fn, *args)
+            self._futures.append((future, description))
+            return future
+
+    @staticmethod
+    def _write(file_path, png_b64):
+        with open(file_path, "wb") as f:
+            f.write(base64.b64decode(png_b64))
+
+    @staticmethod
+    def _attach(png_b64, attach_name):
+        allure.attach(base64.b64decode(png_b64), name=attach_name, attachment_type=allure.attachment_type.PNG)
+
+
+# One screenshot service per pytest process
+screenshots = ScreenshotService()